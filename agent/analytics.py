@@ -9,6 +9,7 @@ Provides velocity-based predictions and analytics:
 
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional, Tuple
+from sqlalchemy import func
 from agent.tasks import TaskManager
 from agent.planner import BusinessPlanner
 from agent.models import Task, Goal
@@ -126,10 +127,10 @@ class VelocityPredictor:
             return {"error": "Goal has no target date"}
 
         # Get remaining tasks
-        remaining_tasks = self.task_mgr.session.query(Task).filter(
+        remaining_tasks = self.task_mgr.session.query(func.count(Task.id)).filter(
             Task.parent_goal_id == goal_id,
             Task.status.in_(['pending', 'in_progress'])
-        ).count()
+        ).scalar()
 
         if remaining_tasks == 0:
             return {
@@ -192,11 +193,11 @@ class VelocityPredictor:
             window_start = window_end - timedelta(days=window_size)
 
             # Get tasks completed in this window
-            completed_tasks = self.task_mgr.session.query(Task).filter(
+            completed_tasks = self.task_mgr.session.query(func.count(Task.id)).filter(
                 Task.status == 'completed',
                 Task.completed_at >= window_start,
                 Task.completed_at < window_end
-            ).count()
+            ).scalar()
 
             velocity = completed_tasks / window_size
             trend_data.append((window_end.date(), velocity))
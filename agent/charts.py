@@ -8,10 +8,12 @@ Provides beautiful terminal-based visualizations:
 - Productivity heatmaps
 """
 
+from bisect import bisect_left
 from datetime import datetime, timedelta
 from typing import Dict, List, Optional
 from collections import defaultdict
 import plotext as plt
+from sqlalchemy import case, func
 from agent.tasks import TaskManager
 from agent.planner import BusinessPlanner
 from agent.models import Task, Goal
@@ -46,16 +48,22 @@ class ChartGenerator:
         velocities = []
         window_size = 7
 
+        # Fetch every completion timestamp in the range once, then count each
+        # window with a binary search instead of issuing one query per window
+        completed_at = sorted(
+            ts for (ts,) in self.task_mgr.session.query(Task.completed_at).filter(
+                Task.status == 'completed',
+                Task.completed_at >= start_date,
+                Task.completed_at < end_date
+            )
+        )
+
         for i in range(days - window_size + 1):
             window_end = start_date + timedelta(days=i + window_size)
             window_start = window_end - timedelta(days=window_size)
 
-            # Get tasks completed in this window
-            completed_tasks = self.task_mgr.session.query(Task).filter(
-                Task.status == 'completed',
-                Task.completed_at >= window_start,
-                Task.completed_at < window_end
-            ).count()
+            # Count tasks completed in this window
+            completed_tasks = bisect_left(completed_at, window_end) - bisect_left(completed_at, window_start)
 
             velocity = completed_tasks / window_size
             date_labels.append(window_end.strftime('%m/%d'))
@@ -130,22 +138,20 @@ class ChartGenerator:
         """
         start_date = datetime.now() - timedelta(days=days)
 
-        # Get completed tasks in time period
-        completed_tasks = self.task_mgr.session.query(Task).filter(
+        # Count completed tasks per category in the database
+        rows = self.task_mgr.session.query(Task.category, func.count(Task.id)).filter(
             Task.status == 'completed',
             Task.completed_at >= start_date
-        ).all()
+        ).group_by(Task.category).all()
 
-        if not completed_tasks:
+        if not rows:
             plt.clear_figure()
             plt.text("No completed tasks in this period", 0, 0)
             return plt.build()
 
-        # Count by category
         category_counts = defaultdict(int)
-        for task in completed_tasks:
-            category = task.category or "Uncategorized"
-            category_counts[category] += 1
+        for category, count in rows:
+            category_counts[category or "Uncategorized"] += count
 
         categories = list(category_counts.keys())
         counts = list(category_counts.values())
@@ -338,21 +344,19 @@ class ChartGenerator:
         """
         now = datetime.now()
 
-        # Current period
         current_start = now - timedelta(days=days)
-        current_tasks = self.task_mgr.session.query(Task).filter(
-            Task.status == 'completed',
-            Task.completed_at >= current_start
-        ).count()
-
-        # Previous period
         previous_start = now - timedelta(days=days * 2)
-        previous_end = current_start
-        previous_tasks = self.task_mgr.session.query(Task).filter(
+
+        # Count both periods in a single pass over the combined range
+        current_tasks, previous_tasks = self.task_mgr.session.query(
+            func.sum(case((Task.completed_at >= current_start, 1), else_=0)),
+            func.sum(case((Task.completed_at < current_start, 1), else_=0))
+        ).filter(
             Task.status == 'completed',
-            Task.completed_at >= previous_start,
-            Task.completed_at < previous_end
-        ).count()
+            Task.completed_at >= previous_start
+        ).one()
+        current_tasks = current_tasks or 0
+        previous_tasks = previous_tasks or 0
 
         periods = [f"Previous\n{days} days", f"Current\n{days} days"]
         counts = [previous_tasks, current_tasks]
@@ -0,0 +1,85 @@
+"""Terminal chart commands (``bizy chart ...``)"""
+
+import click
+from agent.cli_common import console
+
+@click.group()
+def chart():
+    """Generate terminal charts and visualizations"""
+    pass
+
+@chart.command()
+@click.option('--days', '-d', type=int, default=30, help='Number of days to analyze')
+def velocity(days):
+    """Show velocity trend chart"""
+    from agent.charts import ChartGenerator
+
+    chart_gen = ChartGenerator()
+    chart_output = chart_gen.velocity_chart(days=days)
+    console.print(chart_output)
+    chart_gen.close()
+
+@chart.command()
+def goals():
+    """Show goal progress chart"""
+    from agent.charts import ChartGenerator
+
+    chart_gen = ChartGenerator()
+    chart_output = chart_gen.goal_progress_chart()
+    console.print(chart_output)
+    chart_gen.close()
+
+@chart.command()
+@click.option('--days', '-d', type=int, default=30, help='Number of days to analyze')
+def categories(days):
+    """Show task distribution by category"""
+    from agent.charts import ChartGenerator
+
+    chart_gen = ChartGenerator()
+    chart_output = chart_gen.category_distribution(days=days)
+    console.print(chart_output)
+    chart_gen.close()
+
+@chart.command()
+@click.argument('goal_id', type=int)
+def burndown(goal_id):
+    """Show burndown chart for a goal"""
+    from agent.charts import ChartGenerator
+
+    chart_gen = ChartGenerator()
+    chart_output = chart_gen.burndown_chart(goal_id)
+    console.print(chart_output)
+    chart_gen.close()
+
+@chart.command()
+@click.option('--days', '-d', type=int, default=30, help='Number of days to analyze')
+def productivity(days):
+    """Show productivity heatmap by day of week"""
+    from agent.charts import ChartGenerator
+
+    chart_gen = ChartGenerator()
+    chart_output = chart_gen.productivity_heatmap(days=days)
+    console.print(chart_output)
+    chart_gen.close()
+
+@chart.command()
+@click.option('--days', '-d', type=int, default=30, help='Number of days to analyze')
+def priorities(days):
+    """Show task breakdown by priority"""
+    from agent.charts import ChartGenerator
+
+    chart_gen = ChartGenerator()
+    chart_output = chart_gen.priority_breakdown(days=days)
+    console.print(chart_output)
+    chart_gen.close()
+
+@chart.command()
+@click.option('--days', '-d', type=int, default=7, help='Number of days per period')
+def comparison(days):
+    """Compare current vs previous period"""
+    from agent.charts import ChartGenerator
+
+    chart_gen = ChartGenerator()
+    chart_output = chart_gen.comparison_chart(days=days)
+    console.print(chart_output)
+    chart_gen.close()
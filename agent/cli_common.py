@@ -0,0 +1,46 @@
+"""Shared console and table helpers for the ``bizy`` command modules"""
+
+from rich.console import Console
+from rich.table import Table
+
+console = Console()
+
+# Column specs for the tables printed by list-style commands. Kept as plain data
+# so each command builds a fresh Table (Rich stores row cells on the Column
+# objects, so a shared/copied Table template would leak rows between renders).
+TASK_TABLE_COLUMNS = (
+    ("ID", {"style": "dim"}),
+    ("Status", {"justify": "center"}),
+    ("Priority", {"justify": "center"}),
+    ("Title", {}),
+    ("Category", {"style": "cyan"}),
+    ("Due Date", {"style": "dim"}),
+)
+
+GOAL_TABLE_COLUMNS = (
+    ("ID", {"style": "dim"}),
+    ("Title", {}),
+    ("Horizon", {"style": "cyan"}),
+    ("Progress", {"justify": "right"}),
+)
+
+GOAL_PICKER_COLUMNS = (
+    ("ID", {"style": "dim", "width": 6}),
+    ("Goal", {}),
+    ("Progress", {"justify": "right", "width": 15}),
+)
+
+PROJECT_TABLE_COLUMNS = (
+    ("Project Name", {"style": "bold"}),
+    ("Tasks", {"justify": "right"}),
+    ("Goals", {"justify": "right"}),
+    ("Progress", {"justify": "center"}),
+)
+
+
+def build_table(columns, title=None):
+    """Build a Rich table with the standard header style from a column spec"""
+    table = Table(title=title, show_header=True, header_style="bold cyan")
+    for header, options in columns:
+        table.add_column(header, **options)
+    return table
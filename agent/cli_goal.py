@@ -0,0 +1,137 @@
+"""Goal management commands (``bizy goal ...``)"""
+
+import click
+from datetime import datetime
+from agent.planner import BusinessPlanner
+from agent.cli_common import console, build_table, GOAL_TABLE_COLUMNS
+from agent.utils import format_progress_bar
+
+@click.group()
+def goal():
+    """Manage goals"""
+    pass
+
+@goal.command()
+@click.argument('title')
+@click.option('--description', '-d', help='Goal description')
+@click.option('--horizon', '-h', type=click.Choice(['weekly', 'monthly', 'quarterly', 'yearly']), default='monthly')
+@click.option('--target', '-t', help='Target date (YYYY-MM-DD)')
+def add(title, description, horizon, target):
+    """Add a new goal"""
+    planner = BusinessPlanner()
+    target_date = None
+    if target:
+        target_date = datetime.strptime(target, '%Y-%m-%d')
+
+    goal = planner.create_goal(
+        title=title,
+        description=description,
+        horizon=horizon,
+        target_date=target_date
+    )
+    console.print(f"[green]✓[/green] Goal created: {goal.title} (ID: {goal.id})")
+    planner.close()
+
+@goal.command()
+@click.option('--global', 'global_view', is_flag=True, help='Show goals from all projects')
+@click.option('--unassigned', is_flag=True, help='Show only goals without a project assignment')
+def list(global_view, unassigned):
+    """List all active goals"""
+    if global_view or unassigned:
+        planner = BusinessPlanner(project_filter=False)
+    else:
+        planner = BusinessPlanner()
+
+    if unassigned:
+        goals = planner.get_unassigned_goals()
+    else:
+        goals = planner.get_active_goals()
+
+    if not goals:
+        console.print("[yellow]No active goals[/yellow]")
+        planner.close()
+        return
+
+    # Recalculate progress for all goals in one batch
+    planner.calculate_goal_progress_bulk(goal.id for goal in goals)
+
+    # Refresh goals after recalculation (one query; drops newly completed goals)
+    if unassigned:
+        goals = planner.get_unassigned_goals()
+    else:
+        goals = planner.get_active_goals()
+
+    # Build title
+    title_parts = ["🎯 Your Goals"]
+    if unassigned:
+        title_parts.append("[Unassigned]")
+    elif global_view:
+        title_parts.append("[All Projects]")
+    elif planner.context:
+        title_parts.append(f"[Project: {planner.context['project_name']}]")
+
+    table = build_table(GOAL_TABLE_COLUMNS, title=" ".join(title_parts))
+
+    for goal in goals:
+        progress_bar = format_progress_bar(goal.progress_percentage)
+        table.add_row(
+            str(goal.id),
+            goal.title[:40],
+            goal.horizon,
+            f"{progress_bar} {goal.progress_percentage:.0f}%"
+        )
+
+    console.print(table)
+    planner.close()
+
+@goal.command()
+@click.argument('goal_ids', type=int, nargs=-1, required=True)
+@click.option('--fresh', is_flag=True, help='Ask the AI again instead of reusing a stored breakdown')
+def breakdown(goal_ids, fresh):
+    """Break down one or more goals into tasks using AI"""
+    planner = BusinessPlanner()
+    if len(goal_ids) == 1:
+        console.print(f"[cyan]Breaking down goal {goal_ids[0]}...[/cyan]")
+        results = {goal_ids[0]: planner.break_down_goal(goal_ids[0], use_cache=not fresh)}
+    else:
+        # Several goals: their AI requests run concurrently
+        console.print(f"[cyan]Breaking down goals {', '.join(map(str, goal_ids))}...[/cyan]")
+        results = planner.break_down_goals(goal_ids, use_cache=not fresh)
+
+    for goal_id, tasks in results.items():
+        prefix = f"Goal {goal_id}: " if len(results) > 1 else ""
+        if tasks:
+            console.print(f"[green]✓[/green] {prefix}Created {len(tasks)} tasks")
+            for task in tasks:
+                console.print(f"  • {task.title}")
+        else:
+            console.print(f"[red]✗[/red] {prefix}Failed to break down goal")
+    planner.close()
+
+@goal.command()
+@click.argument('goal_id', type=int)
+@click.option('--project', '-p', required=True, help='Project name to assign')
+@click.option('--path', help='Repository path (auto-detected from project list if omitted)')
+def assign(goal_id, project, path):
+    """Assign a goal to a project"""
+    planner = BusinessPlanner(project_filter=False)
+
+    # If path not provided, try to find it from existing tasks/goals with this project
+    if not path:
+        from agent.models import Task, Goal
+        existing = planner.session.query(Task).filter(Task.project_name == project).first()
+        if existing and existing.repository_path:
+            path = existing.repository_path
+        else:
+            existing_goal = planner.session.query(Goal).filter(Goal.project_name == project).first()
+            if existing_goal and existing_goal.repository_path:
+                path = existing_goal.repository_path
+
+    goal = planner.assign_goal_to_project(goal_id, project, path)
+    if goal:
+        console.print(f"[green]✓[/green] Assigned goal '{goal.title}' to project: {project}")
+        if path:
+            console.print(f"[dim]  Path: {path}[/dim]")
+    else:
+        console.print(f"[red]✗[/red] Goal {goal_id} not found")
+    planner.close()
@@ -0,0 +1,127 @@
+"""PDF report commands (``bizy pdf ...``)"""
+
+import click
+from datetime import datetime
+from agent.cli_common import console
+
+@click.group()
+def pdf():
+    """Generate PDF reports"""
+    pass
+
+@pdf.command()
+@click.option('--filename', '-f', help='Custom filename')
+@click.option('--charts/--no-charts', default=False, help='Include charts in report')
+def weekly(filename, charts):
+    """Generate weekly summary PDF report"""
+    from agent.pdf_export import PDFExporter
+
+    exporter = PDFExporter()
+    pdf_path = exporter.export_weekly_report(filename=filename, include_charts=charts)
+
+    console.print(f"[green]✓[/green] Weekly report generated:")
+    console.print(f"  [cyan]{pdf_path}[/cyan]")
+
+    exporter.close()
+
+@pdf.command()
+@click.option('--filename', '-f', help='Custom filename')
+def monthly(filename):
+    """Generate monthly summary PDF report"""
+    from agent.pdf_export import PDFExporter
+
+    exporter = PDFExporter()
+    pdf_path = exporter.export_monthly_report(filename=filename)
+
+    console.print(f"[green]✓[/green] Monthly report generated:")
+    console.print(f"  [cyan]{pdf_path}[/cyan]")
+
+    exporter.close()
+
+@pdf.command()
+@click.argument('goal_id', type=int)
+@click.option('--filename', '-f', help='Custom filename')
+def goal(goal_id, filename):
+    """Generate PDF report for a specific goal"""
+    from agent.pdf_export import PDFExporter
+
+    exporter = PDFExporter()
+    pdf_path = exporter.export_goal_report(goal_id, filename=filename)
+
+    if pdf_path:
+        console.print(f"[green]✓[/green] Goal report generated:")
+        console.print(f"  [cyan]{pdf_path}[/cyan]")
+    else:
+        console.print(f"[red]✗[/red] Goal {goal_id} not found")
+
+    exporter.close()
+
+@pdf.command()
+@click.option('--filename', '-f', help='Custom filename')
+def all_goals(filename):
+    """Generate PDF report for all active goals"""
+    from agent.pdf_export import PDFExporter
+
+    exporter = PDFExporter()
+    pdf_path = exporter.export_all_goals_report(filename=filename)
+
+    console.print(f"[green]✓[/green] All goals report generated:")
+    console.print(f"  [cyan]{pdf_path}[/cyan]")
+
+    exporter.close()
+
+@pdf.command()
+@click.option('--days', '-d', type=int, default=30, help='Number of days to analyze')
+@click.option('--filename', '-f', help='Custom filename')
+def velocity(days, filename):
+    """Generate PDF velocity analysis report"""
+    from agent.pdf_export import PDFExporter
+
+    exporter = PDFExporter()
+    pdf_path = exporter.export_velocity_report(days=days, filename=filename)
+
+    console.print(f"[green]✓[/green] Velocity report generated:")
+    console.print(f"  [cyan]{pdf_path}[/cyan]")
+
+    exporter.close()
+
+@pdf.command()
+@click.option('--days', '-d', type=int, default=30, help='Number of days for the velocity report')
+def batch(days):
+    """Generate the weekly, monthly, all-goals and velocity reports in parallel"""
+    from agent.pdf_export import PDFExporter
+
+    specs = [
+        ('export_weekly_report', {}),
+        ('export_monthly_report', {}),
+        ('export_all_goals_report', {}),
+        ('export_velocity_report', {'days': days}),
+    ]
+    pdf_paths = PDFExporter.export_batch(specs)
+
+    console.print(f"[green]✓[/green] Generated {len(pdf_paths)} reports:")
+    for pdf_path in pdf_paths:
+        console.print(f"  [cyan]{pdf_path}[/cyan]")
+
+@pdf.command()
+@click.argument('start_date')
+@click.argument('end_date')
+@click.option('--filename', '-f', help='Custom filename')
+def daterange(start_date, end_date, filename):
+    """Generate PDF report for custom date range (YYYY-MM-DD format)"""
+    from agent.pdf_export import PDFExporter
+
+    try:
+        start = datetime.strptime(start_date, '%Y-%m-%d')
+        end = datetime.strptime(end_date, '%Y-%m-%d')
+    except ValueError:
+        console.print("[red]✗[/red] Invalid date format. Use YYYY-MM-DD")
+        return
+
+    exporter = PDFExporter()
+    pdf_path = exporter.export_date_range_report(start, end, filename=filename)
+
+    console.print(f"[green]✓[/green] Date range report generated:")
+    console.print(f"  [cyan]{pdf_path}[/cyan]")
+
+    exporter.close()
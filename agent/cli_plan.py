@@ -0,0 +1,39 @@
+"""Business plan commands (``bizy plan ...``)"""
+
+import click
+import os
+import sys
+
+@click.group()
+def plan():
+    """Manage business plan"""
+    pass
+
+@plan.command()
+def show():
+    """Review current business plan and goals"""
+    from agent.plan_manager import review_business_plan
+    review_business_plan()
+
+@plan.command()
+def create():
+    """Create new business plan"""
+    from agent.plan_manager import create_business_plan
+    create_business_plan()
+
+@plan.command()
+def update():
+    """Update existing business plan"""
+    from agent.plan_manager import update_business_plan
+    update_business_plan()
+
+@plan.command()
+@click.argument('file_path', required=False)
+@click.option('--name', '-n', help='Business plan name')
+def load(file_path, name):
+    """Load business plan from YAML file"""
+    # Import and run the standalone script
+    repo_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    sys.path.insert(0, repo_root)
+    from scripts.load_business_plan import load_business_plan
+    load_business_plan(file_path, name)
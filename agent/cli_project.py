@@ -0,0 +1,197 @@
+"""Project/repository context commands (``bizy project ...``)"""
+
+import click
+from rich.panel import Panel
+from agent.tasks import TaskManager
+from agent.planner import BusinessPlanner
+from agent.cli_common import console, build_table, PROJECT_TABLE_COLUMNS
+from agent.utils import format_progress_bar
+
+@click.group()
+def project():
+    """Manage projects and repository contexts"""
+    pass
+
+@project.command()
+def list():
+    """List all projects with task and goal counts"""
+    from agent.models import Task, Goal, get_session
+    from collections import defaultdict
+    from sqlalchemy import case, func
+
+    session = get_session()
+
+    # Get all unique projects from tasks and goals
+    tasks = session.query(Task.project_name).distinct().all()
+    goals = session.query(Goal.project_name).distinct().all()
+
+    projects = set()
+    for (proj,) in tasks:
+        if proj:
+            projects.add(proj)
+    for (proj,) in goals:
+        if proj:
+            projects.add(proj)
+
+    if not projects:
+        console.print("[yellow]No projects found. Run 'bizy migrate' to add project tracking.[/yellow]")
+        return
+
+    # Count tasks and goals per project, one grouped query per table
+    project_stats = defaultdict(lambda: {'tasks': 0, 'goals': 0, 'completed_tasks': 0, 'active_goals': 0})
+
+    for project_name, total, completed in session.query(
+        Task.project_name,
+        func.count(Task.id),
+        func.sum(case((Task.status == 'completed', 1), else_=0))
+    ).filter(Task.project_name.in_(projects)).group_by(Task.project_name):
+        project_stats[project_name]['tasks'] = total
+        project_stats[project_name]['completed_tasks'] = completed or 0
+
+    for project_name, total, active in session.query(
+        Goal.project_name,
+        func.count(Goal.id),
+        func.sum(case((Goal.status == 'active', 1), else_=0))
+    ).filter(Goal.project_name.in_(projects)).group_by(Goal.project_name):
+        project_stats[project_name]['goals'] = total
+        project_stats[project_name]['active_goals'] = active or 0
+
+    # Display projects table
+    table = build_table(PROJECT_TABLE_COLUMNS, title="📁 Projects")
+
+    for project_name in sorted(projects):
+        stats = project_stats[project_name]
+        completion_rate = (stats['completed_tasks'] / stats['tasks'] * 100) if stats['tasks'] > 0 else 0
+        progress_bar = format_progress_bar(completion_rate)
+
+        table.add_row(
+            project_name,
+            f"{stats['tasks']} ({stats['completed_tasks']} done)",
+            f"{stats['goals']} ({stats['active_goals']} active)",
+            f"{progress_bar} {completion_rate:.0f}%"
+        )
+
+    console.print(table)
+
+    # Show current context
+    from agent.utils import get_repository_context
+    context = get_repository_context()
+    console.print(f"\n[dim]Current context: {context['project_name']}[/dim]")
+
+    session.close()
+
+@project.command()
+def current():
+    """Show the current project context"""
+    from agent.utils import get_repository_context
+
+    context = get_repository_context()
+    console.print(Panel.fit(
+        f"[bold cyan]Project:[/bold cyan] {context['project_name']}\n"
+        f"[bold cyan]Path:[/bold cyan] {context['repository_path'] or 'N/A (global context)'}",
+        title="📍 Current Context",
+        border_style="cyan"
+    ))
+
+@project.command('assign-all')
+@click.option('--tasks', 'assign_tasks', is_flag=True, help='Assign tasks')
+@click.option('--goals', 'assign_goals', is_flag=True, help='Assign goals')
+@click.option('--category', '-c', help='Filter by category (tasks only)')
+@click.option('--category-like', help='Filter by category pattern (SQL LIKE, e.g., "phase-3%")')
+@click.option('--horizon', '-h', type=click.Choice(['yearly', 'quarterly', 'monthly']), help='Filter by goal horizon')
+@click.option('--status', '-s', type=click.Choice(['pending', 'completed', 'all']), default='all', help='Filter by status')
+@click.option('--ids', help='Comma-separated IDs to assign')
+@click.option('--dry-run', is_flag=True, help='Preview without making changes')
+@click.option('--project', '-p', help='Target project (default: current repo)')
+def assign_all(assign_tasks, assign_goals, category, category_like, horizon, status, ids, dry_run, project):
+    """Assign unassigned tasks/goals to a project with filters"""
+    from agent.utils import get_repository_context
+    from agent.models import Task, Goal
+
+    # Default to both if neither specified
+    if not assign_tasks and not assign_goals:
+        assign_tasks = True
+        assign_goals = True
+
+    # Get target project
+    if project:
+        target_project = project
+        # Try to find path from existing items
+        task_mgr = TaskManager(project_filter=False)
+        existing = task_mgr.session.query(Task).filter(Task.project_name == project).first()
+        if existing and existing.repository_path:
+            target_path = existing.repository_path
+        else:
+            existing_goal = task_mgr.session.query(Goal).filter(Goal.project_name == project).first()
+            target_path = existing_goal.repository_path if existing_goal else None
+        task_mgr.close()
+    else:
+        context = get_repository_context()
+        target_project = context['project_name']
+        target_path = context['repository_path']
+
+    task_mgr = TaskManager(project_filter=False)
+    planner = BusinessPlanner(project_filter=False)
+
+    assigned_count = 0
+
+    # Handle tasks
+    if assign_tasks:
+        if ids:
+            task_ids = [int(x.strip()) for x in ids.split(',')]
+            tasks_to_assign = [task_mgr.get_task(tid) for tid in task_ids if task_mgr.get_task(tid)]
+            tasks_to_assign = [t for t in tasks_to_assign if t.project_name is None]
+        else:
+            tasks_to_assign = task_mgr.get_unassigned_tasks(
+                category=category,
+                category_like=category_like,
+                status=status if status != 'all' else None
+            )
+
+        if tasks_to_assign:
+            console.print(f"\n[bold cyan]Tasks to assign ({len(tasks_to_assign)}):[/bold cyan]")
+            for task in tasks_to_assign:
+                console.print(f"  • [{task.id}] {task.title[:50]} [dim]({task.category or 'no category'})[/dim]")
+
+            if not dry_run:
+                for task in tasks_to_assign:
+                    task_mgr.assign_to_project(task.id, target_project, target_path)
+                    assigned_count += 1
+        else:
+            console.print("\n[yellow]No unassigned tasks match the filters[/yellow]")
+
+    # Handle goals
+    if assign_goals:
+        if ids and not assign_tasks:  # Only use IDs for goals if tasks flag not set
+            goal_ids = [int(x.strip()) for x in ids.split(',')]
+            goals_to_assign = [planner.get_goal(gid) for gid in goal_ids]
+            goals_to_assign = [g for g in goals_to_assign if g and g.project_name is None]
+        else:
+            goals_to_assign = planner.get_unassigned_goals(
+                horizon=horizon,
+                status=status if status != 'all' else None
+            )
+
+        if goals_to_assign:
+            console.print(f"\n[bold cyan]Goals to assign ({len(goals_to_assign)}):[/bold cyan]")
+            for goal in goals_to_assign:
+                console.print(f"  • [{goal.id}] {goal.title[:50]} [dim]({goal.horizon})[/dim]")
+
+            if not dry_run:
+                for goal in goals_to_assign:
+                    planner.assign_goal_to_project(goal.id, target_project, target_path)
+                    assigned_count += 1
+        else:
+            console.print("\n[yellow]No unassigned goals match the filters[/yellow]")
+
+    # Summary
+    if dry_run:
+        console.print(f"\n[yellow]Dry run - no changes made[/yellow]")
+        console.print(f"[dim]Would assign to project: {target_project}[/dim]")
+    else:
+        console.print(f"\n[green]✓[/green] Assigned {assigned_count} items to project: {target_project}")
+        if target_path:
+            console.print(f"[dim]  Path: {target_path}[/dim]")
+
+    task_mgr.close()
+    planner.close()
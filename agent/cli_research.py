@@ -0,0 +1,89 @@
+"""Research commands (``bizy research ...``)"""
+
+import click
+from rich.panel import Panel
+from rich.markdown import Markdown
+from agent.research import ResearchAgent
+from agent.cli_common import console
+
+@click.group()
+def research():
+    """Conduct research"""
+    pass
+
+@research.command()
+@click.argument('topics', nargs=-1, required=True)
+@click.option('--goal', '-g', help='Business goal')
+@click.option('--fresh', is_flag=True, help='Ignore a stored answer from the last day and ask again')
+@click.option('--batch', is_flag=True, help='Send all topics as one Message Batch (half price, can take minutes)')
+def topic(topics, goal, fresh, batch):
+    """Research one or more topics"""
+    researcher = ResearchAgent()
+    business_goal = goal or "General research"
+    console.print(f"[cyan]Researching: {', '.join(topics)}...[/cyan]\n")
+
+    if len(topics) == 1 and not batch:
+        from agent.core import LiveMarkdownPanel
+
+        # Stream the findings into the panel as they are generated
+        with LiveMarkdownPanel(f"🔍 Research: {topics[0]}", console=console) as panel:
+            result = researcher.research_topic(
+                topic=topics[0],
+                business_goal=business_goal,
+                depth="standard",
+                use_cache=not fresh,
+                on_text=panel.append
+            )
+            panel.set(result.get('findings') or f"**Error:** {result['error']}")
+        if 'research_id' in result:
+            console.print(f"\n[dim]Saved as research ID: {result['research_id']}[/dim]")
+        researcher.close()
+        return
+
+    if batch:
+        try:
+            results = researcher.batch_research(
+                [(topic, business_goal) for topic in topics], use_cache=not fresh
+            )
+        except KeyboardInterrupt:
+            if researcher.last_batch_id:
+                console.print(
+                    f"\n[yellow]Stopped waiting. Batch {researcher.last_batch_id} keeps processing; "
+                    f"collect or cancel it from the Anthropic console.[/yellow]"
+                )
+            researcher.close()
+            return
+    else:
+        # Several topics: their AI requests run concurrently
+        results = researcher.research_topics(topics, business_goal, use_cache=not fresh)
+
+    for topic, result in zip(topics, results):
+        if 'error' in result:
+            console.print(f"[red]✗ Error ({topic}):[/red] {result['error']}")
+        else:
+            console.print(Panel(
+                Markdown(result['findings']),
+                title=f"🔍 Research: {topic}",
+                border_style="blue"
+            ))
+            console.print(f"\n[dim]Saved as research ID: {result['research_id']}[/dim]")
+    researcher.close()
+
+@research.command()
+@click.argument('domain')
+@click.argument('offering')
+@click.option('--fresh', is_flag=True, help='Ignore a stored answer from the last day and ask again')
+def competitors(domain, offering, fresh):
+    """Research competitors"""
+    researcher = ResearchAgent()
+    console.print(f"[cyan]Analyzing competitive landscape...[/cyan]\n")
+
+    from agent.core import LiveMarkdownPanel
+
+    # Stream the analysis into the panel as it is generated
+    with LiveMarkdownPanel("🏆 Competitive Analysis", console=console) as panel:
+        result = researcher.research_competitors(
+            domain, offering, use_cache=not fresh, on_text=panel.append
+        )
+        panel.set(result.get('findings') or f"**Error:** {result['error']}")
+    researcher.close()
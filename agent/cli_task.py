@@ -0,0 +1,265 @@
+"""Task management commands (``bizy task ...``)"""
+
+import click
+from rich.prompt import Prompt, Confirm
+from agent.tasks import TaskManager
+from agent.planner import BusinessPlanner
+from agent.cli_common import console, build_table, TASK_TABLE_COLUMNS, GOAL_PICKER_COLUMNS
+from agent.utils import format_progress_bar, priority_icon
+
+@click.group()
+def task():
+    """Manage tasks"""
+    pass
+
+def _create_goal_interactively(planner):
+    """Prompt for a new goal's title and horizon; returns its ID or None on failure"""
+    console.print("\n[bold cyan]Creating New Goal[/bold cyan]")
+    goal_title = Prompt.ask("Goal title")
+    goal_horizon = Prompt.ask(
+        "Horizon",
+        choices=["daily", "weekly", "monthly", "quarterly", "yearly"],
+        default="monthly"
+    )
+
+    try:
+        new_goal = planner.create_goal(
+            title=goal_title,
+            horizon=goal_horizon
+        )
+        console.print(f"[green]✓[/green] Created goal: {new_goal.title} (ID: {new_goal.id})\n")
+        return new_goal.id
+    except Exception as e:
+        console.print(f"[red]✗[/red] Error creating goal: {e}")
+        return None
+
+def _resolve_goal_id(planner):
+    """Let the user pick an existing goal, create one, or skip; returns a goal ID or None"""
+    goals = planner.get_active_goals()
+
+    if not goals:
+        console.print("\n[yellow]No active goals found.[/yellow]")
+        if Confirm.ask("Would you like to create a new goal?", default=False):
+            return _create_goal_interactively(planner)
+        return None
+
+    console.print("\n[bold]📋 Available Goals:[/bold]")
+    goals_table = build_table(GOAL_PICKER_COLUMNS)
+
+    for g in goals[:10]:  # Show max 10 goals
+        goals_table.add_row(
+            str(g.id),
+            g.title[:50],
+            f"{format_progress_bar(g.progress_percentage)} {g.progress_percentage:.0f}%"
+        )
+    console.print(goals_table)
+
+    # A single prompt accepts a goal ID, 'new', or Enter to skip
+    console.print("\n[bold]Options:[/bold]")
+    console.print("  • Enter [cyan]goal ID[/cyan] to assign task to that goal")
+    console.print("  • Press [dim]Enter[/dim] to skip (create task without goal)")
+    console.print("  • Type [yellow]'new'[/yellow] to create a new goal")
+
+    choice = Prompt.ask("\n[bold]Your choice[/bold]", default="").strip()
+
+    if not choice:
+        return None
+    if choice.lower() == 'new':
+        goal_id = _create_goal_interactively(planner)
+        if goal_id is None:
+            console.print("[yellow]Creating task without goal assignment[/yellow]\n")
+        return goal_id
+
+    try:
+        goal_id = int(choice)
+    except ValueError:
+        console.print(f"[yellow]⚠[/yellow]  '{choice}' is not a goal ID. Creating task without goal.\n")
+        return None
+    # Validate goal exists (the listed goals cover the common case without a query)
+    if goal_id not in {g.id for g in goals} and not planner.get_goal(goal_id):
+        console.print(f"[yellow]⚠[/yellow]  Goal #{goal_id} not found. Creating task without goal.\n")
+        return None
+    return goal_id
+
+@task.command()
+@click.argument('title')
+@click.option('--description', '-d', help='Task description')
+@click.option('--priority', '-p', type=int, default=3)
+@click.option('--category', '-c', help='Task category')
+@click.option('--hours', '-h', type=float, help='Estimated hours')
+@click.option('--goal', '-g', type=int, help='Goal ID to assign task to')
+def add(title, description, priority, category, hours, goal):
+    """Add a new task"""
+    task_mgr = TaskManager()
+    planner = BusinessPlanner()
+
+    # If no goal specified, prompt user to select or create one
+    goal_id = goal if goal is not None else _resolve_goal_id(planner)
+
+    # Create task with goal assignment
+    task = task_mgr.create_task(
+        title=title,
+        description=description,
+        priority=priority,
+        category=category,
+        estimated_hours=hours,
+        parent_goal_id=goal_id
+    )
+
+    console.print(f"[green]✓[/green] Task created: {task.title} (ID: {task.id})")
+    if goal_id:
+        console.print(f"[dim]  Assigned to goal #{goal_id}[/dim]")
+
+    task_mgr.close()
+    planner.close()
+
+@task.command()
+@click.option('--filter', '-f', type=click.Choice(['all', 'pending', 'completed', 'today']), default='all', help='Filter tasks')
+@click.option('--goal', '-g', type=int, help='Filter by goal ID')
+@click.option('--global', 'global_view', is_flag=True, help='Show tasks from all projects (not just current repo)')
+@click.option('--project', '-pr', help='Filter tasks by specific project name')
+@click.option('--unassigned', is_flag=True, help='Show only tasks without a project assignment')
+@click.option('--limit', '-n', type=int, default=200, show_default=True, help='Maximum number of tasks to show')
+def list(filter, goal, global_view, project, unassigned, limit):
+    """List tasks with optional filters"""
+    # Determine project filtering mode
+    if global_view or unassigned or project:
+        # --project is matched exactly below instead of via the repo context
+        task_mgr = TaskManager(project_filter=False)
+    else:
+        task_mgr = TaskManager(project_filter=True)
+
+    from agent.models import Task
+
+    # Only the columns the table renders; rows come back as lightweight
+    # named tuples instead of fully hydrated ORM instances
+    query = task_mgr.session.query(
+        Task.id, Task.status, Task.priority, Task.title, Task.category, Task.due_date
+    )
+
+    # Compose all filters into a single query
+    if filter == 'pending':
+        query = query.filter(Task.status.in_(['pending', 'in_progress']))
+    elif filter == 'completed':
+        query = query.filter(Task.status == 'completed')
+    elif filter == 'today':
+        query = query.filter(TaskManager._due_today_condition())
+
+    if unassigned:
+        query = query.filter(Task.project_name == None)
+    else:
+        query = task_mgr._apply_project_filter(query)
+    if project:
+        query = query.filter(Task.project_name == project)
+    if goal:
+        query = query.filter(Task.parent_goal_id == goal)
+
+    if filter == 'today':
+        query = query.order_by(Task.priority, Task.due_date)
+    else:
+        query = query.order_by(Task.id)
+
+    # Fetch one extra row to know whether the list was truncated
+    tasks = query.limit(limit + 1).all()
+    truncated = len(tasks) > limit
+    tasks = tasks[:limit]
+
+    if not tasks:
+        console.print(f"[yellow]No {filter} tasks found[/yellow]")
+        task_mgr.close()
+        return
+
+    # Build title
+    title_parts = ["📋 Your Tasks"]
+    if filter != 'all':
+        title_parts.append(f"({filter.title()})")
+    if goal:
+        title_parts.append(f"for Goal #{goal}")
+
+    # Show project context
+    if unassigned:
+        title_parts.append("[Unassigned]")
+    elif global_view:
+        title_parts.append("[All Projects]")
+    elif project:
+        title_parts.append(f"[Project: {project}]")
+    elif task_mgr.context:
+        title_parts.append(f"[Project: {task_mgr.context['project_name']}]")
+
+    table = build_table(TASK_TABLE_COLUMNS, title=" ".join(title_parts))
+
+    for task in tasks:
+        status_icon = "✓" if task.status == 'completed' else "○"
+        priority_str = priority_icon(task.priority)
+        due_date = task.due_date.strftime('%Y-%m-%d') if task.due_date else "-"
+
+        table.add_row(
+            str(task.id),
+            status_icon,
+            priority_str,
+            task.title[:50],
+            task.category or "-",
+            due_date
+        )
+
+    console.print(table)
+    if truncated:
+        console.print(f"[dim]Showing the first {limit} tasks (use --limit to see more)[/dim]")
+    task_mgr.close()
+
+@task.command()
+@click.argument('task_ids', type=int, nargs=-1, required=True)
+def complete(task_ids):
+    """Mark one or more tasks as complete"""
+    task_mgr = TaskManager()
+    # Any number of tasks complete in one transaction
+    tasks = task_mgr.complete_tasks(task_ids)
+
+    for task in tasks:
+        console.print(f"[green]✓[/green] Completed: {task.title}")
+
+    # complete_tasks() already advanced the parent goals' progress
+    goal_ids = {task.parent_goal_id for task in tasks if task.parent_goal_id}
+    if goal_ids:
+        from agent.models import Goal
+        progress_rows = task_mgr.session.query(Goal.id, Goal.progress_percentage).filter(
+            Goal.id.in_(goal_ids)
+        ).order_by(Goal.id).all()
+        for goal_id, progress in progress_rows:
+            if progress is not None:
+                prefix = f"Goal #{goal_id} " if len(goal_ids) > 1 else "Goal "
+                console.print(f"[dim]{prefix}progress updated: {progress:.1f}%[/dim]")
+
+    completed_ids = {task.id for task in tasks}
+    for task_id in task_ids:
+        if task_id not in completed_ids:
+            console.print(f"[red]✗[/red] Task {task_id} not found")
+    task_mgr.close()
+
+@task.command()
+@click.argument('task_id', type=int)
+@click.option('--project', '-p', required=True, help='Project name to assign')
+@click.option('--path', help='Repository path (auto-detected from project list if omitted)')
+def assign(task_id, project, path):
+    """Assign a task to a project"""
+    task_mgr = TaskManager(project_filter=False)
+
+    # If path not provided, try to find it from existing tasks/goals with this project
+    if not path:
+        from agent.models import Task, Goal
+        existing = task_mgr.session.query(Task).filter(Task.project_name == project).first()
+        if existing and existing.repository_path:
+            path = existing.repository_path
+        else:
+            existing_goal = task_mgr.session.query(Goal).filter(Goal.project_name == project).first()
+            if existing_goal and existing_goal.repository_path:
+                path = existing_goal.repository_path
+
+    task = task_mgr.assign_to_project(task_id, project, path)
+    if task:
+        console.print(f"[green]✓[/green] Assigned task '{task.title}' to project: {project}")
+        if path:
+            console.print(f"[dim]  Path: {path}[/dim]")
+    else:
+        console.print(f"[red]✗[/red] Task {task_id} not found")
+    task_mgr.close()
@@ -1,41 +1,29 @@
-import anthropic
 import os
+from string import Template
 from datetime import datetime, timedelta
 from rich.console import Console
+from rich.live import Live
 from rich.panel import Panel
 from rich.markdown import Markdown
 import json
+from agent.utils import get_anthropic_client, pace_ai_request
 
 console = Console()
 
-class BusinessAgent:
-    def __init__(self):
-        api_key = os.getenv('ANTHROPIC_API_KEY')
-        if not api_key:
-            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
-        
-        self.client = anthropic.Anthropic(api_key=api_key)
-        self.model = "claude-sonnet-4-20250514"
-    
-    def morning_briefing(self, tasks_today, yesterday_summary, business_context, goals=None):
-        """Generate morning briefing with AI"""
-        
-        tasks_str = self._format_tasks_for_prompt(tasks_today)
-        goals_str = self._format_goals_for_prompt(goals) if goals else "No active goals set"
-        
-        prompt = f"""You are my business execution assistant. Generate an energizing and focused morning briefing for today.
+# Prompt templates, built once at import; each agent method only substitutes its fields
+MORNING_BRIEFING_PROMPT = Template("""You are my business execution assistant. Generate an energizing and focused morning briefing for today.
 
-TODAY'S DATE: {datetime.now().strftime('%A, %B %d, %Y')}
+TODAY'S DATE: $date
 
 YESTERDAY'S SUMMARY:
-Tasks Completed: {yesterday_summary.get('tasks_completed', 0)} of {yesterday_summary.get('tasks_due', 0)}
-Completion Rate: {yesterday_summary.get('completion_rate', 0):.0%}
+Tasks Completed: $tasks_completed of $tasks_due
+Completion Rate: $completion_rate
 
 ACTIVE GOALS:
-{goals_str}
+$goals
 
 TODAY'S SCHEDULED TASKS:
-{tasks_str}
+$tasks
 
 Create a morning briefing with these sections:
 
@@ -55,43 +43,25 @@ Any potential blockers, risks, or important deadlines
 ## 💡 Pro Tip
 One specific, actionable suggestion to move the business forward today
 
-Keep it concise, energizing, and actionable. Use markdown formatting."""
+Keep it concise, energizing, and actionable. Use markdown formatting.""")
 
-        try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text
-        except Exception as e:
-            return f"Error generating briefing: {e}"
-    
-    def evening_review_analysis(self, completed_tasks, planned_tasks, wins, blockers, learnings, energy_level):
-        """Analyze the day's work and provide insights"""
-        
-        completed_str = "\n".join([f"- {t.title} ({t.category or 'uncategorized'})" for t in completed_tasks])
-        planned_str = "\n".join([f"- {t.title} ({t.status})" for t in planned_tasks])
-        
-        completion_rate = len(completed_tasks) / len(planned_tasks) if planned_tasks else 0
-        
-        prompt = f"""Analyze today's business execution and provide insights:
+EVENING_REVIEW_PROMPT = Template("""Analyze today's business execution and provide insights:
 
-DATE: {datetime.now().strftime('%A, %B %d, %Y')}
+DATE: $date
 
-COMPLETION RATE: {completion_rate:.0%} ({len(completed_tasks)}/{len(planned_tasks)} tasks)
+COMPLETION RATE: $completion_rate ($completed_count/$planned_count tasks)
 
 COMPLETED TASKS:
-{completed_str or 'None'}
+$completed
 
 PLANNED BUT NOT COMPLETED:
-{planned_str or 'All completed!'}
+$planned
 
 USER'S REFLECTION:
-- Wins: {wins or 'Not specified'}
-- Blockers: {blockers or 'None mentioned'}
-- Learnings: {learnings or 'Not specified'}
-- Energy Level: {energy_level or 'Not specified'}
+- Wins: $wins
+- Blockers: $blockers
+- Learnings: $learnings
+- Energy Level: $energy_level
 
 Provide:
 
@@ -107,36 +77,23 @@ Constructive suggestions for improvement
 ## 🌟 Momentum Builder
 One specific thing to carry into tomorrow
 
-Be supportive but honest. Keep it concise."""
+Be supportive but honest. Keep it concise.""")
 
-        try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=1500,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text
-        except Exception as e:
-            return f"Error generating analysis: {e}"
-    
-    def weekly_review(self, weekly_stats, goals_progress, key_events):
-        """Generate comprehensive weekly review"""
-        
-        prompt = f"""Generate a comprehensive weekly review for my business:
+WEEKLY_REVIEW_PROMPT = Template("""Generate a comprehensive weekly review for my business:
 
-WEEK ENDING: {datetime.now().strftime('%B %d, %Y')}
+WEEK ENDING: $date
 
 STATS:
-- Total Tasks Completed: {weekly_stats.get('tasks_completed_this_week', 0)}
-- Total Tasks Created: {weekly_stats.get('tasks_created_this_week', 0)}
-- Completion Rate: {weekly_stats.get('completion_rate', 0):.1f}%
-- Total Hours (Estimated): {weekly_stats.get('total_estimated_hours', 0):.1f}h
+- Total Tasks Completed: $tasks_completed
+- Total Tasks Created: $tasks_created
+- Completion Rate: $completion_rate%
+- Total Hours (Estimated): ${estimated_hours}h
 
 GOAL PROGRESS:
-{goals_progress}
+$goals_progress
 
 KEY EVENTS/NOTES:
-{key_events or 'None logged'}
+$key_events
 
 Create a weekly review with:
 
@@ -161,20 +118,164 @@ Top 3 priorities for the coming week
 ## 💡 Strategic Insight
 One key insight or recommendation for the business
 
-Be thorough but scannable. Use bullet points where appropriate."""
+Be thorough but scannable. Use bullet points where appropriate.""")
+
+
+class LiveMarkdownPanel:
+    """Context manager that renders streamed markdown inside a Rich panel as it arrives
+
+    Chunks are only buffered by append(); the panel is re-rendered at the Live
+    refresh rate, so a fast token stream is batched into ~100ms screen updates.
+    The markdown is only re-parsed when new text has arrived since the last
+    refresh.
+
+    While streaming, a panel taller than the terminal is cut off with an
+    ellipsis, because Live cannot redraw lines that have scrolled away. On
+    exit Live renders the full panel once.
+    """
+
+    def __init__(self, title, border_style="blue", console=console, refresh_per_second=10):
+        self.title = title
+        self.border_style = border_style
+        self.console = console
+        self.refresh_per_second = refresh_per_second
+        self._chunks = []
+        self._live = None
+        # Bumped on every change; the refresh thread compares it against the
+        # version of the cached panel to decide whether to re-parse
+        self._version = 0
+        self._panel_version = None
+        self._panel = None
+
+    def append(self, text):
+        """Add a streamed chunk of markdown"""
+        self._chunks.append(text)
+        self._version += 1
+
+    def set(self, text):
+        """Replace the panel contents (e.g. with the final or error text)"""
+        self._chunks = [text]
+        self._version += 1
+
+    def _render(self):
+        version = self._version
+        if version != self._panel_version:
+            self._panel = Panel(
+                Markdown("".join(self._chunks)),
+                title=self.title,
+                border_style=self.border_style,
+                padding=(1, 2)
+            )
+            self._panel_version = version
+        return self._panel
+
+    def __enter__(self):
+        self._live = Live(
+            get_renderable=self._render,
+            console=self.console,
+            refresh_per_second=self.refresh_per_second,
+            vertical_overflow="ellipsis"
+        )
+        self._live.start()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._live.stop()
+        return False
+
+
+class BusinessAgent:
+    model = "claude-sonnet-4-20250514"
+
+    def __init__(self):
+        api_key = os.getenv('ANTHROPIC_API_KEY')
+        if not api_key:
+            raise ValueError("ANTHROPIC_API_KEY environment variable not set")
+        
+        self.client = get_anthropic_client(api_key)
+    
+    def morning_briefing(self, tasks_today, yesterday_summary, business_context, goals=None, on_text=None):
+        """Generate morning briefing with AI (on_text receives streamed chunks)"""
+        
+        tasks_str = self._format_tasks_for_prompt(tasks_today)
+        goals_str = self._format_goals_for_prompt(goals) if goals else "No active goals set"
+        
+        prompt = MORNING_BRIEFING_PROMPT.substitute(
+            date=datetime.now().strftime('%A, %B %d, %Y'),
+            tasks_completed=yesterday_summary.get('tasks_completed', 0),
+            tasks_due=yesterday_summary.get('tasks_due', 0),
+            completion_rate=f"{yesterday_summary.get('completion_rate', 0):.0%}",
+            goals=goals_str,
+            tasks=tasks_str
+        )
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            return message.content[0].text
+            return self._stream_text(prompt, max_tokens=2000, on_text=on_text)
+        except Exception as e:
+            return f"Error generating briefing: {e}"
+    
+    def evening_review_analysis(self, completed_tasks, planned_tasks, wins, blockers, learnings, energy_level,
+                                on_text=None):
+        """Analyze the day's work and provide insights (on_text receives streamed chunks)"""
+        
+        completed_str = "\n".join([f"- {t.title} ({t.category or 'uncategorized'})" for t in completed_tasks])
+        planned_str = "\n".join([f"- {t.title} ({t.status})" for t in planned_tasks])
+        
+        completion_rate = len(completed_tasks) / len(planned_tasks) if planned_tasks else 0
+        
+        prompt = EVENING_REVIEW_PROMPT.substitute(
+            date=datetime.now().strftime('%A, %B %d, %Y'),
+            completion_rate=f"{completion_rate:.0%}",
+            completed_count=len(completed_tasks),
+            planned_count=len(planned_tasks),
+            completed=completed_str or 'None',
+            planned=planned_str or 'All completed!',
+            wins=wins or 'Not specified',
+            blockers=blockers or 'None mentioned',
+            learnings=learnings or 'Not specified',
+            energy_level=energy_level or 'Not specified'
+        )
+
+        try:
+            return self._stream_text(prompt, max_tokens=1500, on_text=on_text)
+        except Exception as e:
+            return f"Error generating analysis: {e}"
+    
+    def weekly_review(self, weekly_stats, goals_progress, key_events, on_text=None):
+        """Generate comprehensive weekly review (on_text receives streamed chunks)"""
+        
+        prompt = WEEKLY_REVIEW_PROMPT.substitute(
+            date=datetime.now().strftime('%B %d, %Y'),
+            tasks_completed=weekly_stats.get('tasks_completed_this_week', 0),
+            tasks_created=weekly_stats.get('tasks_created_this_week', 0),
+            completion_rate=f"{weekly_stats.get('completion_rate', 0):.1f}",
+            estimated_hours=f"{weekly_stats.get('total_estimated_hours', 0):.1f}",
+            goals_progress=goals_progress,
+            key_events=key_events or 'None logged'
+        )
+
+        try:
+            return self._stream_text(prompt, max_tokens=3000, on_text=on_text)
         except Exception as e:
             return f"Error generating weekly review: {e}"
     
     # Helper methods
     
+    def _stream_text(self, prompt, max_tokens, on_text=None):
+        """Stream a completion, passing each text chunk to on_text, and return the full text"""
+        chunks = []
+        pace_ai_request()
+        with self.client.messages.stream(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        ) as stream:
+            for text in stream.text_stream:
+                chunks.append(text)
+                if on_text:
+                    on_text(text)
+        return "".join(chunks)
+    
     def _format_tasks_for_prompt(self, tasks):
         """Format tasks for inclusion in prompts"""
         if not tasks:
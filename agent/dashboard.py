@@ -7,13 +7,14 @@ Real-time terminal UI showing:
 - Upcoming deadlines
 """
 
+from textual import work
 from textual.app import App, ComposeResult
 from textual.containers import Container, Horizontal, Vertical
 from textual.widgets import Header, Footer, Static, DataTable, ProgressBar
 from textual.reactive import reactive
 from datetime import datetime, timedelta
 from agent.tasks import TaskManager
-from agent.planner import BusinessPlanner
+from agent.utils import format_progress_bar, priority_icon
 
 
 class StatsWidget(Static):
@@ -22,21 +23,17 @@ class StatsWidget(Static):
     def compose(self) -> ComposeResult:
         yield Static("", id="stats-content")
 
-    def update_stats(self, task_mgr: TaskManager):
+    def update_stats(self, snapshot: dict):
         """Update statistics display"""
-        today_summary = task_mgr.get_daily_summary()
-        velocity = task_mgr.get_task_velocity(days=7)
-        weekly_stats = task_mgr.get_weekly_task_stats()
-
         stats_text = f"""[bold cyan]📊 Statistics[/bold cyan]
 
 [bold]Today:[/bold]
-  • Completed: {today_summary['tasks_completed']} tasks
+  • Completed: {snapshot['tasks_completed_today']} tasks
 
 [bold]This Week:[/bold]
-  • Completed: {weekly_stats['tasks_completed_this_week']} tasks
-  • Completion Rate: {weekly_stats['completion_rate']:.1f}%
-  • Velocity: {velocity:.1f} tasks/day
+  • Completed: {snapshot['tasks_completed_this_week']} tasks
+  • Completion Rate: {snapshot['completion_rate']:.1f}%
+  • Velocity: {snapshot['velocity']:.1f} tasks/day
 """
         self.query_one("#stats-content", Static).update(stats_text)
 
@@ -46,31 +43,34 @@ class TasksWidget(Static):
 
     def compose(self) -> ComposeResult:
         table = DataTable(id="tasks-table")
-        table.add_columns("✓", "Priority", "Task", "Category")
+        self._column_keys = table.add_columns("✓", "Priority", "Task", "Category")
         yield table
 
-    def update_tasks(self, task_mgr: TaskManager):
+    def update_tasks(self, snapshot: dict):
         """Update tasks display"""
         table = self.query_one("#tasks-table", DataTable)
-        table.clear()
-
-        # Get today's tasks
-        tasks = task_mgr.get_tasks_for_today()
 
-        if not tasks:
-            # Get next 10 pending tasks if no tasks for today
-            from agent.models import Task
-            tasks = task_mgr.session.query(Task).filter(
-                Task.status.in_(['pending', 'in_progress'])
-            ).limit(10).all()
-
-        for task in tasks[:10]:  # Limit to 10 tasks
+        # Today's tasks, or the next pending ones if nothing is due today,
+        # keyed by task ID so unchanged rows can be left alone
+        rows = []
+        for task in snapshot['tasks']:
             status = "✓" if task.status == 'completed' else "○"
-            priority = "🔴" if task.priority == 1 else "🟡" if task.priority == 2 else "🟢"
-            title = task.title[:40] if len(task.title) > 40 else task.title
+            priority = priority_icon(task.priority)
+            title = task.title[:40]
             category = task.category or "-"
 
-            table.add_row(status, priority, title, category)
+            rows.append((str(task.id), (status, priority, title, category)))
+
+        if [row_key.value for row_key in table.rows] == [key for key, _ in rows]:
+            # Same tasks in the same order: only touch cells that changed
+            for key, cells in rows:
+                for column_key, value in zip(self._column_keys, cells):
+                    if table.get_cell(key, column_key) != value:
+                        table.update_cell(key, column_key, value)
+        else:
+            table.clear()
+            for key, cells in rows:
+                table.add_row(*cells, key=key)
 
 
 class GoalsWidget(Static):
@@ -79,19 +79,17 @@ class GoalsWidget(Static):
     def compose(self) -> ComposeResult:
         yield Static("", id="goals-content")
 
-    def update_goals(self, planner: BusinessPlanner):
+    def update_goals(self, snapshot: dict):
         """Update goals display"""
-        goals = planner.get_active_goals()
+        goals = snapshot['goals']
 
         if not goals:
             content = "[yellow]No active goals[/yellow]"
         else:
             content = "[bold cyan]🎯 Active Goals[/bold cyan]\n\n"
-            for goal in goals[:5]:  # Show top 5 goals
-                progress_bar = "█" * int(goal.progress_percentage / 10)
-                progress_bar += "░" * (10 - int(goal.progress_percentage / 10))
+            for goal in goals:  # Top 5 goals
                 content += f"[bold]{goal.title[:40]}[/bold]\n"
-                content += f"{progress_bar} {goal.progress_percentage:.0f}%\n\n"
+                content += f"{format_progress_bar(goal.progress_percentage)} {goal.progress_percentage:.0f}%\n\n"
 
         self.query_one("#goals-content", Static).update(content)
 
@@ -148,26 +146,63 @@ class BizyDashboard(App):
         """Called when app starts."""
         self.title = "Bizy AI Dashboard"
         self.sub_title = f"Last updated: {datetime.now().strftime('%H:%M:%S')}"
+
+        # Created once and reused by every refresh
+        self.task_mgr = TaskManager()
+        self._refreshing = False
+        self._refresh_pending = False
         self.refresh_data()
 
         # Set up auto-refresh every 30 seconds
         self.set_interval(30, self.refresh_data)
 
     def refresh_data(self) -> None:
-        """Refresh all data"""
-        task_mgr = TaskManager()
-        planner = BusinessPlanner()
-
-        # Update all widgets
-        self.query_one(StatsWidget).update_stats(task_mgr)
-        self.query_one(TasksWidget).update_tasks(task_mgr)
-        self.query_one(GoalsWidget).update_goals(planner)
+        """Refresh all data
+
+        Only one refresh runs at a time; timer ticks or 'r' presses that arrive
+        meanwhile are coalesced into a single follow-up refresh. Both this method
+        and _apply_snapshot() run on the app's event loop, so plain flags suffice.
+        """
+        if self._refreshing:
+            self._refresh_pending = True
+            return
+        self._refreshing = True
+        self._load_snapshot()
+
+    @work(thread=True)
+    def _load_snapshot(self) -> None:
+        """Query the database off the UI thread, then hand the result back"""
+        try:
+            # End the previous read transaction so queries see changes made by other
+            # bizy commands since the last refresh (this also expires cached objects)
+            self.task_mgr.session.rollback()
+            snapshot = self.task_mgr.get_dashboard_snapshot()
+        except Exception:
+            self.call_from_thread(self._finish_refresh)
+            raise
+        self.call_from_thread(self._apply_snapshot, snapshot)
+
+    def _apply_snapshot(self, snapshot: dict) -> None:
+        """Render a snapshot (runs on the UI thread)"""
+        # One snapshot feeds all widgets
+        self.query_one(StatsWidget).update_stats(snapshot)
+        self.query_one(TasksWidget).update_tasks(snapshot)
+        self.query_one(GoalsWidget).update_goals(snapshot)
 
         # Update subtitle with refresh time
         self.sub_title = f"Last updated: {datetime.now().strftime('%H:%M:%S')}"
-
-        task_mgr.close()
-        planner.close()
+        self._finish_refresh()
+
+    def _finish_refresh(self) -> None:
+        """Release the refresh slot and run one coalesced refresh if requested"""
+        self._refreshing = False
+        if self._refresh_pending:
+            self._refresh_pending = False
+            self.refresh_data()
+
+    def on_unmount(self) -> None:
+        """Close the shared session when the app exits."""
+        self.task_mgr.close()
 
     def action_refresh(self) -> None:
         """Manual refresh action"""
@@ -8,32 +8,36 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from agent.core import BusinessAgent
-from agent.tasks import TaskManager
+from agent.utils import TASK_STATUS_ICONS, load_env
 from rich.console import Console
-from rich.panel import Panel
 from rich.prompt import Prompt
-from rich.markdown import Markdown
 from datetime import datetime
-from dotenv import load_dotenv
 
-load_dotenv()
+load_env()
 
 console = Console()
 
-def display_banner():
+OPEN_TASK_STATUSES = frozenset({'pending', 'in_progress', 'blocked'})
+
+def display_banner(now):
     """Display evening banner"""
-    now = datetime.now()
-    console.print()
-    console.print(f"[bold magenta]{'='*70}[/bold magenta]")
-    console.print(f"[bold magenta]  🌙 EVENING REVIEW - {now.strftime('%A, %B %d, %Y')}[/bold magenta]")
-    console.print(f"[bold magenta]{'='*70}[/bold magenta]")
-    console.print()
+    console.print(
+        f"\n[bold magenta]{'='*70}[/bold magenta]\n"
+        f"[bold magenta]  🌙 EVENING REVIEW - {now.strftime('%A, %B %d, %Y')}[/bold magenta]\n"
+        f"[bold magenta]{'='*70}[/bold magenta]\n"
+    )
 
 def run_evening_review():
     """Main function for evening review"""
     try:
-        display_banner()
+        # One timestamp for the whole review, so the banner and the saved
+        # log agree on the day even when the review runs past midnight
+        now = datetime.now()
+        display_banner(now)
+
+        # Imported after the banner so it shows before the SDK and ORM load
+        from agent.core import BusinessAgent, LiveMarkdownPanel
+        from agent.tasks import TaskManager
         
         # Initialize
         agent = BusinessAgent()
@@ -41,33 +45,43 @@ def run_evening_review():
         
         # Get today's tasks
         today_tasks = task_mgr.get_tasks_for_today()
-        completed_tasks = [t for t in today_tasks if t.status == 'completed']
-        pending_tasks = [t for t in today_tasks if t.status in ['pending', 'in_progress', 'blocked']]
+        completed_tasks, pending_tasks = [], []
+        for t in today_tasks:
+            if t.status == 'completed':
+                completed_tasks.append(t)
+            elif t.status in OPEN_TASK_STATUSES:
+                pending_tasks.append(t)
         
         # Display today's stats
         completion_rate = len(completed_tasks) / len(today_tasks) if today_tasks else 0
         
-        console.print("[bold]📊 Today's Summary:[/bold]")
-        console.print(f"  • Tasks completed: {len(completed_tasks)}/{len(today_tasks)} ({completion_rate:.0%})")
-        console.print()
+        # Build the summary up front and render it with a single print
+        lines = [
+            "[bold]📊 Today's Summary:[/bold]",
+            f"  • Tasks completed: {len(completed_tasks)}/{len(today_tasks)} ({completion_rate:.0%})",
+            "",
+        ]
         
         if completed_tasks:
-            console.print("[bold green]✅ Completed:[/bold green]")
+            lines.append("[bold green]✅ Completed:[/bold green]")
             for task in completed_tasks:
-                console.print(f"  • {task.title}")
-            console.print()
+                lines.append(f"  • {task.title}")
+            lines.append("")
         
         if pending_tasks:
-            console.print("[bold yellow]⏳ Not Completed:[/bold yellow]")
+            lines.append("[bold yellow]⏳ Not Completed:[/bold yellow]")
             for task in pending_tasks[:5]:
-                status_emoji = {"pending": "⏳", "in_progress": "🔄", "blocked": "🚧"}.get(task.status, "")
-                console.print(f"  • {status_emoji} {task.title}")
-            console.print()
+                status_emoji = TASK_STATUS_ICONS.get(task.status, "")
+                lines.append(f"  • {status_emoji} {task.title}")
+            lines.append("")
         
         # Interactive reflection
-        console.print("[bold cyan]📝 Daily Reflection[/bold cyan]")
-        console.print("[dim]Take a moment to reflect on your day...[/dim]")
-        console.print()
+        lines += [
+            "[bold cyan]📝 Daily Reflection[/bold cyan]",
+            "[dim]Take a moment to reflect on your day...[/dim]",
+            "",
+        ]
+        console.print("\n".join(lines))
         
         wins = Prompt.ask("💪 [bold]What were your wins today?[/bold] (biggest accomplishments)")
         console.print()
@@ -97,7 +111,7 @@ def run_evening_review():
         # Log the day
         console.print("[dim]Saving your reflections...[/dim]")
         task_mgr.create_daily_log(
-            date=datetime.now(),
+            date=now,
             tasks_completed=len(completed_tasks),
             tasks_planned=len(today_tasks),
             wins=wins,
@@ -111,22 +125,18 @@ def run_evening_review():
         console.print("[dim]Analyzing your day...[/dim]")
         console.print()
         
-        insights = agent.evening_review_analysis(
-            completed_tasks=completed_tasks,
-            planned_tasks=today_tasks,
-            wins=wins,
-            blockers=blockers,
-            learnings=learnings,
-            energy_level=energy
-        )
-        
-        # Display insights
-        console.print(Panel(
-            Markdown(insights),
-            title="🤖 AI Insights",
-            border_style="green",
-            padding=(1, 2)
-        ))
+        # Stream the response into the panel as it is generated
+        with LiveMarkdownPanel("🤖 AI Insights", border_style="green", console=console) as panel:
+            insights = agent.evening_review_analysis(
+                completed_tasks=completed_tasks,
+                planned_tasks=today_tasks,
+                wins=wins,
+                blockers=blockers,
+                learnings=learnings,
+                energy_level=energy,
+                on_text=panel.append
+            )
+            panel.set(insights)
         
         console.print()
         console.print("[bold cyan]💤 Great work today! Rest well and see you tomorrow morning.[/bold cyan]")
@@ -140,8 +150,9 @@ def run_evening_review():
         sys.exit(0)
     except Exception as e:
         console.print(f"[bold red]❌ Error:[/bold red] {e}")
-        import traceback
-        console.print(traceback.format_exc())
+        # Full traceback only on request; the one-line error above is enough day to day
+        if os.getenv('BIZY_DEBUG'):
+            console.print_exception(show_locals=False)
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -6,13 +6,137 @@ Provides functionality to:
 - Sync tasks with calendar applications (Apple Calendar, Google Calendar, etc.)
 """
 
-from datetime import datetime, timedelta
+import re
+from datetime import date, datetime, timedelta, timezone
 from pathlib import Path
-from typing import List, Optional
+from typing import BinaryIO, List, Optional
 from icalendar import Calendar, Event
 from agent.models import Task
 
 
+CRLF = "\r\n"
+
+# Write buffer for calendar exports, so events are flushed in large chunks
+EXPORT_BUFFER_SIZE = 1 << 20
+
+# Task priority: 1=High, 2=Medium, 3=Low
+# iCal priority: 1-4=High, 5=Medium, 6-9=Low
+ICAL_PRIORITIES = {1: 1, 2: 5}
+ICAL_LOW_PRIORITY = 9
+
+
+def _escape_text(value: str) -> str:
+    """Escape a TEXT value (RFC 5545 section 3.3.11)"""
+    return (
+        value.replace("\\", "\\\\")
+        .replace(";", "\\;")
+        .replace(",", "\\,")
+        .replace("\r\n", "\\n")
+        .replace("\n", "\\n")
+        .replace("\r", "\\n")
+    )
+
+
+def _fold_line(line: str, limit: int = 75) -> str:
+    """Fold a content line so no physical line exceeds 75 octets (RFC 5545 section 3.1)"""
+    if len(line) < limit and line.isascii():
+        return line
+
+    segments = []
+    current = []
+    size = 0
+    for char in line:
+        char_size = len(char.encode("utf-8"))
+        if current and size + char_size >= limit:
+            # Keep a backslash escape together with the character it escapes
+            carry = current.pop() if len(current) > 1 and current[-1] == "\\" else None
+            segments.append("".join(current))
+            current = [carry] if carry else []
+            size = len(current)
+        current.append(char)
+        size += char_size
+    segments.append("".join(current))
+    return (CRLF + " ").join(segments)
+
+
+def _format_datetime(value: datetime, utc: bool = False) -> str:
+    """Format a DATE-TIME value; naive values are written as floating time unless utc is set"""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).strftime("%Y%m%dT%H%M%SZ")
+    return value.strftime("%Y%m%dT%H%M%SZ" if utc else "%Y%m%dT%H%M%S")
+
+
+def _task_event_lines(task: Task) -> List[str]:
+    """Build the VEVENT content lines for a single task"""
+    lines = ["BEGIN:VEVENT", _fold_line(f"SUMMARY:{_escape_text(task.title)}")]
+
+    # Set dates
+    if task.due_date:
+        # All-day event for tasks with due dates
+        lines.append(f"DTSTART;VALUE=DATE:{task.due_date.strftime('%Y%m%d')}")
+        lines.append(f"DTEND;VALUE=DATE:{(task.due_date + timedelta(days=1)).strftime('%Y%m%d')}")
+    else:
+        # Use created_at if no due date
+        lines.append(f"DTSTART:{_format_datetime(task.created_at)}")
+        lines.append(f"DTEND:{_format_datetime(task.created_at + timedelta(hours=1))}")
+
+    lines.append(f"UID:bizy-task-{task.id}@bizy-ai")
+
+    if task.category:
+        lines.append(_fold_line(f"CATEGORIES:{_escape_text(task.category)}"))
+
+    completed = task.status == 'completed'
+    if completed and task.completed_at:
+        lines.append(f"COMPLETED:{_format_datetime(task.completed_at)}")
+
+    # CREATED and LAST-MODIFIED must be UTC
+    created = _format_datetime(task.created_at, utc=True)
+    lines.append(f"CREATED:{created}")
+
+    if task.notes:
+        lines.append(_fold_line(f"DESCRIPTION:{_escape_text(task.notes)}"))
+
+    # Tasks have no updated_at column, so creation is the last known change
+    lines.append(f"LAST-MODIFIED:{created}")
+    lines.append(f"PRIORITY:{ICAL_PRIORITIES.get(task.priority, ICAL_LOW_PRIORITY)}")
+    lines.append(f"STATUS:{'COMPLETED' if completed else 'NEEDS-ACTION'}")
+    lines.append("END:VEVENT")
+    return lines
+
+
+# Raw VEVENT blocks and their DTSTART date, matched without parsing properties
+_VEVENT_BLOCK = re.compile(rb"^BEGIN:VEVENT\r?$.*?^END:VEVENT\r?$", re.MULTILINE | re.DOTALL)
+_DTSTART_DATE = re.compile(rb"^DTSTART[;:][^\r\n]*?(\d{8})", re.MULTILINE)
+
+
+def _as_date(value) -> date:
+    """Normalize a date or datetime bound to a date"""
+    return value.date() if isinstance(value, datetime) else value
+
+
+def _date_in_range(value, start: Optional[date], end: Optional[date]) -> bool:
+    """Check whether a date/datetime falls within an inclusive date range"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return (start is None or value >= _as_date(start)) and (end is None or value <= _as_date(end))
+
+
+def _starts_in_range(block: bytes, start: Optional[date], end: Optional[date]) -> bool:
+    """Cheaply check a raw VEVENT's DTSTART date, allowing a day of slack for time zones"""
+    if start is None and end is None:
+        return True
+    match = _DTSTART_DATE.search(block)
+    if match is None:
+        return True  # Let the parser decide
+    digits = match.group(1).decode()
+    event_date = date(int(digits[:4]), int(digits[4:6]), int(digits[6:]))
+    slack = timedelta(days=1)
+    return (
+        (start is None or event_date >= _as_date(start) - slack)
+        and (end is None or event_date <= _as_date(end) + slack)
+    )
+
+
 class ICalIntegration:
     """Handles iCalendar file operations for task synchronization"""
 
@@ -39,69 +163,50 @@ class ICalIntegration:
         Returns:
             Path to the generated .ics file
         """
-        cal = Calendar()
-        cal.add('prodid', '-//Bizy AI//bizy-ai//EN')
-        cal.add('version', '2.0')
-        cal.add('x-wr-calname', calendar_name)
-        cal.add('x-wr-caldesc', 'Tasks from Bizy AI')
+        with open(self.calendar_file, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+            self._write_calendar(tasks, f, calendar_name)
+        return self.calendar_file
 
-        for task in tasks:
-            event = Event()
-
-            # Basic task info
-            event.add('summary', task.title)
-            event.add('uid', f'bizy-task-{task.id}@bizy-ai')
-
-            # Add description if available
-            if task.notes:
-                event.add('description', task.notes)
-
-            # Add category
-            if task.category:
-                event.add('categories', [task.category])
-
-            # Set dates
-            if task.due_date:
-                # All-day event for tasks with due dates
-                event.add('dtstart', task.due_date.date())
-                event.add('dtend', (task.due_date + timedelta(days=1)).date())
-            else:
-                # Use created_at if no due date
-                event.add('dtstart', task.created_at)
-                event.add('dtend', task.created_at + timedelta(hours=1))
-
-            # Set status based on task completion
-            if task.status == 'completed':
-                event.add('status', 'COMPLETED')
-                if task.completed_at:
-                    event.add('completed', task.completed_at)
-            else:
-                event.add('status', 'NEEDS-ACTION')
-
-            # Set priority (1-9 scale, where 1 is highest)
-            # Task priority: 1=High, 2=Medium, 3=Low
-            # iCal priority: 1-4=High, 5=Medium, 6-9=Low
-            if task.priority == 1:
-                event.add('priority', 1)  # High
-            elif task.priority == 2:
-                event.add('priority', 5)  # Medium
-            else:
-                event.add('priority', 9)  # Low
-
-            # Add created/modified timestamps
-            event.add('created', task.created_at)
-            if hasattr(task, 'updated_at') and task.updated_at:
-                event.add('last-modified', task.updated_at)
-            else:
-                event.add('last-modified', task.created_at)
-
-            cal.add_component(event)
+    def write_tasks(self, tasks: List[Task], stream: BinaryIO, calendar_name: str = "Bizy AI Tasks") -> None:
+        """Write tasks as iCalendar data to an open binary stream (e.g. stdout)
 
-        # Write to file
-        with open(self.calendar_file, 'wb') as f:
-            f.write(cal.to_ical())
+        Args:
+            tasks: List of Task objects to export
+            stream: Binary file-like object to write to
+            calendar_name: Name of the calendar
+        """
+        self._write_calendar(tasks, stream, calendar_name)
+        stream.flush()
 
-        return self.calendar_file
+    def _write_calendar(self, tasks: List[Task], stream: BinaryIO, calendar_name: str) -> None:
+        """Stream a calendar with one VEVENT per task in a single pass
+
+        Content lines are written directly instead of going through
+        icalendar's Calendar/Event objects, whose per-property parsing
+        dominated large exports. Properties follow the order icalendar
+        itself emits, so the output parses back identically. Each event is
+        written as soon as it is serialized, so the whole calendar is never
+        held in memory.
+
+        Args:
+            tasks: List of Task objects to export
+            stream: Binary file-like object to write to
+            calendar_name: Name of the calendar
+        """
+        header = [
+            "BEGIN:VCALENDAR",
+            "VERSION:2.0",
+            "PRODID:-//Bizy AI//bizy-ai//EN",
+            "X-WR-CALDESC:Tasks from Bizy AI",
+            _fold_line(f"X-WR-CALNAME:{_escape_text(calendar_name)}"),
+            "",
+        ]
+        stream.write(CRLF.join(header).encode("utf-8"))
+        for task in tasks:
+            lines = _task_event_lines(task)
+            lines.append("")
+            stream.write(CRLF.join(lines).encode("utf-8"))
+        stream.write(b"END:VCALENDAR\r\n")
 
     def import_calendar(self, ical_path: Optional[Path] = None) -> Calendar:
         """Import an iCalendar file
@@ -112,6 +217,17 @@ class ICalIntegration:
         Returns:
             Calendar object
         """
+        return Calendar.from_ical(self._read_calendar(ical_path))
+
+    def _read_calendar(self, ical_path: Optional[Path] = None) -> bytes:
+        """Read the raw bytes of an iCalendar file
+
+        Args:
+            ical_path: Path to .ics file (default: uses calendar_file)
+
+        Returns:
+            File contents
+        """
         if ical_path is None:
             ical_path = self.calendar_file
 
@@ -119,33 +235,54 @@ class ICalIntegration:
             raise FileNotFoundError(f"Calendar file not found: {ical_path}")
 
         with open(ical_path, 'rb') as f:
-            return Calendar.from_ical(f.read())
+            return f.read()
 
-    def get_events(self, ical_path: Optional[Path] = None) -> List[dict]:
-        """Get all events from an iCalendar file
+    def get_events(self, ical_path: Optional[Path] = None,
+                   start: Optional[date] = None, end: Optional[date] = None) -> List[dict]:
+        """Get events from an iCalendar file, optionally limited to a date range
+
+        VEVENT blocks are split out of the raw file and their DTSTART date is
+        checked before any property parsing, so events outside the range never
+        reach icalendar's parser.
 
         Args:
             ical_path: Path to .ics file
+            start: Only include events starting on or after this date
+            end: Only include events starting on or before this date
 
         Returns:
             List of event dictionaries
         """
-        cal = self.import_calendar(ical_path)
-        events = []
+        data = self._read_calendar(ical_path)
+
+        # Events referencing calendar-defined time zones need the whole
+        # calendar to resolve them, so take the full parse for those files
+        if b"BEGIN:VTIMEZONE" in data:
+            components = (
+                component for component in Calendar.from_ical(data).walk()
+                if component.name == "VEVENT"
+            )
+        else:
+            components = (
+                Event.from_ical(block) for block in _VEVENT_BLOCK.findall(data)
+                if _starts_in_range(block, start, end)
+            )
 
-        for component in cal.walk():
-            if component.name == "VEVENT":
-                event = {
-                    'summary': str(component.get('summary', '')),
-                    'description': str(component.get('description', '')),
-                    'start': component.get('dtstart').dt,
-                    'end': component.get('dtend').dt if component.get('dtend') else None,
-                    'status': str(component.get('status', 'NEEDS-ACTION')),
-                    'priority': int(component.get('priority', 5)),
-                    'uid': str(component.get('uid', '')),
-                    'categories': [str(cat) for cat in component.get('categories', [])]
-                }
-                events.append(event)
+        events = []
+        for component in components:
+            event = {
+                'summary': str(component.get('summary', '')),
+                'description': str(component.get('description', '')),
+                'start': component.get('dtstart').dt,
+                'end': component.get('dtend').dt if component.get('dtend') else None,
+                'status': str(component.get('status', 'NEEDS-ACTION')),
+                'priority': int(component.get('priority', 5)),
+                'uid': str(component.get('uid', '')),
+                'categories': [str(cat) for cat in component.get('categories', [])]
+            }
+            if (start or end) and not _date_in_range(event['start'], start, end):
+                continue
+            events.append(event)
 
         return events
 
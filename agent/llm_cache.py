@@ -0,0 +1,48 @@
+"""Stored Claude replies, keyed by a hash of the request (ai_response_cache table)"""
+
+import hashlib
+import json
+import weakref
+from datetime import datetime, timedelta
+from agent.models import AIResponseCache
+
+# How long a stored AI response is reused for an identical request
+AI_RESPONSE_TTL = timedelta(days=30)
+
+# Engines whose database is known to have the ai_response_cache table
+_engines_with_cache_table = weakref.WeakSet()
+
+
+def _ensure_cache_table(session):
+    """Create the table once per engine for databases that predate it (see 'bizy migrate')"""
+    engine = session.get_bind()
+    if engine not in _engines_with_cache_table:
+        AIResponseCache.__table__.create(engine, checkfirst=True)
+        _engines_with_cache_table.add(engine)
+
+
+def response_cache_key(model, system, prompt, max_tokens):
+    """Hash identifying a request in the ai_response_cache table"""
+    key_source = json.dumps([model, max_tokens, system, prompt], sort_keys=True)
+    return hashlib.sha256(key_source.encode()).hexdigest()
+
+
+def cached_response(session, prompt_hash, ttl=AI_RESPONSE_TTL):
+    """Return the stored reply for a request hash, or None if missing or older than ttl"""
+    _ensure_cache_table(session)
+    return session.query(AIResponseCache.response_text).filter(
+        AIResponseCache.prompt_hash == prompt_hash,
+        AIResponseCache.created_at >= datetime.utcnow() - ttl
+    ).scalar()
+
+
+def store_response(session, prompt_hash, response_text, commit=True):
+    """Store (or refresh) the reply for a request hash (commit=False leaves it to the caller)"""
+    _ensure_cache_table(session)
+    session.merge(AIResponseCache(
+        prompt_hash=prompt_hash,
+        response_text=response_text,
+        created_at=datetime.utcnow()
+    ))
+    if commit:
+        session.commit()
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, Column, Integer, String, DateTime, Boolean, Text, Float, JSON
+from sqlalchemy import create_engine, event, Column, Index, Integer, String, DateTime, Boolean, Text, Float, JSON
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 from datetime import datetime
@@ -27,6 +27,19 @@ class Task(Base):
     project_name = Column(String(200), index=True)  # Repository/project name (e.g., "business-agent")
     repository_path = Column(String(500))  # Full path to repository root
 
+    __table_args__ = (
+        # Goal progress counts tasks per goal by status straight from the index
+        Index('ix_task_goal_status', 'parent_goal_id', 'status'),
+        # Pending/today listings filter on status and due date
+        Index('ix_task_status_due', 'status', 'due_date'),
+        # Velocity, weekly stats and charts scan completion-date ranges
+        Index('ix_task_completed_at', 'completed_at'),
+        # ...almost always for completed tasks only, which this answers as one range
+        Index('ix_task_status_completed', 'status', 'completed_at'),
+        # Daily summaries count tasks due on a day regardless of status
+        Index('ix_task_due_date', 'due_date'),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -65,6 +78,8 @@ class Goal(Base):
     metrics = Column(JSON)  # Key metrics to track
     project_name = Column(String(200), index=True)  # Repository/project name (e.g., "business-agent")
     repository_path = Column(String(500))  # Full path to repository root
+    total_tasks = Column(Integer)  # Cached count of linked tasks (NULL until first synced)
+    completed_tasks = Column(Integer)  # Cached count of completed linked tasks
 
     def to_dict(self):
         return {
@@ -200,7 +215,35 @@ class BusinessPlan(Base):
             'is_active': self.is_active
         }
 
+class AIResponseCache(Base):
+    __tablename__ = 'ai_response_cache'
+
+    prompt_hash = Column(String(64), primary_key=True)  # sha256 of model, max_tokens, system and prompt
+    response_text = Column(Text, nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+
 # Database setup
+
+# Connection-level tuning for the on-disk SQLite database. The CLI is read-heavy:
+# WAL lets readers run alongside a writer, NORMAL sync is safe under WAL, and a
+# memory-mapped file plus a larger page cache keep repeated scans off read(),
+# and sorter/GROUP BY temp tables stay in memory instead of temp files.
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA mmap_size=268435456",  # 256 MB
+    "PRAGMA cache_size=-65536",  # 64 MB (negative value = KiB)
+    "PRAGMA busy_timeout=5000",  # Wait up to 5s for a concurrent writer instead of failing
+)
+
+def _apply_sqlite_pragmas(dbapi_connection, connection_record):
+    """Apply SQLITE_PRAGMAS to every new DBAPI connection"""
+    cursor = dbapi_connection.cursor()
+    for pragma in SQLITE_PRAGMAS:
+        cursor.execute(pragma)
+    cursor.close()
+
 def get_engine(db_path=None):
     if db_path is None:
         # Determine database path based on environment
@@ -216,21 +259,47 @@ def get_engine(db_path=None):
             # Production environment uses main database
             db_path = os.getenv('BUSINESS_AGENT_DB', os.path.expanduser('~/.business-agent/tasks.db'))
 
-    # Create directory if it doesn't exist (not needed for in-memory)
     if db_path and db_path != ':memory:':
+        return _get_file_engine(db_path)
+
+    # In-memory database
+    return create_engine('sqlite:///:memory:', echo=False)
+
+# One engine (and connection pool) per on-disk database path
+_file_engines = {}
+
+def _get_file_engine(db_path):
+    """Create the engine for an on-disk database once per path and share its pool"""
+    engine = _file_engines.get(db_path)
+    if engine is None:
+        # Create directory if it doesn't exist
         db_dir = os.path.dirname(db_path)
         if db_dir:
             os.makedirs(db_dir, exist_ok=True)
-        return create_engine(f'sqlite:///{db_path}', echo=False)
+        engine = create_engine(f'sqlite:///{db_path}', echo=False)
+        event.listen(engine, 'connect', _apply_sqlite_pragmas)
+        _file_engines[db_path] = engine
+    return engine
 
-    # In-memory database
-    return create_engine('sqlite:///:memory:', echo=False)
+def reset_engines(close=True):
+    """
+    Dispose of and forget cached engines.
+
+    In a forked worker pass close=False: the pooled connections belong to
+    the parent process, so they are dropped without being closed (as
+    SQLAlchemy recommends) and the worker opens its own.
+    """
+    for engine in _file_engines.values():
+        engine.dispose(close=close)
+    _file_engines.clear()
+
+# Unbound factory; get_session() binds each session to the requested engine
+Session = sessionmaker()
 
 def get_session(engine=None):
     if engine is None:
         engine = get_engine()
-    Session = sessionmaker(bind=engine)
-    return Session()
+    return Session(bind=engine)
 
 def init_database(db_path=None):
     """Initialize the database with all tables"""
@@ -282,3 +351,65 @@ def migrate_add_project_columns(engine=None):
     print("\n✓ Migration completed successfully!")
     print("  Existing tasks/goals have been assigned to 'global' project")
     print("  New tasks/goals will automatically use the current repository context")
+
+
+def migrate_add_goal_task_counters(engine=None):
+    """
+    Migration to add cached total_tasks and completed_tasks columns to the goals table.
+    This is safe to run multiple times - it will only add columns if they don't exist.
+    Counters are left NULL and get seeded the first time a goal's tasks change.
+    """
+    if engine is None:
+        engine = get_engine()
+
+    conn = engine.raw_connection()
+    cursor = conn.cursor()
+
+    cursor.execute("PRAGMA table_info(goals)")
+    columns = [row[1] for row in cursor.fetchall()]
+
+    for column in ('total_tasks', 'completed_tasks'):
+        if column not in columns:
+            print(f"Adding '{column}' column to goals table...")
+            cursor.execute(f"ALTER TABLE goals ADD COLUMN {column} INTEGER")
+            print(f"✓ Added '{column}' column")
+        else:
+            print(f"✓ '{column}' column already exists")
+
+    conn.commit()
+    conn.close()
+
+
+def migrate_add_ai_response_cache(engine=None):
+    """
+    Migration to add the ai_response_cache table to existing databases.
+    This is safe to run multiple times - the table is only created if missing.
+    """
+    if engine is None:
+        engine = get_engine()
+
+    AIResponseCache.__table__.create(engine, checkfirst=True)
+    print("✓ 'ai_response_cache' table")
+
+
+def migrate_add_task_indexes(engine=None):
+    """
+    Migration to add the task query indexes to existing databases.
+    This is safe to run multiple times - indexes are only created if missing.
+    """
+    if engine is None:
+        engine = get_engine()
+
+    conn = engine.raw_connection()
+    cursor = conn.cursor()
+
+    for index in Task.__table__.indexes:
+        columns = ", ".join(column.name for column in index.columns)
+        cursor.execute(f"CREATE INDEX IF NOT EXISTS {index.name} ON tasks ({columns})")
+        print(f"✓ Index {index.name} on tasks ({columns})")
+
+    # Refresh planner statistics so SQLite actually picks the new indexes
+    cursor.execute("ANALYZE tasks")
+
+    conn.commit()
+    conn.close()
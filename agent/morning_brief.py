@@ -8,42 +8,44 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from agent.core import BusinessAgent
-from agent.tasks import TaskManager
-from agent.planner import BusinessPlanner
+from agent.utils import TASK_STATUS_ICONS, load_env
 from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
 from datetime import datetime
-from dotenv import load_dotenv
 
-load_dotenv()
+load_env()
 
 console = Console()
 
+BRIEFING_PRIORITY_ICONS = {1: "🔴", 2: "🟠", 3: "🟡", 4: "🟢", 5: "🔵"}
+
 def display_banner():
     """Display welcome banner"""
     now = datetime.now()
-    console.print()
-    console.print(f"[bold cyan]{'='*70}[/bold cyan]")
-    console.print(f"[bold cyan]  ☀️  MORNING BRIEFING - {now.strftime('%A, %B %d, %Y')}[/bold cyan]")
-    console.print(f"[bold cyan]{'='*70}[/bold cyan]")
-    console.print()
+    console.print(
+        f"\n[bold cyan]{'='*70}[/bold cyan]\n"
+        f"[bold cyan]  ☀️  MORNING BRIEFING - {now.strftime('%A, %B %d, %Y')}[/bold cyan]\n"
+        f"[bold cyan]{'='*70}[/bold cyan]\n"
+    )
 
 def run_morning_briefing():
     """Main function to run morning briefing"""
     try:
         display_banner()
+
+        # Imported after the banner so it shows before the SDK and ORM load
+        from agent.core import BusinessAgent, LiveMarkdownPanel
+        from agent.planner import BusinessPlanner
         
         # Initialize components
         console.print("[dim]Initializing business agent...[/dim]")
         agent = BusinessAgent()
-        task_mgr = TaskManager()
+        # Reuse the planner's TaskManager rather than opening a second session
         planner = BusinessPlanner()
+        task_mgr = planner.task_mgr
         
         # Get yesterday's summary
         console.print("[dim]Analyzing yesterday's performance...[/dim]")
-        yesterday_summary = task_mgr.get_yesterday_summary()
+        yesterday_summary = task_mgr.get_yesterday_summary(include_tasks=False)
         
         # Get today's tasks
         console.print("[dim]Loading today's tasks...[/dim]")
@@ -56,46 +58,44 @@ def run_morning_briefing():
         # Get overdue tasks
         overdue_tasks = task_mgr.get_overdue_tasks()
         
-        console.print()
-        
-        # Display quick stats
-        console.print("[bold]📊 Quick Stats:[/bold]")
-        console.print(f"  • Yesterday: {yesterday_summary['tasks_completed']}/{yesterday_summary['tasks_due']} tasks completed ({yesterday_summary['completion_rate']:.0%})")
-        console.print(f"  • Today: {len(today_tasks)} tasks scheduled")
-        console.print(f"  • Active goals: {len(active_goals)}")
+        # Display quick stats (each section is rendered with a single print)
+        lines = [
+            "",
+            "[bold]📊 Quick Stats:[/bold]",
+            f"  • Yesterday: {yesterday_summary['tasks_completed']}/{yesterday_summary['tasks_due']} tasks completed ({yesterday_summary['completion_rate']:.0%})",
+            f"  • Today: {len(today_tasks)} tasks scheduled",
+            f"  • Active goals: {len(active_goals)}",
+        ]
         if overdue_tasks:
-            console.print(f"  • [yellow]⚠️  {len(overdue_tasks)} overdue tasks[/yellow]")
-        console.print()
+            lines.append(f"  • [yellow]⚠️  {len(overdue_tasks)} overdue tasks[/yellow]")
+        lines.append("")
+        console.print("\n".join(lines))
         
         # Generate AI briefing
         console.print("[dim]Generating personalized briefing...[/dim]")
-        briefing = agent.morning_briefing(
-            tasks_today=today_tasks,
-            yesterday_summary=yesterday_summary,
-            business_context="See active goals below",
-            goals=active_goals
-        )
-        
-        # Display the briefing
-        console.print(Panel(
-            Markdown(briefing),
-            title="🤖 Your Daily Briefing",
-            border_style="blue",
-            padding=(1, 2)
-        ))
+        # Stream the response into the panel as it is generated
+        with LiveMarkdownPanel("🤖 Your Daily Briefing", border_style="blue", console=console) as panel:
+            briefing = agent.morning_briefing(
+                tasks_today=today_tasks,
+                yesterday_summary=yesterday_summary,
+                business_context="See active goals below",
+                goals=active_goals,
+                on_text=panel.append
+            )
+            panel.set(briefing)
         
+        lines = []
+
         # Display today's task list
         if today_tasks:
-            console.print()
-            console.print("[bold]📋 Today's Task List:[/bold]")
-            console.print()
+            lines += ["", "[bold]📋 Today's Task List:[/bold]", ""]
             
             # Sort by priority
             sorted_tasks = sorted(today_tasks, key=lambda t: t.priority)
             
             for i, task in enumerate(sorted_tasks[:10], 1):
-                priority_emoji = {1: "🔴", 2: "🟠", 3: "🟡", 4: "🟢", 5: "🔵"}.get(task.priority, "⚪")
-                status_emoji = {"pending": "⏳", "in_progress": "🔄", "blocked": "🚧"}.get(task.status, "❓")
+                priority_emoji = BRIEFING_PRIORITY_ICONS.get(task.priority, "⚪")
+                status_emoji = TASK_STATUS_ICONS.get(task.status, "❓")
                 
                 task_line = f"{i}. {priority_emoji} {status_emoji} {task.title}"
                 
@@ -105,27 +105,25 @@ def run_morning_briefing():
                 if task.category:
                     task_line += f" [dim italic]#{task.category}[/dim italic]"
                 
-                console.print(f"   {task_line}")
+                lines.append(f"   {task_line}")
         
         # Display overdue tasks if any
         if overdue_tasks:
-            console.print()
-            console.print("[bold yellow]⚠️  Overdue Tasks:[/bold yellow]")
+            lines += ["", "[bold yellow]⚠️  Overdue Tasks:[/bold yellow]"]
             for task in overdue_tasks[:5]:
-                console.print(f"   • {task.title} [dim](Due: {task.due_date.strftime('%m/%d')})[/dim]")
+                lines.append(f"   • {task.title} [dim](Due: {task.due_date.strftime('%m/%d')})[/dim]")
         
-        console.print()
-        console.print("[bold green]✨ Have a productive day! ✨[/bold green]")
-        console.print()
+        lines += ["", "[bold green]✨ Have a productive day! ✨[/bold green]", ""]
+        console.print("\n".join(lines))
         
-        # Cleanup
-        task_mgr.close()
+        # Cleanup (also closes the planner's TaskManager)
         planner.close()
         
     except Exception as e:
         console.print(f"[bold red]❌ Error generating briefing:[/bold red] {e}")
-        import traceback
-        console.print(traceback.format_exc())
+        # Full traceback only on request; the one-line error above is enough day to day
+        if os.getenv('BIZY_DEBUG'):
+            console.print_exception(show_locals=False)
         sys.exit(1)
 
 if __name__ == "__main__":
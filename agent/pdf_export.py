@@ -8,9 +8,13 @@ Generates professional PDF reports:
 - Charts and visualizations
 """
 
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Tuple
+from xml.sax.saxutils import escape
 from reportlab.lib import colors
 from reportlab.lib.pagesizes import letter
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
@@ -20,14 +24,98 @@ from reportlab.platypus import (
     PageBreak, Image as RLImage
 )
 from reportlab.lib.enums import TA_CENTER, TA_LEFT
+from sqlalchemy import case, func
 from agent.tasks import TaskManager
 from agent.planner import BusinessPlanner
-from agent.models import Task, Goal
+from agent.models import Task, Goal, reset_engines
+
+# Characters dropped from goal titles when naming report files
+UNSAFE_FILENAME_CHARS = re.compile(r'[^\w \-]')
+
+# Columns read by PDFExporter._add_task_table, its default row cap, and the
+# rows per Table flowable (ReportLab's table layout grows faster than linearly
+# with row count, so long lists are split into fixed-size blocks)
+TASK_TABLE_COLUMNS = (Task.status, Task.priority, Task.title, Task.category)
+TASK_TABLE_LIMIT = 20
+TASK_TABLE_CHUNK = 50
+
+# Report palette and table styles, built once and shared by every table
+PRIMARY_COLOR = colors.HexColor('#2E86AB')
+ACCENT_COLOR = colors.HexColor('#A23B72')
+
+STATS_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), PRIMARY_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 12),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+TASK_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), ACCENT_COLOR),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('FONTSIZE', (0, 0), (-1, 0), 10),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
+    ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
+    ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
+])
+
+# Reports export_batch() can run; export_task_list takes ORM objects, which
+# cannot be sent to a worker process
+BATCH_EXPORTS = frozenset({
+    'export_weekly_report',
+    'export_monthly_report',
+    'export_goal_report',
+    'export_all_goals_report',
+    'export_velocity_report',
+    'export_date_range_report',
+})
+
+
+def _init_export_worker():
+    """Drop database engines inherited from the parent process on fork"""
+    reset_engines(close=False)
+
+
+def _export_in_worker(method: str, kwargs: dict, output_dir: Optional[Path]) -> Optional[Path]:
+    """Run a single export with an exporter (and sessions) owned by this process"""
+    exporter = PDFExporter(output_dir=output_dir)
+    try:
+        return getattr(exporter, method)(**kwargs)
+    finally:
+        exporter.close()
 
 
 class PDFExporter:
     """Generate PDF reports using ReportLab"""
 
+    # Paragraph styles are read-only, so every exporter shares one set
+    styles = getSampleStyleSheet()
+
+    title_style = ParagraphStyle(
+        'CustomTitle',
+        parent=styles['Heading1'],
+        fontSize=24,
+        textColor=PRIMARY_COLOR,
+        spaceAfter=30,
+        alignment=TA_CENTER
+    )
+
+    heading_style = ParagraphStyle(
+        'CustomHeading',
+        parent=styles['Heading2'],
+        fontSize=16,
+        textColor=PRIMARY_COLOR,
+        spaceAfter=12,
+        spaceBefore=12
+    )
+
     def __init__(self, output_dir: Optional[Path] = None, task_mgr: Optional[TaskManager] = None, planner: Optional[BusinessPlanner] = None):
         """Initialize PDF exporter
 
@@ -48,26 +136,6 @@ class PDFExporter:
         self.task_mgr = task_mgr if task_mgr else TaskManager()
         self.planner = planner if planner else BusinessPlanner()
         self._owns_managers = task_mgr is None and planner is None  # Only close if we created them
-        self.styles = getSampleStyleSheet()
-
-        # Create custom styles
-        self.title_style = ParagraphStyle(
-            'CustomTitle',
-            parent=self.styles['Heading1'],
-            fontSize=24,
-            textColor=colors.HexColor('#2E86AB'),
-            spaceAfter=30,
-            alignment=TA_CENTER
-        )
-
-        self.heading_style = ParagraphStyle(
-            'CustomHeading',
-            parent=self.styles['Heading2'],
-            fontSize=16,
-            textColor=colors.HexColor('#2E86AB'),
-            spaceAfter=12,
-            spaceBefore=12
-        )
 
     def close(self):
         """Close database connections"""
@@ -75,6 +143,43 @@ class PDFExporter:
             self.task_mgr.close()
             self.planner.close()
 
+    @classmethod
+    def export_batch(
+        cls,
+        specs: List[Tuple[str, dict]],
+        output_dir: Optional[Path] = None,
+        max_workers: Optional[int] = None
+    ) -> List[Optional[Path]]:
+        """Generate several reports in parallel, one worker process per report
+
+        ReportLab layout is CPU-bound, so independent reports scale across
+        cores. Each worker builds its own PDFExporter with fresh database
+        sessions; SQLite in WAL mode serves the concurrent readers.
+
+        Args:
+            specs: (method name, keyword arguments) pairs, e.g.
+                [('export_weekly_report', {}), ('export_velocity_report', {'days': 14})]
+            output_dir: Directory for PDF outputs (default: ~/.business-agent/reports/)
+            max_workers: Worker processes (default: one per CPU, at most one per report)
+
+        Returns:
+            The path returned by each export, in the order of specs
+        """
+        for method, _ in specs:
+            if method not in BATCH_EXPORTS:
+                raise ValueError(f"Unsupported report for batch export: {method}")
+
+        if len(specs) <= 1:
+            return [_export_in_worker(method, kwargs, output_dir) for method, kwargs in specs]
+
+        workers = min(len(specs), max_workers or os.cpu_count() or 1)
+        with ProcessPoolExecutor(max_workers=workers, initializer=_init_export_worker) as pool:
+            futures = [
+                pool.submit(_export_in_worker, method, kwargs, output_dir)
+                for method, kwargs in specs
+            ]
+            return [future.result() for future in futures]
+
     def _create_pdf_doc(self, filename: str) -> tuple:
         """Create PDF document and story list
 
@@ -82,7 +187,7 @@ class PDFExporter:
             filename: PDF filename
 
         Returns:
-            Tuple of (doc, story)
+            Tuple of (doc, story, pdf_path)
         """
         pdf_path = self.output_dir / filename
         doc = SimpleDocTemplate(
@@ -96,18 +201,25 @@ class PDFExporter:
         story = []
         return doc, story, pdf_path
 
-    def _add_header(self, story: list, title: str, date_str: Optional[str] = None):
+    def _add_header(
+        self,
+        story: list,
+        title: str,
+        date_str: Optional[str] = None,
+        now: Optional[datetime] = None
+    ):
         """Add report header
 
         Args:
             story: Story list to append to
             title: Report title
             date_str: Optional date string
+            now: Report timestamp shown when no date string is given (default: now)
         """
         story.append(Paragraph(title, self.title_style))
 
         if date_str is None:
-            date_str = datetime.now().strftime('%B %d, %Y')
+            date_str = (now or datetime.now()).strftime('%B %d, %Y')
 
         story.append(Paragraph(f"Generated: {date_str}", self.styles['Normal']))
         story.append(Spacer(1, 0.3*inch))
@@ -128,27 +240,36 @@ class PDFExporter:
         ]
 
         table = Table(data, colWidths=[3*inch, 2*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#2E86AB')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 12),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-            ('GRID', (0, 0), (-1, -1), 1, colors.black),
-        ]))
+        table.setStyle(STATS_TABLE_STYLE)
 
         story.append(table)
         story.append(Spacer(1, 0.3*inch))
 
-    def _add_task_table(self, story: list, tasks: List[Task], title: str = "Tasks"):
+    def _task_table_rows(self, *criteria):
+        """Query just the columns _add_task_table renders, as lightweight rows
+
+        Args:
+            *criteria: Filter expressions on Task
+
+        Returns:
+            Query of (status, priority, title, category) rows in ID order
+        """
+        return self.task_mgr.session.query(*TASK_TABLE_COLUMNS).filter(*criteria).order_by(Task.id)
+
+    def _add_task_table(
+        self,
+        story: list,
+        tasks: List[Task],
+        title: str = "Tasks",
+        max_rows: Optional[int] = TASK_TABLE_LIMIT
+    ):
         """Add task list table to report
 
         Args:
             story: Story list to append to
-            tasks: List of tasks
+            tasks: Tasks or rows with status, priority, title and category
             title: Table title
+            max_rows: Maximum rows to render (None for all)
         """
         story.append(Paragraph(title, self.heading_style))
 
@@ -157,51 +278,57 @@ class PDFExporter:
             story.append(Spacer(1, 0.2*inch))
             return
 
-        data = [['Status', 'Priority', 'Title', 'Category']]
-
-        for task in tasks[:20]:  # Limit to 20 tasks per table
+        rows = []
+        for task in tasks[:max_rows]:
             status = '✓' if task.status == 'completed' else '○'
             priority = str(task.priority) if task.priority else '3'
             title_short = task.title[:40] + '...' if len(task.title) > 40 else task.title
             category = task.category or '-'
 
-            data.append([status, priority, title_short, category])
-
-        table = Table(data, colWidths=[0.5*inch, 0.7*inch, 3.5*inch, 1.3*inch])
-        table.setStyle(TableStyle([
-            ('BACKGROUND', (0, 0), (-1, 0), colors.HexColor('#A23B72')),
-            ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-            ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-            ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-            ('FONTSIZE', (0, 0), (-1, 0), 10),
-            ('BOTTOMPADDING', (0, 0), (-1, 0), 8),
-            ('BACKGROUND', (0, 1), (-1, -1), colors.lightgrey),
-            ('GRID', (0, 0), (-1, -1), 0.5, colors.grey),
-            ('ROWBACKGROUNDS', (0, 1), (-1, -1), [colors.white, colors.lightgrey]),
-        ]))
+            rows.append([status, priority, title_short, category])
+
+        for start in range(0, len(rows), TASK_TABLE_CHUNK):
+            if start:
+                story.append(Spacer(1, 2))
+            data = [['Status', 'Priority', 'Title', 'Category']]
+            data.extend(rows[start:start + TASK_TABLE_CHUNK])
+
+            table = Table(data, colWidths=[0.5*inch, 0.7*inch, 3.5*inch, 1.3*inch], repeatRows=1)
+            table.setStyle(TASK_TABLE_STYLE)
+            story.append(table)
 
-        story.append(table)
         story.append(Spacer(1, 0.3*inch))
 
-    def _add_goal_progress(self, story: list, goal: Goal):
+    def _add_goal_progress(
+        self,
+        story: list,
+        goal: Goal,
+        task_counts: Optional[Tuple[int, int]] = None
+    ):
         """Add goal progress section
 
+        The detail lines share one paragraph, so ReportLab parses its markup
+        once per goal rather than once per line.
+
         Args:
             story: Story list to append to
             goal: Goal object
+            task_counts: Optional (completed, total) task counts to include
         """
-        story.append(Paragraph(f"Goal: {goal.title}", self.heading_style))
-        story.append(Paragraph(f"Progress: {goal.progress_percentage:.1f}%", self.styles['Normal']))
+        story.append(Paragraph(f"Goal: {escape(goal.title)}", self.heading_style))
+
+        lines = [f"Progress: {goal.progress_percentage:.1f}%"]
 
         if goal.description:
-            story.append(Paragraph(f"<i>{goal.description}</i>", self.styles['Normal']))
+            lines.append(f"<i>{escape(goal.description)}</i>")
 
         if goal.target_date:
-            story.append(Paragraph(
-                f"Target Date: {goal.target_date.strftime('%Y-%m-%d')}",
-                self.styles['Normal']
-            ))
+            lines.append(f"Target Date: {goal.target_date.strftime('%Y-%m-%d')}")
+
+        if task_counts is not None:
+            lines.append("Tasks: {}/{} completed".format(*task_counts))
 
+        story.append(Paragraph("<br/>".join(lines), self.styles['Normal']))
         story.append(Spacer(1, 0.2*inch))
 
     def export_weekly_report(
@@ -220,13 +347,14 @@ class PDFExporter:
         Returns:
             Path to created PDF file
         """
+        now = datetime.now()
         if filename is None:
-            filename = f"weekly_report_{datetime.now().strftime('%Y%m%d')}.pdf"
+            filename = f"weekly_report_{now.strftime('%Y%m%d')}.pdf"
 
         doc, story, pdf_path = self._create_pdf_doc(filename)
 
         # Add header
-        self._add_header(story, "Weekly Report")
+        self._add_header(story, "Weekly Report", now=now)
 
         # Add logo if provided
         if logo_path and logo_path.exists():
@@ -238,7 +366,7 @@ class PDFExporter:
                 pass  # Skip if logo can't be loaded
 
         # Get weekly stats
-        weekly_stats = self.task_mgr.get_weekly_task_stats()
+        weekly_stats = self.task_mgr.get_weekly_task_stats(include_tasks=False)
         velocity = self.task_mgr.get_task_velocity(days=7)
 
         stats = {
@@ -251,18 +379,18 @@ class PDFExporter:
         self._add_stats_table(story, stats)
 
         # Add completed tasks
-        week_start = datetime.now() - timedelta(days=7)
-        completed_tasks = self.task_mgr.session.query(Task).filter(
+        week_start = now - timedelta(days=7)
+        completed_tasks = self._task_table_rows(
             Task.status == 'completed',
             Task.completed_at >= week_start
-        ).all()
+        ).limit(TASK_TABLE_LIMIT).all()
 
         self._add_task_table(story, completed_tasks, "Completed This Week")
 
         # Add pending tasks
-        pending_tasks = self.task_mgr.session.query(Task).filter(
+        pending_tasks = self._task_table_rows(
             Task.status.in_(['pending', 'in_progress'])
-        ).limit(20).all()
+        ).limit(TASK_TABLE_LIMIT).all()
 
         self._add_task_table(story, pending_tasks, "Pending Tasks")
 
@@ -284,25 +412,28 @@ class PDFExporter:
         if not goal:
             return None
 
+        now = datetime.now()
         if filename is None:
-            safe_title = "".join(c for c in goal.title if c.isalnum() or c in (' ', '-', '_'))
-            filename = f"goal_{safe_title[:30]}_{datetime.now().strftime('%Y%m%d')}.pdf"
+            safe_title = UNSAFE_FILENAME_CHARS.sub('', goal.title)
+            filename = f"goal_{safe_title[:30]}_{now.strftime('%Y%m%d')}.pdf"
 
         doc, story, pdf_path = self._create_pdf_doc(filename)
 
         # Add header
-        self._add_header(story, f"Goal Report: {goal.title}")
+        self._add_header(story, f"Goal Report: {escape(goal.title)}", now=now)
 
         # Add goal details
         self._add_goal_progress(story, goal)
 
         # Get tasks for this goal
-        all_tasks = self.task_mgr.session.query(Task).filter(
-            Task.parent_goal_id == goal_id
-        ).all()
+        all_tasks = self._task_table_rows(Task.parent_goal_id == goal_id).all()
 
-        completed_tasks = [t for t in all_tasks if t.status == 'completed']
-        pending_tasks = [t for t in all_tasks if t.status in ['pending', 'in_progress']]
+        completed_tasks, pending_tasks = [], []
+        for t in all_tasks:
+            if t.status == 'completed':
+                completed_tasks.append(t)
+            elif t.status in ('pending', 'in_progress'):
+                pending_tasks.append(t)
 
         # Add task tables
         self._add_task_table(story, completed_tasks, "Completed Tasks")
@@ -321,37 +452,36 @@ class PDFExporter:
         Returns:
             Path to created PDF
         """
+        now = datetime.now()
         if filename is None:
-            filename = f"all_goals_{datetime.now().strftime('%Y%m%d')}.pdf"
+            filename = f"all_goals_{now.strftime('%Y%m%d')}.pdf"
 
         doc, story, pdf_path = self._create_pdf_doc(filename)
 
         # Add header
-        self._add_header(story, "All Active Goals")
+        self._add_header(story, "All Active Goals", now=now)
 
         goals = self.planner.get_active_goals()
 
         if not goals:
             story.append(Paragraph("No active goals found", self.styles['Normal']))
         else:
-            for goal in goals:
-                self._add_goal_progress(story, goal)
-
-                # Get task count for this goal
-                task_count = self.task_mgr.session.query(Task).filter(
-                    Task.parent_goal_id == goal.id
-                ).count()
-
-                completed_count = self.task_mgr.session.query(Task).filter(
-                    Task.parent_goal_id == goal.id,
-                    Task.status == 'completed'
-                ).count()
+            # Total and completed task counts for every goal in one query
+            counts = {
+                goal_id: (total, completed or 0)
+                for goal_id, total, completed in self.task_mgr.session.query(
+                    Task.parent_goal_id,
+                    func.count(Task.id),
+                    func.sum(case((Task.status == 'completed', 1), else_=0))
+                ).filter(
+                    Task.parent_goal_id.in_([goal.id for goal in goals])
+                ).group_by(Task.parent_goal_id)
+            }
 
-                story.append(Paragraph(
-                    f"Tasks: {completed_count}/{task_count} completed",
-                    self.styles['Normal']
-                ))
-                story.append(Spacer(1, 0.3*inch))
+            for goal in goals:
+                task_count, completed_count = counts.get(goal.id, (0, 0))
+                self._add_goal_progress(story, goal, (completed_count, task_count))
+                story.append(Spacer(1, 0.1*inch))
 
         # Build PDF
         doc.build(story)
@@ -373,16 +503,17 @@ class PDFExporter:
         Returns:
             Path to created PDF
         """
+        now = datetime.now()
         if filename is None:
-            filename = f"task_list_{datetime.now().strftime('%Y%m%d_%H%M%S')}.pdf"
+            filename = f"task_list_{now.strftime('%Y%m%d_%H%M%S')}.pdf"
 
         doc, story, pdf_path = self._create_pdf_doc(filename)
 
         # Add header
-        self._add_header(story, title)
+        self._add_header(story, title, now=now)
 
         # Add task table
-        self._add_task_table(story, tasks, f"{len(tasks)} Tasks")
+        self._add_task_table(story, tasks, f"{len(tasks)} Tasks", max_rows=None)
 
         # Build PDF
         doc.build(story)
@@ -413,17 +544,19 @@ class PDFExporter:
         date_range = f"{start_date.strftime('%Y-%m-%d')} to {end_date.strftime('%Y-%m-%d')}"
         self._add_header(story, "Date Range Report", date_range)
 
-        # Get tasks in date range
-        completed_tasks = self.task_mgr.session.query(Task).filter(
+        # Get tasks in date range (counted in SQL; only the table rows are fetched)
+        in_range = (
             Task.status == 'completed',
             Task.completed_at >= start_date,
             Task.completed_at <= end_date
-        ).all()
+        )
+        completed_count = self.task_mgr.session.query(func.count(Task.id)).filter(*in_range).scalar()
+        completed_tasks = self._task_table_rows(*in_range).limit(TASK_TABLE_LIMIT).all()
 
         # Calculate stats
-        velocity = len(completed_tasks) / max(1, (end_date - start_date).days)
+        velocity = completed_count / max(1, (end_date - start_date).days)
         stats = {
-            'tasks_completed': len(completed_tasks),
+            'tasks_completed': completed_count,
             'tasks_created': 0,  # Would need to track creation date
             'completion_rate': 100.0,  # Only showing completed
             'velocity': velocity
@@ -446,26 +579,29 @@ class PDFExporter:
         Returns:
             Path to created PDF
         """
+        now = datetime.now()
         if filename is None:
-            filename = f"velocity_report_{datetime.now().strftime('%Y%m%d')}.pdf"
+            filename = f"velocity_report_{now.strftime('%Y%m%d')}.pdf"
 
         doc, story, pdf_path = self._create_pdf_doc(filename)
 
         # Add header
-        self._add_header(story, f"Velocity Analysis ({days} days)")
+        self._add_header(story, f"Velocity Analysis ({days} days)", now=now)
 
         # Calculate velocity
         velocity = self.task_mgr.get_task_velocity(days=days)
 
         # Get completed tasks
-        start_date = datetime.now() - timedelta(days=days)
-        completed_tasks = self.task_mgr.session.query(Task).filter(
+        start_date = now - timedelta(days=days)
+        in_period = (
             Task.status == 'completed',
             Task.completed_at >= start_date
-        ).all()
+        )
+        completed_count = self.task_mgr.session.query(func.count(Task.id)).filter(*in_period).scalar()
+        completed_tasks = self._task_table_rows(*in_period).limit(TASK_TABLE_LIMIT).all()
 
         stats = {
-            'tasks_completed': len(completed_tasks),
+            'tasks_completed': completed_count,
             'tasks_created': 0,
             'completion_rate': 100.0,
             'velocity': velocity
@@ -495,11 +631,11 @@ class PDFExporter:
         Returns:
             Path to created PDF
         """
+        end_date = datetime.now()
         if filename is None:
-            filename = f"monthly_report_{datetime.now().strftime('%Y%m')}.pdf"
+            filename = f"monthly_report_{end_date.strftime('%Y%m')}.pdf"
 
         # Use 30 days as approximation of month
-        start_date = datetime.now() - timedelta(days=30)
-        end_date = datetime.now()
+        start_date = end_date - timedelta(days=30)
 
         return self.export_date_range_report(start_date, end_date, filename)
@@ -11,17 +11,16 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 
 from agent.core import BusinessAgent
 from agent.planner import BusinessPlanner
-from agent.tasks import TaskManager
 from agent.models import get_session, BusinessPlan
+from agent.utils import format_progress_bar, load_env, pace_ai_request
 from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 from rich.prompt import Prompt, Confirm
 from rich.markdown import Markdown
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
-load_dotenv()
+load_env()
 console = Console()
 
 def review_business_plan():
@@ -33,8 +32,10 @@ def review_business_plan():
         console.print(f"[bold blue]{'='*70}[/bold blue]")
         console.print()
 
+        # The planner's TaskManager shares its session, so every query
+        # in the review runs on one connection
         planner = BusinessPlanner()
-        task_mgr = TaskManager()
+        task_mgr = planner.task_mgr
         agent = BusinessAgent()
 
         # Get active business plan
@@ -66,12 +67,11 @@ def review_business_plan():
         console.print("\n[bold]🎯 Goals Overview[/bold]\n")
         all_goals = planner.get_active_goals()
 
-        # Recalculate progress for all goals
-        for goal in all_goals:
-            planner.calculate_goal_progress(goal.id)
+        # Recalculate progress for all goals in one batch
+        planner.calculate_goal_progress_bulk(goal.id for goal in all_goals)
 
-        # Refresh goals after recalculation
-        all_goals = planner.get_active_goals()
+        # Refresh the goals shown after recalculation
+        all_goals = planner.get_active_goals(limit=10)
 
         if all_goals:
             goals_table = Table(show_header=True, header_style="bold cyan")
@@ -80,8 +80,8 @@ def review_business_plan():
             goals_table.add_column("Progress", justify="right")
             goals_table.add_column("Target Date")
 
-            for goal in all_goals[:10]:
-                progress_bar = "█" * int(goal.progress_percentage / 10) + "░" * (10 - int(goal.progress_percentage / 10))
+            for goal in all_goals:
+                progress_bar = format_progress_bar(goal.progress_percentage)
                 target = goal.target_date.strftime('%Y-%m-%d') if goal.target_date else "Not set"
                 goals_table.add_row(
                     goal.horizon.upper(),
@@ -96,13 +96,12 @@ def review_business_plan():
 
         # Get task summary
         console.print("\n[bold]📋 Task Summary[/bold]\n")
-        weekly_stats = task_mgr.get_weekly_task_stats()
-        today_tasks = task_mgr.get_tasks_for_today()
-        overdue = task_mgr.get_overdue_tasks()
+        weekly_stats = task_mgr.get_weekly_task_stats(include_tasks=False)
+        open_counts = task_mgr.get_open_task_counts()
 
         console.print(f"  • This Week: {weekly_stats['tasks_completed_this_week']} completed ({weekly_stats['completion_rate']:.1f}% completion rate)")
-        console.print(f"  • Today: {len(today_tasks)} tasks scheduled")
-        console.print(f"  • Overdue: {len(overdue)} tasks")
+        console.print(f"  • Today: {open_counts['today']} tasks scheduled")
+        console.print(f"  • Overdue: {open_counts['overdue']} tasks")
 
         # AI Analysis
         console.print("\n[dim]Generating AI analysis...[/dim]")
@@ -126,7 +125,7 @@ EXECUTION METRICS:
 - Tasks Completed This Week: {weekly_stats['tasks_completed_this_week']}
 - Tasks Created This Week: {weekly_stats['tasks_created_this_week']}
 - Completion Rate: {weekly_stats['completion_rate']:.1f}%
-- Tasks Overdue: {len(overdue)}
+- Tasks Overdue: {open_counts['overdue']}
 
 Provide:
 1. **Plan-Goal Alignment** - Are the goals aligned with the business plan?
@@ -136,6 +135,7 @@ Provide:
 
 Be concise and actionable."""
 
+        pace_ai_request()
         analysis = agent.client.messages.create(
             model=agent.model,
             max_tokens=2000,
@@ -151,7 +151,6 @@ Be concise and actionable."""
 
         console.print()
         planner.close()
-        task_mgr.close()
 
     except Exception as e:
         console.print(f"[bold red]❌ Error reviewing plan:[/bold red] {e}")
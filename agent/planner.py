@@ -1,28 +1,125 @@
 from datetime import datetime, timedelta
-from sqlalchemy import and_, or_
+from sqlalchemy import and_, or_, case, func, update
+from agent.llm_cache import cached_response, response_cache_key, store_response
 from agent.models import Goal, BusinessPlan, Task, get_session
-from agent.tasks import TaskManager
-from agent.utils import get_repository_context
-import anthropic
+from agent.tasks import TaskManager, sync_goal_task_counters
+from agent.utils import get_anthropic_client, get_repository_context, pace_ai_request
+from concurrent.futures import ThreadPoolExecutor
 import os
 import json
+import re
+
+# Static instructions for the AI planning calls. They go first, as the system
+# prompt, and are byte-identical on every call so Anthropic's prompt cache can
+# reuse them (the API only caches prefixes of at least 1024 tokens on Sonnet,
+# so shorter ones are simply processed as usual). Per-goal details follow in
+# the user message.
+TASK_PLANNING_INSTRUCTIONS = """You are a business planning assistant that turns goals into specific, actionable tasks.
+
+For each task, provide:
+
+1. Title (clear, action-oriented)
+2. Description (what needs to be done)
+3. Estimated hours
+4. Priority (1-5, where 1 is highest)
+5. Category (development, marketing, operations, finance, etc.)
+6. Dependencies (if any, reference other task numbers)
+
+Format your response as a JSON array of tasks:
+[
+  {
+    "title": "Task title",
+    "description": "Detailed description",
+    "estimated_hours": 2.5,
+    "priority": 1,
+    "category": "development",
+    "dependencies": []
+  },
+  ...
+]
+
+Only return the JSON array, no additional text."""
+
+GOAL_HIERARCHY_INSTRUCTIONS = """You are a business planning assistant that breaks yearly goals into quarterly milestones.
+
+Create 4 quarterly milestones (Q1, Q2, Q3, Q4) that would logically lead to achieving the yearly goal.
+
+Return as JSON:
+[
+  {
+    "title": "Q1 goal title",
+    "description": "What to achieve in Q1",
+    "success_criteria": "How to measure success"
+  },
+  ...
+]"""
+
+TASK_PLANNING_SYSTEM = [
+    {"type": "text", "text": TASK_PLANNING_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}}
+]
+GOAL_HIERARCHY_SYSTEM = [
+    {"type": "text", "text": GOAL_HIERARCHY_INSTRUCTIONS, "cache_control": {"type": "ephemeral"}}
+]
+
+# A reply wrapped in a markdown code block (optionally tagged json)
+JSON_FENCE = re.compile(r'^```(?:json)?(.*?)(?:```|\Z)', re.DOTALL)
+
+def parse_json_reply(response_text):
+    """Parse a JSON reply from Claude, removing a markdown code block if present"""
+    match = JSON_FENCE.match(response_text)
+    if match:
+        response_text = match.group(1).strip()
+    return json.loads(response_text)
+
+def parse_json_items(response_text):
+    """
+    Parse a JSON list of tasks or goals from Claude and check its shape.
+
+    Raises:
+        ValueError: If the reply is not a list of objects that each have a
+            string title and description. Callers check before writing, so a
+            malformed reply never leaves a partial set of rows behind.
+    """
+    items = parse_json_reply(response_text)
+    if not isinstance(items, list):
+        raise ValueError("Expected a JSON list")
+    for i, item in enumerate(items):
+        if not (isinstance(item, dict)
+                and isinstance(item.get('title'), str)
+                and isinstance(item.get('description'), str)):
+            raise ValueError(f"Item {i} needs a string title and description")
+    return items
 
 class BusinessPlanner:
-    def __init__(self, project_filter=True):
+    def __init__(self, project_filter=True, session=None):
         """
         Initialize BusinessPlanner.
 
         Args:
             project_filter: If True, filter goals by current repository context.
                            If False (--global mode), show all goals.
+            session: Existing session to share (default: open a new one)
         """
-        self.session = get_session()
+        self.session = session if session is not None else get_session()
         self.project_filter = project_filter
         self.context = get_repository_context() if project_filter else None
-        self.task_mgr = TaskManager(project_filter=project_filter)
-        self.client = anthropic.Anthropic(api_key=os.getenv('ANTHROPIC_API_KEY'))
+        # Goals and their tasks share one session, so counters and progress
+        # written through either side are visible to the other
+        self.task_mgr = TaskManager(project_filter=project_filter, session=self.session)
+        self._client = None  # Created on first AI call; most commands never need it
         self.model = "claude-sonnet-4-20250514"
 
+    @property
+    def client(self):
+        """Anthropic client shared by every planner and agent in the process"""
+        if self._client is None:
+            self._client = get_anthropic_client(os.getenv('ANTHROPIC_API_KEY'))
+        return self._client
+
+    @client.setter
+    def client(self, client):
+        self._client = client
+
     def _apply_project_filter(self, query):
         """Apply project filtering to a query if project_filter is enabled."""
         if self.project_filter and self.context:
@@ -41,12 +138,10 @@ class BusinessPlanner:
                            key_activities=None, key_partnerships=None, 
                            cost_structure=None, version="1.0"):
         """Create a new business plan"""
-        # Deactivate old plans
-        old_plans = self.session.query(BusinessPlan).filter(
+        # Deactivate old plans (one UPDATE, committed with the new plan)
+        self.session.query(BusinessPlan).filter(
             BusinessPlan.is_active == True
-        ).all()
-        for plan in old_plans:
-            plan.is_active = False
+        ).update({BusinessPlan.is_active: False})
         
         plan = BusinessPlan(
             version=version,
@@ -92,23 +187,25 @@ class BusinessPlanner:
             parent_goal_id=parent_goal_id,
             metrics=metrics or {},
             project_name=project_name,
-            repository_path=repository_path
+            repository_path=repository_path,
+            total_tasks=0,
+            completed_tasks=0
         )
         self.session.add(goal)
         self.session.commit()
         return goal
     
     def get_goal(self, goal_id):
-        """Get a specific goal"""
-        return self.session.query(Goal).filter(Goal.id == goal_id).first()
+        """Get a specific goal (served from the session's identity map when already loaded)"""
+        return self.session.get(Goal, goal_id)
     
-    def get_active_goals(self):
-        """Get all active goals"""
+    def get_active_goals(self, limit=None):
+        """Get active goals ordered by horizon and target date (at most limit, if given)"""
         query = self.session.query(Goal).filter(
             Goal.status == 'active'
         )
         query = self._apply_project_filter(query)
-        return query.order_by(Goal.horizon, Goal.target_date).all()
+        return query.order_by(Goal.horizon, Goal.target_date).limit(limit).all()
     
     def get_goals_by_horizon(self, horizon):
         """Get goals for a specific time horizon"""
@@ -121,12 +218,15 @@ class BusinessPlanner:
         query = self._apply_project_filter(query)
         return query.order_by(Goal.target_date).all()
     
-    def update_goal_progress(self, goal_id, progress_percentage):
-        """Update goal progress"""
+    def update_goal_progress(self, goal_id, progress_percentage, total_tasks=None, completed_tasks=None):
+        """Update goal progress, optionally resyncing the cached task counters"""
         goal = self.get_goal(goal_id)
         if goal:
             goal.progress_percentage = progress_percentage
             goal.updated_at = datetime.now()
+            if total_tasks is not None:
+                goal.total_tasks = total_tasks
+                goal.completed_tasks = completed_tasks
             
             # Auto-complete if 100%
             if progress_percentage >= 100:
@@ -134,20 +234,80 @@ class BusinessPlanner:
             
             self.session.commit()
         return goal
+
+    @staticmethod
+    def _progress_values(progress, total_tasks, completed_tasks, now):
+        """Column values written when recalculated progress is stored for a goal"""
+        values = {
+            'progress_percentage': progress,
+            'total_tasks': total_tasks,
+            'completed_tasks': completed_tasks,
+            'updated_at': now
+        }
+        # Auto-complete if 100%
+        if progress >= 100:
+            values['status'] = 'completed'
+        return values
     
     def calculate_goal_progress(self, goal_id):
         """Calculate goal progress based on completed tasks"""
-        tasks = self.task_mgr.get_tasks_by_goal(goal_id)
-        if not tasks:
+        # Count in SQLite (from ix_task_goal_status) instead of loading the tasks
+        query = self.task_mgr.session.query(
+            func.count(Task.id),
+            func.sum(case((Task.status == 'completed', 1), else_=0))
+        ).filter(Task.parent_goal_id == goal_id)
+        total, completed = self.task_mgr._apply_project_filter(query).one()
+        if not total:
             return 0
 
-        completed = len([t for t in tasks if t.status == 'completed'])
-        progress = (completed / len(tasks)) * 100
+        progress = (completed / total) * 100
 
-        # Update the goal
-        self.update_goal_progress(goal_id, progress)
+        # Update the goal in place (also reconciles any drift in the cached
+        # counters); an already-loaded instance is refreshed by the evaluator
+        self.session.query(Goal).filter(Goal.id == goal_id).update(
+            self._progress_values(progress, total, completed, datetime.now())
+        )
+        self.session.commit()
         return progress
 
+    def calculate_goal_progress_bulk(self, goal_ids):
+        """
+        Recalculate progress for several goals in one pass.
+
+        Counts tasks for every goal with a single GROUP BY query and writes
+        the results back as one batched UPDATE. Goals without tasks are left
+        untouched and goals reaching 100% are auto-completed, matching
+        calculate_goal_progress().
+
+        Returns:
+            Dict mapping goal ID to progress percentage
+        """
+        goal_ids = list(goal_ids)
+        if not goal_ids:
+            return {}
+
+        query = self.task_mgr.session.query(
+            Task.parent_goal_id,
+            func.count(Task.id),
+            func.sum(case((Task.status == 'completed', 1), else_=0))
+        ).filter(Task.parent_goal_id.in_(goal_ids))
+        query = self.task_mgr._apply_project_filter(query)
+        counts = query.group_by(Task.parent_goal_id).all()
+
+        progress_by_goal = {goal_id: 0 for goal_id in goal_ids}
+        now = datetime.now()
+        rows = []
+        for goal_id, total, completed in counts:
+            progress = (completed / total) * 100
+            progress_by_goal[goal_id] = progress
+            rows.append({'id': goal_id, **self._progress_values(progress, total, completed, now)})
+
+        if rows:
+            # ORM bulk UPDATE by primary key: one executemany per column set
+            self.session.execute(update(Goal), rows)
+            self.session.commit()
+        return progress_by_goal
+
     def assign_goal_to_project(self, goal_id, project_name, repository_path=None):
         """Assign a goal to a specific project"""
         goal = self.session.query(Goal).filter_by(id=goal_id).first()
@@ -167,14 +327,66 @@ class BusinessPlanner:
         return query.all()
 
     # === Goal Breakdown (AI-Powered) ===
-    
-    def break_down_goal(self, goal_id):
-        """Use AI to break down a goal into actionable tasks"""
-        goal = self.get_goal(goal_id)
-        if not goal:
+
+    def _request_completion(self, system, prompt, max_tokens):
+        """Send a single-message request to Claude and return the reply text (thread-safe)"""
+        pace_ai_request()
+        message = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            system=system,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return message.content[0].text.strip()
+
+    def _response_cache_key(self, system, prompt, max_tokens):
+        """Hash identifying a request in the ai_response_cache table"""
+        return response_cache_key(self.model, system, prompt, max_tokens)
+
+    def _cached_response(self, prompt_hash):
+        """Return the stored reply for a request hash, or None if missing or expired"""
+        return cached_response(self.session, prompt_hash)
+
+    def _store_response(self, prompt_hash, response_text):
+        """Store (or refresh) the reply for a request hash"""
+        store_response(self.session, prompt_hash, response_text)
+
+    def _cached_items(self, system, prompt, max_tokens, use_cache=True):
+        """
+        Return the parsed JSON list (see parse_json_items) Claude replies with.
+
+        Replies are stored in the ai_response_cache table keyed by a hash of
+        the model, max_tokens, system prompt and prompt, so an identical
+        request within llm_cache.AI_RESPONSE_TTL skips the API call. Only
+        replies that parse are stored, so a truncated or malformed reply is
+        never replayed.
+        """
+        if not use_cache:
+            return parse_json_items(self._request_completion(system, prompt, max_tokens))
+
+        prompt_hash = self._response_cache_key(system, prompt, max_tokens)
+        items = self._parsed_cached_response(prompt_hash)
+        if items is not None:
+            return items
+
+        response_text = self._request_completion(system, prompt, max_tokens)
+        items = parse_json_items(response_text)
+        self._store_response(prompt_hash, response_text)
+        return items
+
+    def _parsed_cached_response(self, prompt_hash):
+        """Parsed stored reply for a request hash, or None if missing, expired or unparseable"""
+        cached = self._cached_response(prompt_hash)
+        if cached is None:
             return None
-        
-        business_plan = self.get_active_business_plan()
+        try:
+            return parse_json_items(cached)
+        except ValueError:  # Includes json.JSONDecodeError
+            return None
+
+    @staticmethod
+    def _breakdown_prompt(goal, business_plan):
+        """Build the per-goal part of a breakdown request"""
         context = ""
         if business_plan:
             context = f"""
@@ -184,7 +396,7 @@ Business Context:
 - Value Proposition: {business_plan.value_proposition}
 """
         
-        prompt = f"""{context}
+        return f"""{context}
 
 I need help breaking down this business goal into actionable tasks:
 
@@ -194,87 +406,132 @@ TIME HORIZON: {goal.horizon}
 TARGET DATE: {goal.target_date.strftime('%Y-%m-%d') if goal.target_date else 'Not set'}
 SUCCESS CRITERIA: {goal.success_criteria or 'Not defined'}
 
-Please break this goal down into 5-10 specific, actionable tasks that would help achieve this goal. For each task, provide:
+Please break this goal down into 5-10 specific, actionable tasks that would help achieve this goal."""
 
-1. Title (clear, action-oriented)
-2. Description (what needs to be done)
-3. Estimated hours
-4. Priority (1-5, where 1 is highest)
-5. Category (development, marketing, operations, finance, etc.)
-6. Dependencies (if any, reference other task numbers)
+    def _create_breakdown_tasks(self, goal, tasks_data):
+        """Persist a parsed breakdown reply's tasks in one transaction"""
+        # Build all tasks up front and persist them in a single transaction
+        # (one flush + one commit instead of a commit per task)
+        repo_context = get_repository_context()
+        created_tasks = []
 
-Format your response as a JSON array of tasks:
-[
-  {{
-    "title": "Task title",
-    "description": "Detailed description",
-    "estimated_hours": 2.5,
-    "priority": 1,
-    "category": "development",
-    "dependencies": []
-  }},
-  ...
-]
+        # Distribute due dates evenly before the goal's target date, all
+        # measured from the same instant
+        now = datetime.now()
+        days_per_task = None
+        if goal.target_date and tasks_data:
+            days_per_task = (goal.target_date - now).days / len(tasks_data)
 
-Only return the JSON array, no additional text."""
+        for i, task_data in enumerate(tasks_data):
+            due_date = None
+            if days_per_task is not None:
+                due_date = now + timedelta(days=days_per_task * (i + 1))
+
+            created_tasks.append(Task(
+                title=task_data['title'],
+                description=task_data['description'],
+                estimated_hours=task_data.get('estimated_hours'),
+                priority=task_data.get('priority', 3),
+                category=task_data.get('category'),
+                due_date=due_date,
+                parent_goal_id=goal.id,
+                dependencies=[],  # Will update once IDs are assigned
+                tags=[],
+                project_name=repo_context['project_name'],
+                repository_path=repo_context['repository_path']
+            ))
+
+        self.session.add_all(created_tasks)
+        self.session.flush()  # Batched INSERT; assigns IDs for dependency mapping
+
+        # Map array index to actual task ID
+        task_id_mapping = {i: task.id for i, task in enumerate(created_tasks)}
+
+        # Update dependencies
+        for i, task_data in enumerate(tasks_data):
+            if task_data.get('dependencies'):
+                dep_ids = [task_id_mapping[dep_idx] for dep_idx in task_data['dependencies']
+                          if dep_idx in task_id_mapping]
+                created_tasks[i].dependencies = dep_ids
+
+        sync_goal_task_counters(self.session, goal.id, total_delta=len(created_tasks))
+        self.session.commit()
+        return created_tasks
+    
+    def break_down_goal(self, goal_id, use_cache=True):
+        """Use AI to break down a goal into actionable tasks (use_cache=False asks for a fresh breakdown)"""
+        goal = self.get_goal(goal_id)
+        if not goal:
+            return None
+
+        prompt = self._breakdown_prompt(goal, self.get_active_business_plan())
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
-                messages=[{"role": "user", "content": prompt}]
+            tasks_data = self._cached_items(
+                TASK_PLANNING_SYSTEM, prompt, max_tokens=3000, use_cache=use_cache
             )
-            
-            response_text = message.content[0].text.strip()
-            
-            # Remove markdown code blocks if present
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            tasks_data = json.loads(response_text)
-            
-            # Create tasks in database
-            created_tasks = []
-            task_id_mapping = {}  # Map array index to actual task ID
-            
-            for i, task_data in enumerate(tasks_data):
-                # Calculate due date based on goal target date
-                due_date = None
-                if goal.target_date:
-                    # Distribute tasks evenly before target date
-                    days_until_target = (goal.target_date - datetime.now()).days
-                    task_offset = (days_until_target / len(tasks_data)) * (i + 1)
-                    due_date = datetime.now() + timedelta(days=task_offset)
-                
-                task = self.task_mgr.create_task(
-                    title=task_data['title'],
-                    description=task_data['description'],
-                    estimated_hours=task_data.get('estimated_hours'),
-                    priority=task_data.get('priority', 3),
-                    category=task_data.get('category'),
-                    due_date=due_date,
-                    parent_goal_id=goal_id,
-                    dependencies=[]  # Will update after all tasks created
-                )
-                created_tasks.append(task)
-                task_id_mapping[i] = task.id
-            
-            # Update dependencies
-            for i, task_data in enumerate(tasks_data):
-                if task_data.get('dependencies'):
-                    dep_ids = [task_id_mapping[dep_idx] for dep_idx in task_data['dependencies'] 
-                              if dep_idx in task_id_mapping]
-                    created_tasks[i].dependencies = dep_ids
-            
-            self.session.commit()
-            return created_tasks
+            return self._create_breakdown_tasks(goal, tasks_data)
             
         except Exception as e:
+            self.session.rollback()
             print(f"Error breaking down goal: {e}")
             return None
+
+    def break_down_goals(self, goal_ids, use_cache=True, max_workers=4):
+        """
+        Break down several goals, sending their AI requests concurrently.
+
+        The requests spend their time waiting on the network, so they run on
+        a small thread pool. Cache lookups, parsing and inserts stay on the
+        calling thread, which owns the session.
+
+        Returns:
+            Dict mapping each goal ID to its created tasks (None if the goal
+            is missing or its breakdown failed)
+        """
+        results = {goal_id: None for goal_id in goal_ids}
+        goals = [goal for goal in (self.get_goal(goal_id) for goal_id in results) if goal]
+        business_plan = self.get_active_business_plan()
+
+        prompts = {goal.id: self._breakdown_prompt(goal, business_plan) for goal in goals}
+        parsed = {}
+        misses = {}
+        for goal_id, prompt in prompts.items():
+            prompt_hash = self._response_cache_key(TASK_PLANNING_SYSTEM, prompt, 3000)
+            cached = self._parsed_cached_response(prompt_hash) if use_cache else None
+            if cached is not None:
+                parsed[goal_id] = cached
+            else:
+                misses[goal_id] = prompt_hash
+
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as pool:
+                futures = {
+                    goal_id: pool.submit(
+                        self._request_completion, TASK_PLANNING_SYSTEM, prompts[goal_id], 3000
+                    )
+                    for goal_id in misses
+                }
+            for goal_id, future in futures.items():
+                try:
+                    response_text = future.result()
+                    parsed[goal_id] = parse_json_items(response_text)
+                except Exception as e:
+                    print(f"Error breaking down goal {goal_id}: {e}")
+                    continue
+                # Stored only once it parses, so a bad reply is never replayed
+                if use_cache:
+                    self._store_response(misses[goal_id], response_text)
+
+        for goal in goals:
+            if goal.id not in parsed:
+                continue
+            try:
+                results[goal.id] = self._create_breakdown_tasks(goal, parsed[goal.id])
+            except Exception as e:
+                self.session.rollback()
+                print(f"Error breaking down goal {goal.id}: {e}")
+        return results
     
     def suggest_next_tasks(self, goal_id, num_tasks=3):
         """Use AI to suggest next tasks based on current progress"""
@@ -282,12 +539,14 @@ Only return the JSON array, no additional text."""
         if not goal:
             return None
         
-        existing_tasks = self.task_mgr.get_tasks_by_goal(goal_id)
-        completed_tasks = [t for t in existing_tasks if t.status == 'completed']
-        pending_tasks = [t for t in existing_tasks if t.status in ['pending', 'in_progress']]
+        # Only the first ten titles of each kind go into the prompt
+        completed_tasks = self.task_mgr.get_tasks_by_goal_and_status(goal_id, ['completed'], limit=10)
+        pending_tasks = self.task_mgr.get_tasks_by_goal_and_status(
+            goal_id, ['pending', 'in_progress'], limit=10
+        )
         
-        completed_str = "\n".join([f"- {t.title}" for t in completed_tasks[:10]])
-        pending_str = "\n".join([f"- {t.title} ({t.status})" for t in pending_tasks[:10]])
+        completed_str = "\n".join(f"- {t.title}" for t in completed_tasks)
+        pending_str = "\n".join(f"- {t.title} ({t.status})" for t in pending_tasks)
         
         prompt = f"""Given this goal and current progress, suggest {num_tasks} next actionable tasks:
 
@@ -305,45 +564,31 @@ Suggest {num_tasks} new tasks that would best advance this goal right now. Consi
 - What's already been accomplished
 - What's currently in progress
 - Natural next steps
-- Quick wins vs. strategic moves
-
-Return as JSON array with same format as before."""
+- Quick wins vs. strategic moves"""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
+            # Suggestions should reflect the goal's latest progress, so never reuse them
+            tasks_data = self._cached_items(
+                TASK_PLANNING_SYSTEM, prompt, max_tokens=2000, use_cache=False
             )
             
-            response_text = message.content[0].text.strip()
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            tasks_data = json.loads(response_text)
-            
-            created_tasks = []
-            for task_data in tasks_data:
-                task = self.task_mgr.create_task(
-                    title=task_data['title'],
-                    description=task_data['description'],
-                    estimated_hours=task_data.get('estimated_hours'),
-                    priority=task_data.get('priority', 3),
-                    category=task_data.get('category'),
-                    parent_goal_id=goal_id
-                )
-                created_tasks.append(task)
-            
-            return created_tasks
+            return self.task_mgr.create_tasks_bulk([
+                {
+                    'title': task_data['title'],
+                    'description': task_data['description'],
+                    'estimated_hours': task_data.get('estimated_hours'),
+                    'priority': task_data.get('priority', 3),
+                    'category': task_data.get('category'),
+                    'parent_goal_id': goal_id
+                }
+                for task_data in tasks_data
+            ])
             
         except Exception as e:
             print(f"Error suggesting tasks: {e}")
             return None
     
-    def create_goal_hierarchy(self, yearly_goal_title, yearly_goal_description):
+    def create_goal_hierarchy(self, yearly_goal_title, yearly_goal_description, use_cache=True):
         """Create a full goal hierarchy: yearly -> quarterly -> monthly"""
         # Create yearly goal
         yearly_goal = self.create_goal(
@@ -357,36 +602,13 @@ Return as JSON array with same format as before."""
         prompt = f"""Break down this yearly goal into 4 quarterly goals:
 
 YEARLY GOAL: {yearly_goal_title}
-DESCRIPTION: {yearly_goal_description}
-
-Create 4 quarterly milestones (Q1, Q2, Q3, Q4) that would logically lead to achieving this yearly goal.
-
-Return as JSON:
-[
-  {{
-    "title": "Q1 goal title",
-    "description": "What to achieve in Q1",
-    "success_criteria": "How to measure success"
-  }},
-  ...
-]"""
+DESCRIPTION: {yearly_goal_description}"""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=2000,
-                messages=[{"role": "user", "content": prompt}]
+            quarterly_goals_data = self._cached_items(
+                GOAL_HIERARCHY_SYSTEM, prompt, max_tokens=2000, use_cache=use_cache
             )
             
-            response_text = message.content[0].text.strip()
-            if response_text.startswith('```'):
-                response_text = response_text.split('```')[1]
-                if response_text.startswith('json'):
-                    response_text = response_text[4:]
-                response_text = response_text.strip()
-            
-            quarterly_goals_data = json.loads(response_text)
-            
             quarterly_goals = []
             for i, qgoal_data in enumerate(quarterly_goals_data):
                 target = datetime.now() + timedelta(days=90 * (i + 1))
@@ -1,7 +1,22 @@
-import anthropic
 import os
-from datetime import datetime
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from agent.llm_cache import cached_response, response_cache_key, store_response
 from agent.models import ResearchItem, get_session
+from agent.utils import get_anthropic_client, pace_ai_request
+
+# Research is meant to be current, so stored replies expire much sooner
+# than planning ones
+RESEARCH_RESPONSE_TTL = timedelta(days=1)
+
+# Message Batch polling: start at BATCH_POLL_START seconds and double up to
+# BATCH_POLL_MAX between status checks
+BATCH_POLL_START = 5
+BATCH_POLL_MAX = 60
+# Stop waiting on a batch after this many seconds; it keeps running on
+# Anthropic's side and its results can still be collected there
+BATCH_MAX_WAIT = 60 * 60
 
 class ResearchAgent:
     def __init__(self):
@@ -9,20 +24,90 @@ class ResearchAgent:
         if not api_key:
             raise ValueError("ANTHROPIC_API_KEY environment variable not set")
         
-        self.client = anthropic.Anthropic(api_key=api_key)
+        self.client = get_anthropic_client(api_key)
         self.model = "claude-sonnet-4-20250514"
         self.session = get_session()
+        self.last_batch_id = None  # Most recent Message Batch submitted by batch_research
+
+    def _request_completion(self, prompt, max_tokens, on_text=None):
+        """
+        Send a single prompt to Claude and return the reply text (thread-safe).
+
+        With on_text the reply is streamed and each chunk is passed to it as
+        it arrives.
+        """
+        pace_ai_request()
+        if on_text:
+            chunks = []
+            with self.client.messages.stream(
+                model=self.model,
+                max_tokens=max_tokens,
+                messages=[{"role": "user", "content": prompt}]
+            ) as stream:
+                for text in stream.text_stream:
+                    chunks.append(text)
+                    on_text(text)
+            return "".join(chunks)
+
+        message = self.client.messages.create(
+            model=self.model,
+            max_tokens=max_tokens,
+            messages=[{"role": "user", "content": prompt}]
+        )
+        return message.content[0].text
+
+    def _completion(self, prompt, max_tokens, use_cache=True, on_text=None):
+        """
+        Return Claude's reply to a single prompt and whether it came from the cache.
+
+        An identical prompt asked within RESEARCH_RESPONSE_TTL is answered from
+        the ai_response_cache table instead of a new API call. on_text receives
+        streamed chunks (or the whole cached reply at once).
+        """
+        prompt_hash = response_cache_key(self.model, None, prompt, max_tokens)
+        if use_cache:
+            cached = cached_response(self.session, prompt_hash, ttl=RESEARCH_RESPONSE_TTL)
+            if cached is not None:
+                if on_text:
+                    on_text(cached)
+                return cached, True
+
+        response_text = self._request_completion(prompt, max_tokens, on_text)
+        store_response(self.session, prompt_hash, response_text)
+        return response_text, False
     
-    def research_topic(self, topic, business_goal, depth="standard"):
-        """Research a topic using Claude's web search capability"""
-        
+    def _partition_cached(self, prompts, use_cache, max_tokens=4000):
+        """
+        Split prompts into those answered from the response cache and the rest.
+
+        Returns:
+            (responses, misses): responses maps a prompt's index to
+            (cached_text, True); misses maps the remaining indexes to the
+            cache key their reply should be stored under
+        """
+        responses = {}
+        misses = {}
+        for i, prompt in enumerate(prompts):
+            prompt_hash = response_cache_key(self.model, None, prompt, max_tokens)
+            cached = None
+            if use_cache:
+                cached = cached_response(self.session, prompt_hash, ttl=RESEARCH_RESPONSE_TTL)
+            if cached is not None:
+                responses[i] = (cached, True)
+            else:
+                misses[i] = prompt_hash
+        return responses, misses
+
+    @staticmethod
+    def _topic_prompt(topic, business_goal, depth):
+        """Build the request for researching one topic"""
         depth_guidance = {
             "quick": "Use 1-2 web searches to get a quick overview",
             "standard": "Use 3-5 web searches to get comprehensive information",
             "deep": "Use 5-10 web searches for thorough, multi-angle research"
         }
         
-        prompt = f"""Research this topic for my business:
+        return f"""Research this topic for my business:
 
 TOPIC: {topic}
 
@@ -41,41 +126,169 @@ Please research this topic and provide:
 
 Use web search to gather current information. Be thorough and practical."""
 
+    @staticmethod
+    def _topic_research_item(topic, prompt, depth, research_text, cache_hit):
+        """Build the ResearchItem recording a topic's findings"""
+        return ResearchItem(
+            title=topic,
+            summary=research_text,
+            category="general",
+            date_found=datetime.now(),
+            raw_data={"prompt": prompt, "depth": depth, "cache_hit": cache_hit}
+        )
+
+    @staticmethod
+    def _topic_result(topic, research_item):
+        """Result dict returned for a saved topic"""
+        return {
+            'research_id': research_item.id,
+            'topic': topic,
+            'findings': research_item.summary,
+            'date': datetime.now()
+        }
+
+    def _save_topic_research(self, topic, prompt, depth, research_text, cache_hit):
+        """Store a topic's findings as a ResearchItem and return the result dict"""
+        research_item = self._topic_research_item(topic, prompt, depth, research_text, cache_hit)
+        self.session.add(research_item)
+        self.session.commit()
+        return self._topic_result(topic, research_item)
+
+    def research_topic(self, topic, business_goal, depth="standard", use_cache=True, on_text=None):
+        """Research a topic using Claude's web search capability (on_text receives streamed chunks)"""
+        prompt = self._topic_prompt(topic, business_goal, depth)
+
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=4000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            research_text = message.content[0].text
-            
-            # Save to database
-            research_item = ResearchItem(
-                title=topic,
-                summary=research_text,
-                category="general",
-                date_found=datetime.now(),
-                raw_data={"prompt": prompt, "depth": depth}
-            )
-            self.session.add(research_item)
-            self.session.commit()
-            
-            return {
-                'research_id': research_item.id,
-                'topic': topic,
-                'findings': research_text,
-                'date': datetime.now()
-            }
+            research_text, cache_hit = self._completion(prompt, 4000, use_cache, on_text)
+            return self._save_topic_research(topic, prompt, depth, research_text, cache_hit)
             
         except Exception as e:
             return {
                 'error': str(e),
                 'topic': topic
             }
+
+    def research_topics(self, topics, business_goal, depth="standard", use_cache=True, max_workers=4):
+        """
+        Research several topics, sending their AI requests concurrently.
+
+        The requests spend their time waiting on the network, so they run on
+        a small thread pool. Cache lookups and saving results stay on the
+        calling thread, which owns the session.
+
+        Returns:
+            One result dict per topic, in the order given (with an 'error'
+            key for topics whose request failed)
+        """
+        prompts = [self._topic_prompt(topic, business_goal, depth) for topic in topics]
+        responses, misses = self._partition_cached(prompts, use_cache)
+
+        errors = {}
+        if misses:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(misses))) as pool:
+                futures = {
+                    i: pool.submit(self._request_completion, prompts[i], 4000)
+                    for i in misses
+                }
+            for i, future in futures.items():
+                try:
+                    responses[i] = (future.result(), False)
+                except Exception as e:
+                    errors[i] = str(e)
+                    continue
+                store_response(self.session, misses[i], responses[i][0])
+
+        results = []
+        for i, topic in enumerate(topics):
+            if i in errors:
+                results.append({'error': errors[i], 'topic': topic})
+                continue
+            research_text, cache_hit = responses[i]
+            results.append(
+                self._save_topic_research(topic, prompts[i], depth, research_text, cache_hit)
+            )
+        return results
     
-    def research_competitors(self, business_domain, your_offering):
-        """Research competitive landscape"""
+    def batch_research(self, items, depth="standard", use_cache=True, max_wait=BATCH_MAX_WAIT):
+        """
+        Research many topics through one Message Batch.
+
+        Batches are billed at half the price of individual requests but can
+        take minutes to finish, so this blocks while polling the batch with
+        exponential backoff, for at most max_wait seconds. The submitted
+        batch's id is kept in self.last_batch_id so it can be collected or
+        cancelled after a timeout or interrupt. Topics answered from the
+        response cache are not sent. All findings and cached replies are
+        saved in a single commit once the batch ends.
+
+        Args:
+            items: (topic, business_goal) pairs
+            depth: Research depth applied to every topic
+            max_wait: Seconds to wait for the batch before giving up on it
+
+        Returns:
+            One result dict per item, in the order given (with an 'error'
+            key for topics whose request failed)
+        """
+        prompts = [self._topic_prompt(topic, goal, depth) for topic, goal in items]
+        responses, misses = self._partition_cached(prompts, use_cache)
+
+        errors = {}
+        if misses:
+            try:
+                pace_ai_request()
+                batch = self.client.messages.batches.create(requests=[
+                    {
+                        "custom_id": str(i),
+                        "params": {
+                            "model": self.model,
+                            "max_tokens": 4000,
+                            "messages": [{"role": "user", "content": prompts[i]}]
+                        }
+                    }
+                    for i in misses
+                ])
+                self.last_batch_id = batch.id
+                delay = BATCH_POLL_START
+                waited = 0
+                while batch.processing_status != "ended":
+                    if waited >= max_wait:
+                        raise TimeoutError(
+                            f"Batch {batch.id} still processing after {waited}s; "
+                            f"collect or cancel it from the Anthropic console"
+                        )
+                    time.sleep(delay)
+                    waited += delay
+                    delay = min(delay * 2, BATCH_POLL_MAX)
+                    batch = self.client.messages.batches.retrieve(batch.id)
+
+                for entry in self.client.messages.batches.results(batch.id):
+                    i = int(entry.custom_id)
+                    if entry.result.type == "succeeded":
+                        responses[i] = (entry.result.message.content[0].text, False)
+                        store_response(self.session, misses[i], responses[i][0], commit=False)
+                    else:
+                        errors[i] = f"Batch request {entry.result.type}"
+            except Exception as e:
+                errors.update({i: str(e) for i in misses if i not in responses})
+
+        research_items = {
+            i: self._topic_research_item(items[i][0], prompts[i], depth, *responses[i])
+            for i in range(len(items)) if i in responses
+        }
+        self.session.add_all(research_items.values())
+        self.session.commit()
+
+        results = []
+        for i, (topic, _) in enumerate(items):
+            if i in research_items:
+                results.append(self._topic_result(topic, research_items[i]))
+            else:
+                results.append({'error': errors.get(i, "No result returned"), 'topic': topic})
+        return results
+
+    def research_competitors(self, business_domain, your_offering, use_cache=True, on_text=None):
+        """Research competitive landscape (on_text receives streamed chunks)"""
         
         prompt = f"""Research the competitive landscape for my business:
 
@@ -109,13 +322,7 @@ Use web search to find and analyze:
 Be specific and cite sources where possible."""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=5000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            research_text = message.content[0].text
+            research_text, cache_hit = self._completion(prompt, 5000, use_cache, on_text)
             
             # Save to database
             research_item = ResearchItem(
@@ -125,7 +332,8 @@ Be specific and cite sources where possible."""
                 date_found=datetime.now(),
                 raw_data={
                     "domain": business_domain,
-                    "offering": your_offering
+                    "offering": your_offering,
+                    "cache_hit": cache_hit
                 }
             )
             self.session.add(research_item)
@@ -150,9 +358,8 @@ Be specific and cite sources where possible."""
         items = query.order_by(ResearchItem.date_found.desc()).limit(limit).all()
         return [item.to_dict() for item in items]
     
-    def weekly_intelligence_report(self, business_focus_areas):
+    def weekly_intelligence_report(self, business_focus_areas, use_cache=True):
         """Generate a weekly intelligence digest"""
-        from datetime import timedelta
         week_ago = datetime.now() - timedelta(days=7)
         
         recent_research = self.session.query(ResearchItem).filter(
@@ -183,13 +390,8 @@ Generate a concise intelligence brief covering:
 Keep it scannable and actionable."""
 
         try:
-            message = self.client.messages.create(
-                model=self.model,
-                max_tokens=3000,
-                messages=[{"role": "user", "content": prompt}]
-            )
-            
-            return message.content[0].text
+            report, _ = self._completion(prompt, 3000, use_cache)
+            return report
             
         except Exception as e:
             return f"Error generating intelligence report: {e}"
@@ -1,18 +1,61 @@
 from datetime import datetime, timedelta, date
-from sqlalchemy import and_, or_
-from agent.models import Task, DailyLog, get_session
+from sqlalchemy import and_, or_, func, case, select, update
+from agent.models import Task, Goal, DailyLog, get_session
 from agent.utils import get_repository_context
 
+
+def sync_goal_task_counters(session, goal_id, total_delta=0, completed_delta=0):
+    """
+    Apply a task count change to a goal's cached counters and progress.
+
+    Runs as a single UPDATE in the caller's transaction. Goals whose counters
+    have never been populated (NULL) are seeded from all of the goal's tasks
+    instead, whatever their project, so the first sync after a migration is
+    exact and later +/- deltas from any project stay consistent with it.
+    Goals reaching 100% are auto-completed, matching
+    BusinessPlanner.update_goal_progress().
+    """
+    def progress_values(total, completed):
+        progress = func.coalesce(100.0 * completed / func.nullif(total, 0), 0.0)
+        return {
+            'total_tasks': total,
+            'completed_tasks': completed,
+            'progress_percentage': case((progress > 100.0, 100.0), else_=progress),
+            'status': case((and_(total > 0, completed >= total), 'completed'), else_=Goal.status),
+            'updated_at': datetime.now(),
+        }
+
+    result = session.execute(
+        update(Goal)
+        .where(Goal.id == goal_id, Goal.total_tasks != None)
+        .values(**progress_values(Goal.total_tasks + total_delta,
+                                  Goal.completed_tasks + completed_delta))
+        .execution_options(synchronize_session=False)
+    )
+    if result.rowcount == 0:
+        linked = Task.parent_goal_id == goal_id
+        total = select(func.count(Task.id)).where(linked).scalar_subquery()
+        completed = select(func.count(Task.id)).where(
+            linked, Task.status == 'completed'
+        ).scalar_subquery()
+        session.execute(
+            update(Goal)
+            .where(Goal.id == goal_id)
+            .values(**progress_values(total, completed))
+            .execution_options(synchronize_session=False)
+        )
+
 class TaskManager:
-    def __init__(self, project_filter=True):
+    def __init__(self, project_filter=True, session=None):
         """
         Initialize TaskManager.
 
         Args:
             project_filter: If True, filter tasks by current repository context.
                            If False (--global mode), show all tasks.
+            session: Existing session to share (default: open a new one)
         """
-        self.session = get_session()
+        self.session = session if session is not None else get_session()
         self.project_filter = project_filter
         self.context = get_repository_context() if project_filter else None
 
@@ -27,6 +70,21 @@ class TaskManager:
             ))
         return query
 
+    def _sync_goal_counters(self, goal_id, total_delta=0, completed_delta=0):
+        """sync_goal_task_counters() in this manager's session"""
+        sync_goal_task_counters(self.session, goal_id, total_delta, completed_delta)
+
+    def _move_goal_counts(self, old_goal_id, was_completed, new_goal_id, is_completed):
+        """Adjust goal counters after a task's goal or completion state changed"""
+        if old_goal_id == new_goal_id:
+            if old_goal_id and was_completed != is_completed:
+                self._sync_goal_counters(old_goal_id, completed_delta=1 if is_completed else -1)
+            return
+        if old_goal_id:
+            self._sync_goal_counters(old_goal_id, total_delta=-1, completed_delta=-int(was_completed))
+        if new_goal_id:
+            self._sync_goal_counters(new_goal_id, total_delta=1, completed_delta=int(is_completed))
+
     def create_task(self, title, description=None, priority=3, category=None,
                     estimated_hours=None, due_date=None, parent_goal_id=None,
                     dependencies=None, tags=None, project_name=None, repository_path=None):
@@ -51,67 +109,129 @@ class TaskManager:
             repository_path=repository_path
         )
         self.session.add(task)
+        if parent_goal_id:
+            self._sync_goal_counters(parent_goal_id, total_delta=1)
         self.session.commit()
         return task
+
+    def create_tasks_bulk(self, task_fields):
+        """
+        Create several tasks in one transaction.
+
+        Args:
+            task_fields: List of dicts of create_task() keyword arguments
+
+        Returns:
+            The created tasks, in input order, with IDs assigned
+        """
+        context = get_repository_context()
+        tasks = []
+        goal_counts = {}
+        for fields in task_fields:
+            fields = dict(fields)
+            fields['dependencies'] = fields.get('dependencies') or []
+            fields['tags'] = fields.get('tags') or []
+            fields['project_name'] = fields.get('project_name') or context['project_name']
+            fields['repository_path'] = fields.get('repository_path') or context['repository_path']
+            tasks.append(Task(**fields))
+
+            goal_id = fields.get('parent_goal_id')
+            if goal_id:
+                goal_counts[goal_id] = goal_counts.get(goal_id, 0) + 1
+
+        self.session.add_all(tasks)
+        self.session.flush()  # Batched INSERT; assigns IDs
+        for goal_id, count in goal_counts.items():
+            self._sync_goal_counters(goal_id, total_delta=count)
+        self.session.commit()
+        return tasks
     
     def get_task(self, task_id):
         """Get a specific task by ID"""
-        return self.session.query(Task).filter(Task.id == task_id).first()
+        return self.session.get(Task, task_id)
     
-    def get_tasks_for_today(self):
-        """Get all tasks due today or overdue"""
+    @staticmethod
+    def _due_today_condition():
+        """Filter for open tasks that are due today, overdue, or undated"""
         today = datetime.now().date()
         tomorrow = today + timedelta(days=1)
 
-        query = self.session.query(Task).filter(
-            and_(
-                Task.status.in_(['pending', 'in_progress']),
-                or_(
-                    Task.due_date == None,
-                    Task.due_date < datetime.combine(tomorrow, datetime.min.time())
-                )
+        return and_(
+            Task.status.in_(['pending', 'in_progress']),
+            or_(
+                Task.due_date == None,
+                Task.due_date < datetime.combine(tomorrow, datetime.min.time())
             )
         )
+
+    def get_tasks_for_today(self):
+        """Get all tasks due today or overdue"""
+        query = select(Task).where(self._due_today_condition())
         query = self._apply_project_filter(query)
-        return query.order_by(Task.priority, Task.due_date).all()
+        return self.session.scalars(query.order_by(Task.priority, Task.due_date)).all()
     
     def get_tasks_by_status(self, status):
         """Get all tasks with a specific status"""
-        query = self.session.query(Task).filter(Task.status == status)
+        query = select(Task).where(Task.status == status)
         query = self._apply_project_filter(query)
-        return query.all()
+        return self.session.scalars(query).all()
     
     def get_tasks_by_goal(self, goal_id):
         """Get all tasks linked to a specific goal"""
-        query = self.session.query(Task).filter(Task.parent_goal_id == goal_id)
+        query = select(Task).where(Task.parent_goal_id == goal_id)
         query = self._apply_project_filter(query)
-        return query.all()
+        return self.session.scalars(query).all()
+
+    def get_tasks_by_goal_and_status(self, goal_id, statuses, limit=None):
+        """Get (title, status) rows for a goal's tasks in the given statuses, in ID order"""
+        query = self.session.query(Task.title, Task.status).filter(
+            Task.parent_goal_id == goal_id,
+            Task.status.in_(statuses)
+        )
+        query = self._apply_project_filter(query)
+        return query.order_by(Task.id).limit(limit).all()
     
     def get_tasks_by_category(self, category):
         """Get all tasks in a specific category"""
-        query = self.session.query(Task).filter(Task.category == category)
+        query = select(Task).where(Task.category == category)
         query = self._apply_project_filter(query)
-        return query.all()
+        return self.session.scalars(query).all()
     
     def get_overdue_tasks(self):
         """Get all overdue tasks"""
         now = datetime.now()
-        query = self.session.query(Task).filter(
+        query = select(Task).where(
             and_(
                 Task.status.in_(['pending', 'in_progress']),
                 Task.due_date < now
             )
         )
         query = self._apply_project_filter(query)
-        return query.order_by(Task.priority).all()
+        return self.session.scalars(query.order_by(Task.priority)).all()
+    
+    def get_open_task_counts(self):
+        """Count tasks for today (as in get_tasks_for_today) and how many of them are overdue, in one query"""
+        now = datetime.now()
+        query = self.session.query(
+            func.count(Task.id),
+            func.sum(case((Task.due_date < now, 1), else_=0))
+        ).filter(self._due_today_condition())
+        query = self._apply_project_filter(query)
+        today, overdue = query.one()
+        return {'today': today, 'overdue': overdue or 0}
     
     def update_task(self, task_id, **kwargs):
         """Update task fields"""
         task = self.get_task(task_id)
         if task:
+            old_goal_id, was_completed = task.parent_goal_id, task.status == 'completed'
             for key, value in kwargs.items():
                 if hasattr(task, key):
                     setattr(task, key, value)
+            # Reopening, completing or moving a task changes its goals' counts
+            self._move_goal_counts(
+                old_goal_id, was_completed, task.parent_goal_id, task.status == 'completed'
+            )
             self.session.commit()
         return task
     
@@ -119,20 +239,55 @@ class TaskManager:
         """Mark a task as completed"""
         task = self.get_task(task_id)
         if task:
+            was_completed = task.status == 'completed'
             task.status = 'completed'
             task.completed_at = datetime.now()
             if actual_hours:
                 task.actual_hours = actual_hours
+            # Keep the parent goal's progress current in the same transaction
+            if task.parent_goal_id and not was_completed:
+                self._sync_goal_counters(task.parent_goal_id, completed_delta=1)
             self.session.commit()
         return task
     
+    def complete_tasks(self, task_ids, actual_hours=None):
+        """
+        Mark several tasks as completed in one transaction.
+
+        Returns:
+            The completed tasks, in input order; unknown IDs are skipped
+        """
+        tasks_by_id = {
+            task.id: task
+            for task in self.session.scalars(select(Task).where(Task.id.in_(task_ids)))
+        }
+        tasks = [tasks_by_id[task_id] for task_id in dict.fromkeys(task_ids) if task_id in tasks_by_id]
+
+        now = datetime.now()
+        newly_completed = {}
+        for task in tasks:
+            if task.parent_goal_id and task.status != 'completed':
+                newly_completed[task.parent_goal_id] = newly_completed.get(task.parent_goal_id, 0) + 1
+            task.status = 'completed'
+            task.completed_at = now
+            if actual_hours:
+                task.actual_hours = actual_hours
+
+        for goal_id, count in newly_completed.items():
+            self._sync_goal_counters(goal_id, completed_delta=count)
+        self.session.commit()
+        return tasks
+    
     def block_task(self, task_id, reason=None):
         """Mark a task as blocked"""
         task = self.get_task(task_id)
         if task:
+            was_completed = task.status == 'completed'
             task.status = 'blocked'
             if reason:
                 task.notes = f"{task.notes or ''}\n[BLOCKED] {reason}"
+            # Blocking a completed task takes it out of its goal's completed count
+            self._move_goal_counts(task.parent_goal_id, was_completed, task.parent_goal_id, False)
             self.session.commit()
         return task
     
@@ -141,6 +296,7 @@ class TaskManager:
         task = self.get_task(task_id)
         if task:
             self.session.delete(task)
+            self._move_goal_counts(task.parent_goal_id, task.status == 'completed', None, False)
             self.session.commit()
             return True
         return False
@@ -167,18 +323,24 @@ class TaskManager:
 
     def get_tasks_for_date_range(self, start_date, end_date):
         """Get all tasks within a date range"""
-        return self.session.query(Task).filter(
-            and_(
-                Task.due_date >= start_date,
-                Task.due_date <= end_date
-            )
-        ).order_by(Task.due_date, Task.priority).all()
+        return self.session.scalars(
+            select(Task).where(
+                and_(
+                    Task.due_date >= start_date,
+                    Task.due_date <= end_date
+                )
+            ).order_by(Task.due_date, Task.priority)
+        ).all()
     
-    def get_daily_summary(self, date_obj=None):
+    def get_daily_summary(self, date_obj=None, include_tasks=True):
         """
         Get summary of tasks for a specific day.
         Shows tasks completed on this day regardless of due date.
         All timestamps are in LOCAL time.
+
+        With include_tasks=False the 'completed_tasks' and 'pending_tasks'
+        lists are left empty and the counts come from one aggregate query,
+        so no Task rows are loaded at all.
         """
         if date_obj is None:
             date_obj = datetime.now()
@@ -190,43 +352,51 @@ class TaskManager:
         day_start = date_obj.replace(hour=0, minute=0, second=0, microsecond=0)
         day_end = day_start + timedelta(days=1)
 
-        # Get tasks due on this day
-        tasks_due = self.session.query(Task).filter(
-            and_(
-                Task.due_date >= day_start,
-                Task.due_date < day_end
-            )
-        ).all()
+        due_that_day = and_(Task.due_date >= day_start, Task.due_date < day_end)
+        completed_that_day = and_(Task.completed_at >= day_start, Task.completed_at < day_end)
 
-        # Get tasks completed on this day (using LOCAL time)
-        tasks_completed = self.session.query(Task).filter(
-            and_(
-                Task.completed_at >= day_start,
-                Task.completed_at < day_end
-            )
-        ).all()
+        if include_tasks:
+            # Get tasks due on this day
+            tasks_due = self.session.query(Task).filter(due_that_day).all()
+
+            # Get tasks completed on this day (using LOCAL time)
+            tasks_completed = self.session.query(Task).filter(completed_that_day).all()
+
+            due_count = len(tasks_due)
+            due_completed_count = len([t for t in tasks_due if t.status == 'completed'])
+            completed_count = len(tasks_completed)
+            completed_tasks = [t.to_dict() for t in tasks_completed]
+            pending_tasks = [t.to_dict() for t in tasks_due if t.status != 'completed']
+        else:
+            # Both date ranges are indexed, so SQLite answers the OR from the indexes
+            due_count, due_completed_count, completed_count = self.session.query(
+                func.count(case((due_that_day, 1))),
+                func.count(case((and_(due_that_day, Task.status == 'completed'), 1))),
+                func.count(case((completed_that_day, 1)))
+            ).filter(or_(due_that_day, completed_that_day)).one()
+            completed_tasks = []
+            pending_tasks = []
 
         # Calculate completion rate based on tasks that were due
         # If no tasks were due, show N/A but still show completed count
-        if tasks_due:
-            completed_count = len([t for t in tasks_due if t.status == 'completed'])
-            completion_rate = completed_count / len(tasks_due)
+        if due_count:
+            completion_rate = due_completed_count / due_count
         else:
             completion_rate = 0
 
         return {
             'date': date_obj.strftime('%Y-%m-%d'),
-            'tasks_due': len(tasks_due),
-            'tasks_completed': len(tasks_completed),  # All tasks completed today
+            'tasks_due': due_count,
+            'tasks_completed': completed_count,  # All tasks completed today
             'completion_rate': completion_rate,  # Based on tasks that were due
-            'completed_tasks': [t.to_dict() for t in tasks_completed],
-            'pending_tasks': [t.to_dict() for t in tasks_due if t.status != 'completed']
+            'completed_tasks': completed_tasks,
+            'pending_tasks': pending_tasks
         }
     
-    def get_yesterday_summary(self):
+    def get_yesterday_summary(self, include_tasks=True):
         """Get summary for yesterday"""
         yesterday = datetime.now() - timedelta(days=1)
-        return self.get_daily_summary(yesterday)
+        return self.get_daily_summary(yesterday, include_tasks=include_tasks)
     
     def create_daily_log(self, date, tasks_completed, tasks_planned, 
                         wins=None, blockers=None, learnings=None, 
@@ -307,29 +477,37 @@ class TaskManager:
         Calculate average tasks completed per day over a period.
         Uses actual completed_at timestamps for accurate velocity calculation.
         """
-        # Get tasks completed in the specified period
-        completed_tasks = self.get_completed_tasks_this_week(days=days)
+        # Count tasks completed in the specified period (no need to load them)
+        now = datetime.now()
+        start_date = now - timedelta(days=days)
 
-        if not completed_tasks:
-            return 0.0
+        completed_count = self.session.query(func.count(Task.id)).filter(
+            and_(
+                Task.status == 'completed',
+                Task.completed_at >= start_date,
+                Task.completed_at <= now
+            )
+        ).scalar()
 
         # Calculate velocity as tasks per day
-        velocity = len(completed_tasks) / days
+        velocity = completed_count / days
         return velocity
 
-    def get_completed_tasks_this_week(self, days=7):
-        """Get tasks completed in the last N days based on completed_at timestamp"""
+    def get_completed_tasks_this_week(self, days=7, limit=None):
+        """Get tasks completed in the last N days based on completed_at timestamp (most recent first)"""
         # Use LOCAL time to match database timestamps
         now = datetime.now()
         start_date = now - timedelta(days=days)
 
-        completed_tasks = self.session.query(Task).filter(
-            and_(
-                Task.status == 'completed',
-                Task.completed_at >= start_date,
-                Task.completed_at <= now
-            )
-        ).order_by(Task.completed_at.desc()).all()
+        completed_tasks = self.session.scalars(
+            select(Task).where(
+                and_(
+                    Task.status == 'completed',
+                    Task.completed_at >= start_date,
+                    Task.completed_at <= now
+                )
+            ).order_by(Task.completed_at.desc()).limit(limit)
+        ).all()
 
         return completed_tasks
 
@@ -339,55 +517,75 @@ class TaskManager:
         now = datetime.now()
         start_date = now - timedelta(days=days)
 
-        created_tasks = self.session.query(Task).filter(
-            and_(
-                Task.created_at >= start_date,
-                Task.created_at <= now
-            )
-        ).order_by(Task.created_at.desc()).all()
+        created_tasks = self.session.scalars(
+            select(Task).where(
+                and_(
+                    Task.created_at >= start_date,
+                    Task.created_at <= now
+                )
+            ).order_by(Task.created_at.desc())
+        ).all()
 
         return created_tasks
 
-    def get_weekly_task_stats(self, days=7):
+    def get_weekly_task_stats(self, days=7, include_tasks=True):
         """
         Get weekly statistics based on actual task completion dates (completed_at).
         This is more accurate than DailyLog-based stats as it reflects actual work completed.
-        """
-        completed_tasks = self.get_completed_tasks_this_week(days)
-        created_tasks = self.get_created_tasks_this_week(days)
-
-        # Calculate statistics
-        tasks_completed = len(completed_tasks)
-        tasks_created = len(created_tasks)
 
-        # Calculate completion rate (completed vs created this week)
-        completion_rate = (tasks_completed / tasks_created * 100) if tasks_created > 0 else 0
-
-        # Calculate total estimated hours
-        total_estimated_hours = sum(
-            task.estimated_hours or 0 for task in completed_tasks
-        )
+        With include_tasks=False the 'completed_tasks' list is left empty and all
+        totals are aggregated in SQL, so no Task rows are loaded at all.
+        """
+        now = datetime.now()
+        start_date = now - timedelta(days=days)
 
-        # Calculate total actual hours
-        total_actual_hours = sum(
-            task.actual_hours or 0 for task in completed_tasks
-        )
+        tasks_created = self.session.query(func.count(Task.id)).filter(
+            and_(
+                Task.created_at >= start_date,
+                Task.created_at <= now
+            )
+        ).scalar()
+
+        # (category, priority, count, estimated hours, actual hours) per group
+        if include_tasks:
+            completed_tasks = self.get_completed_tasks_this_week(days)
+            groups = [
+                (task.category, task.priority, 1, task.estimated_hours, task.actual_hours)
+                for task in completed_tasks
+            ]
+        else:
+            completed_tasks = []
+            groups = self.session.query(
+                Task.category,
+                Task.priority,
+                func.count(Task.id),
+                func.sum(Task.estimated_hours),
+                func.sum(Task.actual_hours)
+            ).filter(
+                and_(
+                    Task.status == 'completed',
+                    Task.completed_at >= start_date,
+                    Task.completed_at <= now
+                )
+            ).group_by(Task.category, Task.priority).all()
 
-        # Break down by category
+        tasks_completed = 0
+        total_estimated_hours = 0
+        total_actual_hours = 0
         categories = {}
-        for task in completed_tasks:
-            category = task.category or 'uncategorized'
-            if category not in categories:
-                categories[category] = 0
-            categories[category] += 1
-
-        # Break down by priority
         priorities = {}
-        for task in completed_tasks:
-            priority = task.priority
-            if priority not in priorities:
-                priorities[priority] = 0
-            priorities[priority] += 1
+        for category, priority, count, estimated_hours, actual_hours in groups:
+            tasks_completed += count
+            total_estimated_hours += estimated_hours or 0
+            total_actual_hours += actual_hours or 0
+
+            # Break down by category and priority
+            category = category or 'uncategorized'
+            categories[category] = categories.get(category, 0) + count
+            priorities[priority] = priorities.get(priority, 0) + count
+
+        # Calculate completion rate (completed vs created this week)
+        completion_rate = (tasks_completed / tasks_created * 100) if tasks_created > 0 else 0
 
         return {
             'tasks_completed_this_week': tasks_completed,
@@ -401,6 +599,59 @@ class TaskManager:
             'period_days': days
         }
 
+    def get_dashboard_snapshot(self, days=7, task_limit=10, goal_limit=5):
+        """
+        Get everything the live dashboard shows in one transaction.
+
+        Replaces the separate daily summary, velocity, weekly stats, task and goal
+        lookups with three queries: one conditional-aggregate over tasks for all
+        counters, one for the task list and one for the top goals.
+        """
+        now = datetime.now()
+        day_start = now.replace(hour=0, minute=0, second=0, microsecond=0)
+        day_end = day_start + timedelta(days=1)
+        period_start = now - timedelta(days=days)
+
+        def count_where(*conditions):
+            return func.coalesce(func.sum(case((and_(*conditions), 1), else_=0)), 0)
+
+        completed_today, completed_period, created_period = self.session.query(
+            count_where(Task.completed_at >= day_start, Task.completed_at < day_end),
+            count_where(
+                Task.status == 'completed',
+                Task.completed_at >= period_start,
+                Task.completed_at <= now
+            ),
+            count_where(Task.created_at >= period_start, Task.created_at <= now)
+        ).one()
+
+        # Today's tasks (due today, overdue or undated) sort ahead of future ones;
+        # the future ones are only shown when nothing is due today
+        is_future = case((Task.due_date >= day_end, 1), else_=0)
+        query = self.session.query(Task).filter(Task.status.in_(['pending', 'in_progress']))
+        query = self._apply_project_filter(query)
+        tasks = query.order_by(is_future, Task.priority, Task.due_date).limit(task_limit).all()
+        today_tasks = [t for t in tasks if t.due_date is None or t.due_date < day_end]
+
+        query = self.session.query(Goal).filter(Goal.status == 'active')
+        if self.project_filter and self.context:
+            query = query.filter(or_(
+                Goal.project_name == self.context['project_name'],
+                Goal.project_name == None
+            ))
+        goals = query.order_by(Goal.horizon, Goal.target_date).limit(goal_limit).all()
+
+        return {
+            'tasks_completed_today': completed_today,
+            'tasks_completed_this_week': completed_period,
+            'tasks_created_this_week': created_period,
+            'completion_rate': (completed_period / created_period * 100) if created_period > 0 else 0,
+            'velocity': completed_period / days,
+            'tasks': today_tasks or tasks,
+            'goals': goals,
+            'period_days': days
+        }
+
     def close(self):
         """Close the database session"""
         self.session.close()
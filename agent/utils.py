@@ -1,13 +1,105 @@
 """Utility functions for the business agent."""
+import functools
 import os
 import subprocess
+import sys
+import threading
+import time
 from typing import Optional, Dict
 
 
+def load_env() -> None:
+    """
+    Load variables from .env once per process tree.
+
+    Existing environment variables always win over .env values. Once loaded,
+    BIZY_ENV_LOADED is set so later calls (and child processes) skip importing
+    and parsing dotenv; wrappers that already export the configuration, such
+    as cron or systemd units, can set BIZY_ENV_LOADED=1 to skip it entirely.
+    """
+    if os.getenv('BIZY_ENV_LOADED'):
+        return
+    from dotenv import load_dotenv
+    load_dotenv(override=False)
+    os.environ['BIZY_ENV_LOADED'] = '1'
+
+
+@functools.lru_cache(maxsize=None)
+def get_anthropic_client(api_key: Optional[str]):
+    """
+    Shared Anthropic client per API key.
+
+    Building a client sets up an HTTP pool and TLS context (tens of
+    milliseconds), and every agent and planner in one process can share one
+    client and its keep-alive connections.
+    """
+    import anthropic
+    return anthropic.Anthropic(api_key=api_key)
+
+
+class RequestPacer:
+    """
+    Spaces requests evenly to stay under a requests-per-minute limit.
+
+    Waiting callers queue locally instead of sending requests the API would
+    reject with a 429. Safe to share between threads.
+    """
+
+    def __init__(self, requests_per_minute: float):
+        if not requests_per_minute > 0:
+            raise ValueError("requests_per_minute must be positive")
+        self.interval = 60.0 / requests_per_minute
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        """Block until the next request slot"""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self.interval
+        if slot > now:
+            time.sleep(slot - now)
+
+
+@functools.lru_cache(maxsize=None)
+def _request_pacer(setting: str) -> Optional[RequestPacer]:
+    """
+    Pacer for a BIZY_AI_REQUESTS_PER_MINUTE value, parsed once per value.
+
+    Values of 0 or less turn pacing off; values that are not numbers are
+    reported once on stderr and ignored.
+    """
+    try:
+        requests_per_minute = float(setting)
+    except ValueError:
+        print(f"Ignoring BIZY_AI_REQUESTS_PER_MINUTE={setting!r}: not a number", file=sys.stderr)
+        return None
+    if not requests_per_minute > 0:  # Also rejects nan
+        return None
+    return RequestPacer(requests_per_minute)
+
+
+def pace_ai_request() -> None:
+    """
+    Wait for a free slot before a Claude request.
+
+    Limited by BIZY_AI_REQUESTS_PER_MINUTE; does nothing when it is unset,
+    0 or less, or invalid.
+    """
+    setting = os.getenv('BIZY_AI_REQUESTS_PER_MINUTE', '').strip()
+    pacer = _request_pacer(setting) if setting else None
+    if pacer:
+        pacer.wait()
+
+
 def get_repository_context() -> Dict[str, Optional[str]]:
     """
     Detect Git repository root and extract project name.
 
+    The git lookup runs once per working directory per process; later calls
+    return a copy of the remembered result.
+
     Returns:
         Dictionary with 'project_name' and 'repository_path' keys.
         If not in a Git repository, returns 'global' project with None path.
@@ -19,13 +111,35 @@ def get_repository_context() -> Dict[str, Optional[str]]:
         >>> get_repository_context()  # Outside a repo
         {'project_name': 'global', 'repository_path': None}
     """
+    return dict(_repository_context_for(os.getcwd()))
+
+
+@functools.lru_cache(maxsize=None)
+def _repository_context_for(cwd: str) -> Dict[str, Optional[str]]:
+    """Run the git lookup for get_repository_context() (cached per directory)"""
+    # Common case: find the enclosing .git in Python instead of starting git.
+    # A .git file (worktree or submodule) also marks the top level. GIT_DIR
+    # and GIT_WORK_TREE change what git reports, so leave those to git.
+    if not (os.getenv('GIT_DIR') or os.getenv('GIT_WORK_TREE')):
+        directory = os.path.realpath(cwd)
+        while True:
+            if os.path.exists(os.path.join(directory, '.git')):
+                return {
+                    'project_name': os.path.basename(directory),
+                    'repository_path': directory
+                }
+            parent = os.path.dirname(directory)
+            if parent == directory:
+                break
+            directory = parent
+
     try:
         # Try to find git root
         result = subprocess.run(
             ['git', 'rev-parse', '--show-toplevel'],
             capture_output=True,
             text=True,
-            cwd=os.getcwd(),
+            cwd=cwd,
             timeout=2  # Prevent hanging
         )
 
@@ -47,6 +161,22 @@ def get_repository_context() -> Dict[str, Optional[str]]:
     }
 
 
+# Display lookup tables, built once instead of per rendered row
+PROGRESS_BARS = ["█" * filled + "░" * (10 - filled) for filled in range(11)]
+PRIORITY_ICONS = {1: "🔴", 2: "🟡"}
+TASK_STATUS_ICONS = {"pending": "⏳", "in_progress": "🔄", "blocked": "🚧"}
+
+
+def format_progress_bar(percentage: float) -> str:
+    """Return a 10-cell text progress bar for a 0-100 percentage."""
+    return PROGRESS_BARS[max(0, min(10, int(percentage / 10)))]
+
+
+def priority_icon(priority: int) -> str:
+    """Return the list icon for a task priority (3 and lower priorities show green)."""
+    return PRIORITY_ICONS.get(priority, "🟢")
+
+
 def get_project_name() -> str:
     """Get the current project name (repository name or 'global')."""
     context = get_repository_context()
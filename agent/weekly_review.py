@@ -5,61 +5,58 @@ import sys
 import os
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
 
-from agent.core import BusinessAgent
-from agent.tasks import TaskManager
-from agent.planner import BusinessPlanner
+from agent.utils import load_env
 from rich.console import Console
-from rich.panel import Panel
-from rich.markdown import Markdown
 from datetime import datetime, timedelta
-from dotenv import load_dotenv
 
-load_dotenv()
+load_env()
 console = Console()
 
 def run_weekly_review():
     try:
         console.print(f"\n[bold blue]📊 WEEKLY REVIEW - {datetime.now().strftime('%B %d, %Y')}[/bold blue]\n")
+
+        # Imported after the header so it shows before the SDK and ORM load
+        from agent.core import BusinessAgent, LiveMarkdownPanel
+        from agent.planner import BusinessPlanner
         
         agent = BusinessAgent()
-        task_mgr = TaskManager()
+        # Reuse the planner's TaskManager rather than opening a second session
         planner = BusinessPlanner()
+        task_mgr = planner.task_mgr
         
         # Get weekly statistics based on actual task completions
-        weekly_stats = task_mgr.get_weekly_task_stats()
+        # (totals come from SQL; only the ten most recent completions are loaded)
+        weekly_stats = task_mgr.get_weekly_task_stats(include_tasks=False)
 
         # Get goal progress
-        active_goals = planner.get_active_goals()
+        active_goals = planner.get_active_goals(limit=5)
         goals_progress = "\n".join([
             f"- {g.title}: {g.progress_percentage:.0f}% complete"
-            for g in active_goals[:5]
+            for g in active_goals
         ]) if active_goals else "No active goals"
 
         # Get key events from completed tasks
-        completed_tasks = weekly_stats.get('completed_tasks', [])
+        completed_tasks = task_mgr.get_completed_tasks_this_week(limit=10)
         key_events_str = "\n".join([
-            f"✓ {task['title']}" + (f" ({task['category']})" if task['category'] else "")
-            for task in completed_tasks[:10]
+            f"✓ {task.title}" + (f" ({task.category})" if task.category else "")
+            for task in completed_tasks
         ]) if completed_tasks else "No tasks completed this week"
         
         # Generate review
         console.print("[dim]Generating comprehensive analysis...[/dim]\n")
-        review = agent.weekly_review(
-            weekly_stats=weekly_stats,
-            goals_progress=goals_progress,
-            key_events=key_events_str
-        )
-        
-        console.print(Panel(
-            Markdown(review),
-            title="🤖 Weekly Analysis",
-            border_style="blue",
-            padding=(1, 2)
-        ))
+        # Stream the response into the panel as it is generated
+        with LiveMarkdownPanel("🤖 Weekly Analysis", border_style="blue", console=console) as panel:
+            review = agent.weekly_review(
+                weekly_stats=weekly_stats,
+                goals_progress=goals_progress,
+                key_events=key_events_str,
+                on_text=panel.append
+            )
+            panel.set(review)
         
         console.print(f"\n[bold]⚡ Velocity:[/bold] {task_mgr.get_task_velocity(days=7):.1f} tasks/day\n")
         
-        task_mgr.close()
         planner.close()
         
         console.print("[bold green]✨ Week reviewed! Ready for the next one.[/bold green]\n")
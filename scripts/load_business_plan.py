@@ -58,11 +58,17 @@ def load_business_plan(file_path=None, plan_name=None):
             # Prompt user for name
             plan_name = Prompt.ask(f"📝 [bold]Enter business plan name[/bold]")
 
-        # Deactivate any existing active plans
-        active_plans = session.query(BusinessPlan).filter_by(is_active=True).all()
-        for plan in active_plans:
-            plan.is_active = False
-            console.print(f"[yellow]⚠ Deactivated existing plan: {plan.name}[/yellow]")
+        # Deactivate any existing active plans with one UPDATE (only names are
+        # loaded for the messages, not the plans' large text columns)
+        active_plan_names = [
+            name for (name,) in session.query(BusinessPlan.name).filter_by(is_active=True)
+        ]
+        if active_plan_names:
+            session.query(BusinessPlan).filter_by(is_active=True).update(
+                {BusinessPlan.is_active: False}, synchronize_session=False
+            )
+            for name in active_plan_names:
+                console.print(f"[yellow]⚠ Deactivated existing plan: {name}[/yellow]")
 
         # Create new business plan
         new_plan = BusinessPlan(
@@ -0,0 +1,266 @@
+"""
+Tests for the bizy CLI entry point
+Testing lazy loading of command groups
+"""
+
+import os
+import subprocess
+import sys
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+import click
+import pytest
+from click.testing import CliRunner
+from agent.cli import cli
+
+
+class TestLazyGroup:
+    """Test that command groups resolve from their own modules"""
+
+    def test_help_lists_all_commands(self):
+        """Test that --help lists lazy groups alongside eager commands"""
+        result = CliRunner().invoke(cli, ['--help'])
+
+        assert result.exit_code == 0
+        for name in ['task', 'goal', 'research', 'predict', 'chart', 'pdf',
+                     'calendar', 'plan', 'project', 'stats', 'brief', 'migrate']:
+            assert name in result.output
+
+    def test_lazy_subcommands_resolve_to_groups(self):
+        """Test that every lazy entry imports to a click group of the same name"""
+        ctx = click.Context(cli)
+
+        for name, (_, short_help) in cli.lazy_subcommands.items():
+            command = cli.get_command(ctx, name)
+            assert isinstance(command, click.Group)
+            assert command.name == name
+            # The static help shown by `bizy --help` must match the group docstring
+            assert command.get_short_help_str(limit=100) == short_help
+
+    def test_subgroup_help(self):
+        """Test invoking a lazily loaded group"""
+        result = CliRunner().invoke(cli, ['task', '--help'])
+
+        assert result.exit_code == 0
+        assert 'complete' in result.output
+        assert 'list' in result.output
+
+    def test_shell_complete_uses_static_help(self):
+        """Test that command completion lists lazy groups with their help text"""
+        ctx = click.Context(cli)
+
+        completions = {item.value: item.help for item in cli.shell_complete(ctx, 'p')}
+
+        assert completions == {
+            'pdf': 'Generate PDF reports',
+            'plan': 'Manage business plan',
+            'predict': 'Predictive analytics and forecasts',
+            'project': 'Manage projects and repository contexts',
+        }
+
+    def test_unknown_command(self):
+        """Test that unknown commands still produce a usage error"""
+        result = CliRunner().invoke(cli, ['nope'])
+
+        assert result.exit_code != 0
+
+    def test_import_skips_heavy_dependencies(self):
+        """Test that importing the entry point, --help and Tab completion load no heavy dependencies"""
+        code = (
+            "import sys, agent.cli; "
+            "from click.testing import CliRunner; "
+            "CliRunner().invoke(agent.cli.cli, ['--help']); "
+            "CliRunner().invoke(agent.cli.cli, env={'_BIZY_COMPLETE': 'bash_complete', "
+            "'COMP_WORDS': 'bizy ', 'COMP_CWORD': '1'}, prog_name='bizy'); "
+            "print(','.join(m for m in ('sqlalchemy', 'anthropic', 'rich', 'dotenv') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == ''
+
+    def test_review_scripts_defer_heavy_imports(self):
+        """Test that the briefing and review scripts load the SDK and ORM only when run"""
+        code = (
+            "import sys, agent.morning_brief, agent.evening_review, agent.weekly_review; "
+            "print(','.join(m for m in ('sqlalchemy', 'anthropic') if m in sys.modules))"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == ''
+
+    def test_agents_defer_sdk_import(self):
+        """Test that the planner and agent modules import the Anthropic SDK only when a client is needed"""
+        code = (
+            "import sys, agent.planner, agent.core, agent.research, agent.pdf_export; "
+            "print('anthropic' in sys.modules)"
+        )
+        result = subprocess.run([sys.executable, '-c', code], capture_output=True, text=True, check=True)
+
+        assert result.stdout.strip() == 'False'
+
+
+class TestLoadEnv:
+    """Tests for the once-per-process .env loading"""
+
+    def test_skips_dotenv_when_already_loaded(self, monkeypatch):
+        """Test that a preset BIZY_ENV_LOADED skips reading .env"""
+        from agent.utils import load_env
+
+        monkeypatch.setenv('BIZY_ENV_LOADED', '1')
+        with patch('dotenv.load_dotenv') as load_dotenv:
+            load_env()
+
+        load_dotenv.assert_not_called()
+
+    def test_loads_once(self, monkeypatch):
+        """Test that the first call loads .env and marks the environment"""
+        from agent.utils import load_env
+
+        # setenv (unlike delenv of a missing variable) records the value to restore,
+        # so the flag load_env() sets does not leak into later tests
+        monkeypatch.setenv('BIZY_ENV_LOADED', '')
+        with patch('dotenv.load_dotenv') as load_dotenv:
+            load_env()
+            load_env()
+
+        load_dotenv.assert_called_once_with(override=False)
+        assert os.environ['BIZY_ENV_LOADED'] == '1'
+
+
+class TestRepositoryContext:
+    """Tests for the per-directory repository context cache"""
+
+    def test_runs_git_once_per_directory(self, tmp_path, monkeypatch):
+        """Test that repeated lookups reuse the first git result and return copies"""
+        from agent.utils import get_repository_context
+
+        monkeypatch.chdir(tmp_path)
+        completed = subprocess.CompletedProcess([], 0, stdout=f"{tmp_path}\n")
+        with patch('agent.utils.subprocess.run', return_value=completed) as run:
+            first = get_repository_context()
+            first['project_name'] = 'changed'
+            second = get_repository_context()
+
+        run.assert_called_once()
+        assert second == {'project_name': tmp_path.name, 'repository_path': str(tmp_path)}
+
+    def test_finds_git_directory_without_running_git(self, tmp_path, monkeypatch):
+        """Test that a .git directory above the working directory is found without git"""
+        from agent.utils import get_repository_context
+
+        repo = tmp_path / "my-project"
+        (repo / ".git").mkdir(parents=True)
+        (repo / "src").mkdir()
+        monkeypatch.chdir(repo / "src")
+        monkeypatch.delenv('GIT_DIR', raising=False)
+        monkeypatch.delenv('GIT_WORK_TREE', raising=False)
+        with patch('agent.utils.subprocess.run') as run:
+            context = get_repository_context()
+
+        run.assert_not_called()
+        assert context == {'project_name': 'my-project', 'repository_path': str(repo.resolve())}
+
+
+class TestRequestPacer:
+    """Tests for client-side pacing of AI requests"""
+
+    def test_spaces_requests_evenly(self):
+        """Test that back-to-back requests wait for successive slots"""
+        from agent.utils import RequestPacer
+
+        pacer = RequestPacer(requests_per_minute=30)
+        with patch('agent.utils.time.monotonic', return_value=100.0), \
+             patch('agent.utils.time.sleep') as sleep:
+            pacer.wait()
+            pacer.wait()
+            pacer.wait()
+
+        assert [call.args[0] for call in sleep.call_args_list] == [2.0, 4.0]
+
+    def test_unset_limit_does_not_wait(self, monkeypatch):
+        """Test that requests are not paced without BIZY_AI_REQUESTS_PER_MINUTE"""
+        from agent.utils import pace_ai_request
+
+        monkeypatch.delenv('BIZY_AI_REQUESTS_PER_MINUTE', raising=False)
+        with patch('agent.utils.time.sleep') as sleep:
+            pace_ai_request()
+
+        sleep.assert_not_called()
+
+    @pytest.mark.parametrize("setting", ["0", "-5", "fast", "nan"])
+    def test_zero_negative_or_invalid_limit_turns_pacing_off(self, setting, monkeypatch):
+        """Test that unusable limits disable pacing instead of failing every AI call"""
+        from agent.utils import pace_ai_request
+
+        monkeypatch.setenv('BIZY_AI_REQUESTS_PER_MINUTE', setting)
+        with patch('agent.utils.time.sleep') as sleep:
+            pace_ai_request()
+            pace_ai_request()
+
+        sleep.assert_not_called()
+
+
+class TestLiveMarkdownPanel:
+    """Tests for the streamed markdown panel"""
+
+    def test_tall_panel_printed_once_after_streaming(self):
+        """Test that a panel taller than the terminal is cropped while live and printed whole at the end"""
+        import io
+        from rich.console import Console
+        from agent.core import LiveMarkdownPanel
+
+        output = io.StringIO()
+        terminal = Console(file=output, force_terminal=True, width=60, height=8)
+        with LiveMarkdownPanel("Review", console=terminal) as panel:
+            for i in range(30):
+                panel.append(f"- line {i}\n")
+            panel._live.refresh()
+
+        text = output.getvalue()
+        assert text.count("line 29") == 1
+        assert "line 0" in text.split("line 29")[0]
+
+
+class TestResolveGoalId:
+    """Test the goal picker used by `task add`"""
+
+    @pytest.fixture
+    def planner(self):
+        planner = MagicMock()
+        planner.get_active_goals.return_value = [
+            SimpleNamespace(id=1, title="Ship v2", progress_percentage=50.0)
+        ]
+        planner.get_goal.return_value = None
+        return planner
+
+    @pytest.mark.parametrize("choice, expected", [("1", 1), ("", None), ("abc", None), ("99", None)])
+    def test_choice(self, planner, choice, expected):
+        """Test picking a listed goal, skipping, and rejecting bad or unknown IDs"""
+        from agent.cli_task import _resolve_goal_id
+
+        with patch('agent.cli_task.Prompt.ask', return_value=choice):
+            assert _resolve_goal_id(planner) == expected
+
+    def test_new_goal(self, planner):
+        """Test creating a goal from the picker"""
+        from agent.cli_task import _resolve_goal_id
+
+        planner.create_goal.return_value = SimpleNamespace(id=7, title="Fresh goal")
+        with patch('agent.cli_task.Prompt.ask', side_effect=["new", "Fresh goal", "weekly"]):
+            assert _resolve_goal_id(planner) == 7
+
+        planner.create_goal.assert_called_once_with(title="Fresh goal", horizon="weekly")
+
+
+class TestCalendarExport:
+    """Tests for bizy calendar export"""
+
+    def test_no_tasks_message_stays_off_stdout_stream(self):
+        """Test that exporting nothing to stdout reports it on stderr only"""
+        with patch('agent.cli_calendar.TaskManager') as task_manager:
+            task_manager.return_value.session.query.return_value.filter.return_value.all.return_value = []
+            result = CliRunner().invoke(cli, ['calendar', 'export', '--output', '-'])
+
+        assert result.exit_code == 0
+        assert result.stdout == ""
+        assert "No pending tasks to export" in result.stderr
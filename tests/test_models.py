@@ -5,7 +5,7 @@ Testing Task, Goal, and BusinessPlan models
 
 import pytest
 from datetime import datetime, timedelta
-from agent.models import Task, Goal, BusinessPlan
+from agent.models import Task, Goal, BusinessPlan, AIResponseCache
 
 
 class TestTaskModel:
@@ -135,3 +135,89 @@ class TestBusinessPlanModel:
         active_plans = test_session.query(BusinessPlan).filter_by(is_active=True).all()
         # We're testing that we can query active plans
         assert len(active_plans) >= 1
+
+
+class TestDatabaseSetup:
+    """Test engine configuration"""
+
+    def test_file_engine_uses_wal(self, tmp_path):
+        """Test that on-disk databases are opened with the tuned PRAGMAs"""
+        from sqlalchemy import text
+        from agent.models import get_engine
+
+        engine = get_engine(str(tmp_path / "tasks.db"))
+        with engine.connect() as conn:
+            assert conn.execute(text("PRAGMA journal_mode")).scalar() == "wal"
+            assert conn.execute(text("PRAGMA synchronous")).scalar() == 1  # NORMAL
+            assert conn.execute(text("PRAGMA temp_store")).scalar() == 2  # MEMORY
+            assert conn.execute(text("PRAGMA busy_timeout")).scalar() == 5000
+        engine.dispose()
+
+    def test_file_engine_is_shared(self, tmp_path):
+        """Test that sessions for the same database share one engine"""
+        from agent.models import get_engine, get_session
+
+        db_path = str(tmp_path / "tasks.db")
+        engine = get_engine(db_path)
+
+        assert get_engine(db_path) is engine
+        session = get_session(engine)
+        assert session.get_bind() is engine
+        session.close()
+        engine.dispose()
+
+    def test_migrate_add_task_indexes(self, tmp_path):
+        """Test that the index migration adds the task query indexes to an existing database"""
+        from sqlalchemy import inspect
+        from agent.models import get_engine, migrate_add_task_indexes
+
+        engine = get_engine(str(tmp_path / "tasks.db"))
+        Task.__table__.create(engine)
+        with engine.begin() as conn:
+            conn.exec_driver_sql("DROP INDEX ix_task_goal_status")
+            conn.exec_driver_sql("DROP INDEX ix_task_status_due")
+            conn.exec_driver_sql("DROP INDEX ix_task_completed_at")
+            conn.exec_driver_sql("DROP INDEX ix_task_status_completed")
+            conn.exec_driver_sql("DROP INDEX ix_task_due_date")
+
+        migrate_add_task_indexes(engine)
+        migrate_add_task_indexes(engine)  # Safe to run twice
+
+        index_names = {index['name'] for index in inspect(engine).get_indexes('tasks')}
+        assert {
+            'ix_task_goal_status', 'ix_task_status_due',
+            'ix_task_completed_at', 'ix_task_status_completed', 'ix_task_due_date'
+        } <= index_names
+        engine.dispose()
+
+    def test_migrate_add_ai_response_cache(self, tmp_path):
+        """Test that the cache migration adds the ai_response_cache table to an existing database"""
+        from sqlalchemy import inspect
+        from agent.models import get_engine, migrate_add_ai_response_cache
+
+        engine = get_engine(str(tmp_path / "tasks.db"))
+        Task.__table__.create(engine)
+
+        migrate_add_ai_response_cache(engine)
+        migrate_add_ai_response_cache(engine)  # Safe to run twice
+
+        assert 'ai_response_cache' in inspect(engine).get_table_names()
+        engine.dispose()
+
+    def test_response_cache_checks_table_once_per_engine(self, tmp_path):
+        """Test that cache reads only check for the table the first time an engine is used"""
+        from unittest.mock import patch
+        from agent.llm_cache import cached_response, store_response
+        from agent.models import get_engine, get_session
+
+        engine = get_engine(str(tmp_path / "tasks.db"))
+        session = get_session(engine)
+
+        with patch.object(AIResponseCache.__table__, 'create', wraps=AIResponseCache.__table__.create) as create:
+            assert cached_response(session, 'abc') is None
+            store_response(session, 'abc', 'reply')
+            assert cached_response(session, 'abc') == 'reply'
+
+        assert create.call_count == 1
+        session.close()
+        engine.dispose()
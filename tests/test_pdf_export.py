@@ -238,3 +238,56 @@ class TestPDFExporter:
         assert pdf_path2.exists()
         # Should be different files or same file is overwritten
         assert pdf_path1.stat().st_mtime <= pdf_path2.stat().st_mtime
+
+    def test_export_batch_writes_reports_in_worker_processes(self, tmp_path, monkeypatch):
+        """Test that batch export generates each report from a file database in worker processes"""
+        from agent.models import init_database, reset_engines
+
+        monkeypatch.setenv('BIZY_ENV', 'development')
+        monkeypatch.setenv('BUSINESS_AGENT_DB', str(tmp_path / "bizy.db"))
+        init_database()
+        try:
+            paths = PDFExporter.export_batch([
+                ('export_weekly_report', {'filename': "weekly.pdf"}),
+                ('export_velocity_report', {'days': 14, 'filename': "velocity.pdf"}),
+            ], output_dir=tmp_path / "reports", max_workers=2)
+        finally:
+            reset_engines()
+
+        assert [path.name for path in paths] == ["weekly.pdf", "velocity.pdf"]
+        assert all(path.exists() and path.stat().st_size > 0 for path in paths)
+
+    def test_export_batch_rejects_unknown_reports(self):
+        """Test that batch export only accepts report methods that can run in a worker"""
+        with pytest.raises(ValueError):
+            PDFExporter.export_batch([('export_task_list', {'tasks': []})])
+
+    def test_task_table_split_into_chunks(self, pdf_exporter):
+        """Test that long task lists render as fixed-size sub-tables"""
+        from types import SimpleNamespace
+        from reportlab.platypus import Table
+        from agent.pdf_export import TASK_TABLE_CHUNK
+
+        rows = [
+            SimpleNamespace(status='pending', priority=2, title=f"Task {i}", category=None)
+            for i in range(TASK_TABLE_CHUNK * 2 + 1)
+        ]
+        story = []
+        pdf_exporter._add_task_table(story, rows, max_rows=None)
+
+        tables = [flowable for flowable in story if isinstance(flowable, Table)]
+        assert len(tables) == 3
+        assert all(table._nrows <= TASK_TABLE_CHUNK + 1 for table in tables)
+
+    def test_goal_reports_escape_markup_in_titles(self, pdf_exporter, test_session):
+        """Test that goal text containing markup characters still renders"""
+        planner = BusinessPlanner()
+        planner.session = test_session
+        goal = planner.create_goal(
+            title="Ship <v2 & docs",
+            description="R&D for <beta> users",
+            horizon="monthly"
+        )
+
+        assert pdf_exporter.export_goal_report(goal.id).exists()
+        assert pdf_exporter.export_all_goals_report().exists()
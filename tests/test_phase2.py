@@ -74,6 +74,18 @@ class TestICalIntegration:
         events = [component for component in cal.walk() if component.name == "VEVENT"]
         assert len(events) == len(sample_tasks)
 
+    def test_write_tasks_to_stream(self, ical, sample_tasks):
+        """Test that write_tasks streams the same calendar as export_tasks"""
+        import io
+
+        buffer = io.BytesIO()
+        ical.write_tasks(sample_tasks, buffer)
+
+        cal = Calendar.from_ical(buffer.getvalue())
+        events = [component for component in cal.walk() if component.name == "VEVENT"]
+        assert len(events) == len(sample_tasks)
+        assert buffer.getvalue() == ical.export_tasks(sample_tasks).read_bytes()
+
     def test_export_task_with_due_date(self, ical, sample_tasks):
         """Test that tasks with due dates are properly formatted"""
         task_with_due_date = [t for t in sample_tasks if t.due_date][0]
@@ -114,6 +126,27 @@ class TestICalIntegration:
         high_priority_event = [e for e in events if str(e.get('summary')) == "Task with due date"][0]
         assert int(high_priority_event.get('priority')) == 1
 
+    def test_export_escapes_and_folds_long_text(self, ical, test_session):
+        """Test that exported text round-trips and lines stay within 75 octets"""
+        task_mgr = TaskManager()
+        task_mgr.session = test_session
+
+        title = "Ship v2; review, merge \\ deploy ✓ " + "é" * 80
+        notes = "First line\nSecond line, with; separators"
+        task = task_mgr.create_task(title=title, category="ops,infra")
+        task.notes = notes
+        test_session.commit()
+
+        data = ical.export_tasks([task]).read_bytes()
+
+        assert all(len(line) <= 75 for line in data.split(b"\r\n"))
+        cal = Calendar.from_ical(data)
+        event = [component for component in cal.walk() if component.name == "VEVENT"][0]
+        assert str(event.get('summary')) == title
+        assert str(event.get('description')) == notes
+        assert str(event.get('uid')) == f"bizy-task-{task.id}@bizy-ai"
+        assert event.get('dtstart').dt == task.created_at.replace(microsecond=0)
+
     def test_create_single_task_event(self, ical, sample_tasks):
         """Test creating a single task event"""
         task = sample_tasks[0]
@@ -151,6 +184,18 @@ class TestICalIntegration:
         assert all('start' in event for event in events)
 
 
+    def test_get_events_date_range(self, ical, sample_tasks):
+        """Test that get_events only returns events starting within the range"""
+        calendar_path = ical.export_tasks(sample_tasks)
+        due = sample_tasks[0].due_date.date()
+
+        events = ical.get_events(calendar_path, start=due, end=due)
+
+        assert [event['summary'] for event in events] == ["Task with due date"]
+        assert ical.get_events(calendar_path, start=due + timedelta(days=1)) == []
+        assert len(ical.get_events(calendar_path, end=due)) == len(sample_tasks)
+
+
 class TestVelocityPredictor:
     """Tests for velocity-based predictions"""
 
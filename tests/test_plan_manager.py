@@ -71,3 +71,21 @@ class TestPlanManagerStats:
         assert stats['tasks_created_this_week'] == 0
         assert stats['completion_rate'] == 0
         assert len(stats['completed_tasks']) == 0
+
+    def test_open_task_counts_match_task_lists(self, test_session):
+        """Test that the plan review counts agree with the today/overdue task lists"""
+        from datetime import datetime, timedelta
+
+        task_mgr = TaskManager(project_filter=False)
+        task_mgr.session = test_session
+
+        task_mgr.create_task(title="Undated")
+        task_mgr.create_task(title="Overdue", due_date=datetime.now() - timedelta(days=2))
+        task_mgr.create_task(title="Later", due_date=datetime.now() + timedelta(days=5))
+        done = task_mgr.create_task(title="Done", due_date=datetime.now() - timedelta(days=1))
+        task_mgr.complete_task(done.id)
+
+        counts = task_mgr.get_open_task_counts()
+
+        assert counts['today'] == len(task_mgr.get_tasks_for_today()) == 2
+        assert counts['overdue'] == len(task_mgr.get_overdue_tasks()) == 1
@@ -13,7 +13,7 @@ from agent.models import Goal, BusinessPlan
 class TestBusinessPlanner:
     """Test BusinessPlanner functionality"""
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
     def test_calculate_goal_progress_no_tasks(self, mock_anthropic, test_session, sample_goal):
         """Test progress calculation with no tasks"""
         planner = BusinessPlanner()
@@ -24,7 +24,7 @@ class TestBusinessPlanner:
 
         assert progress == 0
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
     def test_calculate_goal_progress_with_tasks(self, mock_anthropic, test_session, sample_goal):
         """Test progress calculation with completed and pending tasks"""
         planner = BusinessPlanner()
@@ -47,7 +47,7 @@ class TestBusinessPlanner:
 
         assert progress == 50.0  # 1 out of 2 tasks completed
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
     def test_calculate_goal_progress_all_completed(self, mock_anthropic, test_session, sample_goal):
         """Test progress with all tasks completed"""
         planner = BusinessPlanner()
@@ -70,7 +70,62 @@ class TestBusinessPlanner:
         test_session.refresh(sample_goal)
         assert sample_goal.status == "completed"
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
+    def test_calculate_goal_progress_bulk(self, mock_anthropic, test_session, sample_goal):
+        """Test batched progress calculation across several goals"""
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+
+        done_goal = planner.create_goal(title="Done Goal", description="All done", horizon="weekly")
+        empty_goal = planner.create_goal(title="Empty Goal", description="No tasks", horizon="weekly")
+
+        planner.task_mgr.create_task(title="Pending", parent_goal_id=sample_goal.id)
+        completed_task = planner.task_mgr.create_task(title="Completed", parent_goal_id=sample_goal.id)
+        planner.task_mgr.complete_task(completed_task.id)
+
+        done_task = planner.task_mgr.create_task(title="Done", parent_goal_id=done_goal.id)
+        planner.task_mgr.complete_task(done_task.id)
+
+        progress = planner.calculate_goal_progress_bulk(
+            [sample_goal.id, done_goal.id, empty_goal.id]
+        )
+
+        assert progress == {sample_goal.id: 50.0, done_goal.id: 100.0, empty_goal.id: 0}
+
+        test_session.refresh(sample_goal)
+        test_session.refresh(done_goal)
+        test_session.refresh(empty_goal)
+        assert sample_goal.progress_percentage == 50.0
+        assert sample_goal.status == "active"
+        assert done_goal.status == "completed"
+        assert empty_goal.status == "active"
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_shares_session_with_task_manager(self, mock_anthropic, test_session):
+        """Test that the planner and its TaskManager use the same session"""
+        planner = BusinessPlanner(session=test_session)
+
+        assert planner.session is test_session
+        assert planner.task_mgr.session is test_session
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_get_goal_reuses_loaded_goals(self, mock_anthropic, test_session, test_engine, sample_goal):
+        """Test that looking up an already loaded goal does not hit the database again"""
+        from sqlalchemy import event
+
+        planner = BusinessPlanner(project_filter=False)
+        planner.session = test_session
+        goals = planner.get_active_goals()
+
+        statements = []
+        event.listen(test_engine, 'before_cursor_execute', lambda *args: statements.append(args[2]))
+
+        assert planner.get_goal(sample_goal.id) is goals[0]
+        assert planner.get_goal(999999) is None
+        assert len(statements) == 1  # Only the unknown ID needed a query
+
+    @patch('agent.planner.get_anthropic_client')
     def test_create_goal(self, mock_anthropic, test_session):
         """Test creating a new goal"""
         planner = BusinessPlanner()
@@ -88,7 +143,7 @@ class TestBusinessPlanner:
         assert goal.horizon == "monthly"
         assert goal.status == "active"
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
     def test_get_active_goals(self, mock_anthropic, test_session, sample_goal):
         """Test retrieving active goals"""
         planner = BusinessPlanner()
@@ -100,8 +155,9 @@ class TestBusinessPlanner:
         active_goals = planner.get_active_goals()
 
         assert len(active_goals) >= 2
+        assert planner.get_active_goals(limit=1) == active_goals[:1]
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
     def test_break_down_goal(self, mock_anthropic, test_session, sample_goal):
         """Test AI-powered goal breakdown (mocked)"""
         # Mock the AI response
@@ -143,7 +199,157 @@ class TestBusinessPlanner:
         assert tasks[1].title == "Task 2"
         assert all(task.parent_goal_id == sample_goal.id for task in tasks)
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
+    def test_break_down_goal_maps_dependencies(self, mock_anthropic, test_session, sample_goal):
+        """Test breakdown persists tasks in one batch and resolves dependency indices to IDs"""
+        mock_client = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = '''[
+            {"title": "Design", "description": "Design it", "dependencies": []},
+            {"title": "Build", "description": "Build it", "dependencies": [0]},
+            {"title": "Ship", "description": "Ship it", "dependencies": [0, 1, 7]}
+        ]'''
+        mock_client.messages.create.return_value = MagicMock(content=[mock_content])
+
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+        planner.client = mock_client
+
+        tasks = planner.break_down_goal(sample_goal.id)
+
+        assert [t.title for t in tasks] == ["Design", "Build", "Ship"]
+        assert all(t.id is not None for t in tasks)
+        assert tasks[0].dependencies == []
+        assert tasks[1].dependencies == [tasks[0].id]
+        assert tasks[2].dependencies == [tasks[0].id, tasks[1].id]
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_break_down_goal_sends_static_instructions_as_cached_system_prompt(self, mock_anthropic, test_session, sample_goal):
+        """Test that the fixed instructions lead the request and the goal details follow"""
+        from agent.planner import TASK_PLANNING_SYSTEM
+
+        mock_client = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = '[]'
+        mock_client.messages.create.return_value = MagicMock(content=[mock_content])
+
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+        planner.client = mock_client
+
+        planner.break_down_goal(sample_goal.id)
+
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs['system'] is TASK_PLANNING_SYSTEM
+        assert kwargs['system'][-1]['cache_control'] == {"type": "ephemeral"}
+        assert sample_goal.title in kwargs['messages'][0]['content']
+        assert sample_goal.title not in kwargs['system'][0]['text']
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_suggest_next_tasks_creates_tasks_in_one_batch(self, mock_anthropic, test_session, sample_goal):
+        """Test suggested tasks are linked to the goal and counted on it"""
+        mock_client = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = '[{"title": "Next", "description": "Do next"}, {"title": "Later", "description": "Then"}]'
+        mock_client.messages.create.return_value = MagicMock(content=[mock_content])
+
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+        planner.client = mock_client
+
+        tasks = planner.suggest_next_tasks(sample_goal.id, num_tasks=2)
+
+        assert [t.title for t in tasks] == ["Next", "Later"]
+        assert all(t.parent_goal_id == sample_goal.id for t in tasks)
+        test_session.refresh(sample_goal)
+        assert sample_goal.total_tasks == 2
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_break_down_goals_handles_several_goals(self, mock_anthropic, test_session, sample_goal):
+        """Test batch breakdown creates each goal's tasks and reports missing goals as None"""
+        mock_client = MagicMock()
+
+        def reply(**kwargs):
+            title = "Launch" if "Launch site" in kwargs['messages'][0]['content'] else "Other"
+            return MagicMock(content=[MagicMock(text=f'[{{"title": "{title}", "description": "x"}}]')])
+        mock_client.messages.create.side_effect = reply
+
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+        planner.client = mock_client
+        second = planner.create_goal(title="Launch site", description="Go live", horizon="monthly")
+
+        results = planner.break_down_goals([sample_goal.id, second.id, 999999])
+
+        assert [t.title for t in results[second.id]] == ["Launch"]
+        assert [t.title for t in results[sample_goal.id]] == ["Other"]
+        assert results[999999] is None
+        assert mock_client.messages.create.call_count == 2
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_break_down_goals_does_not_store_malformed_reply(self, mock_anthropic, test_session, sample_goal):
+        """Test that the batch path only caches replies that parse"""
+        mock_client = MagicMock()
+        mock_client.messages.create.side_effect = [
+            MagicMock(content=[MagicMock(text='not json')]),
+            MagicMock(content=[MagicMock(text='[{"title": "Research", "description": "Look"}]')]),
+        ]
+
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+        planner.client = mock_client
+
+        assert planner.break_down_goals([sample_goal.id]) == {sample_goal.id: None}
+        results = planner.break_down_goals([sample_goal.id])
+        assert [t.title for t in results[sample_goal.id]] == ["Research"]
+        assert mock_client.messages.create.call_count == 2
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_break_down_goal_reuses_stored_response(self, mock_anthropic, test_session, sample_goal):
+        """Test that an identical breakdown request is answered from the response cache"""
+        mock_client = MagicMock()
+        mock_content = MagicMock()
+        mock_content.text = '[{"title": "Research", "description": "Look around"}]'
+        mock_client.messages.create.return_value = MagicMock(content=[mock_content])
+
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+        planner.client = mock_client
+
+        first = planner.break_down_goal(sample_goal.id)
+        second = planner.break_down_goal(sample_goal.id)
+        assert [t.title for t in second] == [t.title for t in first]
+        assert mock_client.messages.create.call_count == 1
+
+        planner.break_down_goal(sample_goal.id, use_cache=False)
+        assert mock_client.messages.create.call_count == 2
+
+    @patch('agent.planner.get_anthropic_client')
+    def test_break_down_goal_does_not_store_malformed_reply(self, mock_anthropic, test_session, sample_goal):
+        """Test that a reply that fails to parse is not replayed from the response cache"""
+        mock_client = MagicMock()
+        mock_client.messages.create.side_effect = [
+            MagicMock(content=[MagicMock(text='[{"title": "Research", "descr')]),
+            MagicMock(content=[MagicMock(text='[{"title": "Research", "description": "Look"}]')]),
+        ]
+
+        planner = BusinessPlanner()
+        planner.session = test_session
+        planner.task_mgr.session = test_session
+        planner.client = mock_client
+
+        assert planner.break_down_goal(sample_goal.id) is None
+        tasks = planner.break_down_goal(sample_goal.id)
+        assert [t.title for t in tasks] == ["Research"]
+        assert mock_client.messages.create.call_count == 2
+
+    @patch('agent.planner.get_anthropic_client')
     def test_create_business_plan(self, mock_anthropic, test_session):
         """Test creating a business plan"""
         planner = BusinessPlanner()
@@ -161,7 +367,22 @@ class TestBusinessPlanner:
         assert plan.vision == "Test Vision"
         assert plan.is_active is True
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
+    def test_create_business_plan_deactivates_previous(self, mock_anthropic, test_session, sample_business_plan):
+        """Test that a new plan becomes the only active one"""
+        planner = BusinessPlanner()
+        planner.session = test_session
+
+        plan = planner.create_business_plan(
+            vision="V2", mission="M2", value_proposition="P2",
+            target_market="T2", revenue_model="R2", version="2.0"
+        )
+
+        assert sample_business_plan.is_active is False
+        assert planner.get_active_business_plan().id == plan.id
+        assert test_session.query(BusinessPlan).filter_by(is_active=True).count() == 1
+
+    @patch('agent.planner.get_anthropic_client')
     def test_get_active_business_plan(self, mock_anthropic, test_session, sample_business_plan):
         """Test retrieving active business plan"""
         planner = BusinessPlanner()
@@ -173,7 +394,7 @@ class TestBusinessPlanner:
         assert active_plan.is_active is True
         assert active_plan.id == sample_business_plan.id
 
-    @patch('agent.planner.anthropic.Anthropic')
+    @patch('agent.planner.get_anthropic_client')
     def test_update_goal_progress(self, mock_anthropic, test_session, sample_goal):
         """Test manually updating goal progress"""
         planner = BusinessPlanner()
@@ -183,3 +404,30 @@ class TestBusinessPlanner:
 
         assert updated_goal.progress_percentage == 75.0
         assert updated_goal.updated_at is not None
+
+
+@pytest.mark.parametrize("reply", [
+    '[{"title": "A"}]',
+    '```json\n[{"title": "A"}]\n```',
+    '```\n[{"title": "A"}]\n```\nLet me know if you need more.',
+    '```json\n[{"title": "A"}]',
+])
+def test_parse_json_reply_strips_code_fences(reply):
+    """Test that bare and fenced JSON replies parse the same"""
+    from agent.planner import parse_json_reply
+
+    assert parse_json_reply(reply) == [{"title": "A"}]
+
+
+@pytest.mark.parametrize("reply", [
+    '{"title": "A", "description": "B"}',
+    '[{"title": "A", "description": "B"}, {"title": "C"}]',
+    '[{"title": 1, "description": "B"}]',
+    '["A"]',
+])
+def test_parse_json_items_rejects_malformed_items(reply):
+    """Test that replies without a list of titled, described items are rejected"""
+    from agent.planner import parse_json_items
+
+    with pytest.raises(ValueError):
+        parse_json_items(reply)
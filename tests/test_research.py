@@ -0,0 +1,140 @@
+"""Tests for the research agent"""
+
+import pytest
+from unittest.mock import MagicMock, patch
+from agent.models import ResearchItem
+from agent.research import ResearchAgent
+
+
+class TestResearchAgent:
+    """Tests for ResearchAgent"""
+
+    @pytest.fixture
+    def researcher(self, monkeypatch, test_session):
+        """Create ResearchAgent with a mocked client and test session"""
+        monkeypatch.setenv('ANTHROPIC_API_KEY', 'test-key')
+        with patch('agent.research.get_anthropic_client') as mock_get_client:
+            mock_client = MagicMock()
+            mock_client.messages.create.return_value = MagicMock(
+                content=[MagicMock(text="## Key Findings\n- Demand is growing")]
+            )
+            mock_get_client.return_value = mock_client
+            researcher = ResearchAgent()
+        researcher.session = test_session
+        return researcher
+
+    def test_research_topic_reuses_stored_response(self, researcher):
+        """Test that repeating a research request is answered from the response cache"""
+        first = researcher.research_topic("Pricing", "Grow revenue")
+        second = researcher.research_topic("Pricing", "Grow revenue")
+
+        assert second['findings'] == first['findings']
+        assert researcher.client.messages.create.call_count == 1
+        items = researcher.session.query(ResearchItem).order_by(ResearchItem.id).all()
+        assert [item.raw_data['cache_hit'] for item in items] == [False, True]
+
+        researcher.research_topic("Pricing", "Grow revenue", use_cache=False)
+        assert researcher.client.messages.create.call_count == 2
+
+    def test_research_topics_returns_results_in_order(self, researcher):
+        """Test batch research saves one item per topic and keeps the caller's order"""
+        def reply(**kwargs):
+            topic = kwargs['messages'][0]['content'].split("TOPIC: ")[1].split("\n")[0]
+            return MagicMock(content=[MagicMock(text=f"Findings for {topic}")])
+        researcher.client.messages.create.side_effect = reply
+
+        researcher.research_topic("Pricing", "Grow revenue")
+        results = researcher.research_topics(["Churn", "Pricing", "Onboarding"], "Grow revenue")
+
+        assert [r['findings'] for r in results] == [
+            "Findings for Churn", "Findings for Pricing", "Findings for Onboarding"
+        ]
+        assert researcher.client.messages.create.call_count == 3
+        assert researcher.session.query(ResearchItem).count() == 4
+
+    @patch('agent.research.time.sleep')
+    def test_batch_research_polls_until_batch_ends(self, mock_sleep, researcher):
+        """Test batch research submits uncached topics once and saves every result"""
+        batches = researcher.client.messages.batches
+        batches.create.return_value = MagicMock(id="batch_1", processing_status="in_progress")
+        batches.retrieve.side_effect = [
+            MagicMock(id="batch_1", processing_status="in_progress"),
+            MagicMock(id="batch_1", processing_status="ended"),
+        ]
+        succeeded = MagicMock(custom_id="1")
+        succeeded.result.type = "succeeded"
+        succeeded.result.message.content = [MagicMock(text="Churn findings")]
+        expired = MagicMock(custom_id="2")
+        expired.result.type = "expired"
+        batches.results.return_value = [succeeded, expired]
+
+        researcher.research_topic("Pricing", "Grow revenue")
+        with patch.object(researcher.session, 'commit', wraps=researcher.session.commit) as commit:
+            results = researcher.batch_research([
+                ("Pricing", "Grow revenue"), ("Churn", "Keep users"), ("Ads", "Grow revenue")
+            ])
+
+        commit.assert_called_once()
+        assert len(batches.create.call_args.kwargs['requests']) == 2
+        assert batches.retrieve.call_count == 2
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10]
+        assert results[0]['findings'] == "## Key Findings\n- Demand is growing"
+        assert results[1]['findings'] == "Churn findings"
+        assert 'error' in results[2]
+        assert researcher.session.query(ResearchItem).count() == 3
+
+    @patch('agent.research.time.sleep')
+    def test_batch_research_gives_up_after_max_wait(self, mock_sleep, researcher):
+        """Test that a batch still running after max_wait is reported with its id"""
+        batches = researcher.client.messages.batches
+        batches.create.return_value = MagicMock(id="batch_1", processing_status="in_progress")
+        batches.retrieve.return_value = MagicMock(id="batch_1", processing_status="in_progress")
+
+        results = researcher.batch_research([("Churn", "Keep users")], max_wait=30)
+
+        assert [call.args[0] for call in mock_sleep.call_args_list] == [5, 10, 20]
+        assert "batch_1" in results[0]['error']
+        assert researcher.last_batch_id == "batch_1"
+        batches.results.assert_not_called()
+        assert researcher.session.query(ResearchItem).count() == 0
+
+    def test_research_topic_streams_to_callback(self, researcher):
+        """Test that on_text receives streamed chunks, then the cached reply on a repeat"""
+        stream = researcher.client.messages.stream.return_value.__enter__.return_value
+        stream.text_stream = iter(["## Key ", "Findings"])
+
+        chunks = []
+        result = researcher.research_topic("Pricing", "Grow revenue", on_text=chunks.append)
+        assert chunks == ["## Key ", "Findings"]
+        assert result['findings'] == "## Key Findings"
+        researcher.client.messages.create.assert_not_called()
+
+        repeat = []
+        researcher.research_topic("Pricing", "Grow revenue", on_text=repeat.append)
+        assert repeat == ["## Key Findings"]
+
+
+def test_research_topic_command_prints_long_findings_once():
+    """Test that findings taller than the terminal end up in the output exactly once"""
+    import io
+    from click.testing import CliRunner
+    from rich.console import Console
+    from agent.cli import cli
+
+    findings = "".join(f"- finding {i}\n" for i in range(60))
+
+    def research_topic(topic, business_goal, depth, use_cache, on_text):
+        for line in findings.splitlines(keepends=True):
+            on_text(line)
+            on_text.__self__._live.refresh()  # Redraw as a fast stream would
+        return {'research_id': 1, 'topic': topic, 'findings': findings}
+
+    output = io.StringIO()
+    terminal = Console(file=output, force_terminal=True, width=60, height=12)
+    with patch('agent.cli_research.ResearchAgent') as agent_cls, \
+         patch('agent.cli_research.console', terminal):
+        agent_cls.return_value.research_topic.side_effect = research_topic
+        result = CliRunner().invoke(cli, ['research', 'topic', 'Pricing'])
+
+    assert result.exit_code == 0
+    assert output.getvalue().count("finding 59") == 1
@@ -41,6 +41,23 @@ class TestTaskManager:
 
         assert task.parent_goal_id == sample_goal.id
 
+    def test_create_tasks_bulk(self, test_session, sample_goal):
+        """Test creating several tasks in one transaction keeps goal counters in sync"""
+        task_mgr = TaskManager()
+        task_mgr.session = test_session
+
+        tasks = task_mgr.create_tasks_bulk([
+            {'title': "First", 'priority': 1, 'parent_goal_id': sample_goal.id},
+            {'title': "Second", 'parent_goal_id': sample_goal.id},
+            {'title': "Unlinked", 'category': "ops"},
+        ])
+
+        assert [t.title for t in tasks] == ["First", "Second", "Unlinked"]
+        assert all(t.id is not None for t in tasks)
+        assert tasks[2].dependencies == [] and tasks[2].tags == []
+        test_session.refresh(sample_goal)
+        assert (sample_goal.total_tasks, sample_goal.completed_tasks) == (2, 0)
+
     def test_get_task(self, test_session, sample_task):
         """Test retrieving a task by ID"""
         task_mgr = TaskManager()
@@ -62,6 +79,110 @@ class TestTaskManager:
         assert completed_task.status == "completed"
         assert completed_task.completed_at is not None
 
+    def test_complete_tasks(self, test_session, sample_goal):
+        """Test completing several tasks in one transaction counts each goal task once"""
+        task_mgr = TaskManager()
+        task_mgr.session = test_session
+        first, second, done = task_mgr.create_tasks_bulk([
+            {'title': "First", 'parent_goal_id': sample_goal.id},
+            {'title': "Second", 'parent_goal_id': sample_goal.id},
+            {'title': "Done", 'parent_goal_id': sample_goal.id},
+        ])
+        task_mgr.complete_task(done.id)
+
+        completed = task_mgr.complete_tasks([second.id, 999999, done.id, second.id])
+
+        assert [t.title for t in completed] == ["Second", "Done"]
+        assert first.status == "pending"
+        test_session.refresh(sample_goal)
+        assert (sample_goal.total_tasks, sample_goal.completed_tasks) == (3, 2)
+
+    def test_complete_task_updates_goal_counters(self, test_session, sample_task_with_goal, sample_goal):
+        """Test completing a goal-linked task advances the goal's cached progress"""
+        task_mgr = TaskManager()
+        task_mgr.session = test_session
+
+        # sample_goal starts with unseeded (NULL) counters
+        task_mgr.create_task(title="Second Goal Task", parent_goal_id=sample_goal.id)
+        test_session.refresh(sample_goal)
+        assert (sample_goal.total_tasks, sample_goal.completed_tasks) == (2, 0)
+
+        task_mgr.complete_task(sample_task_with_goal.id)
+        test_session.refresh(sample_goal)
+        assert sample_goal.completed_tasks == 1
+        assert sample_goal.progress_percentage == 50.0
+        assert sample_goal.status == "active"
+
+        # Completing twice must not double count
+        task_mgr.complete_task(sample_task_with_goal.id)
+        test_session.refresh(sample_goal)
+        assert sample_goal.completed_tasks == 1
+
+    def test_update_and_block_task_keep_goal_counters_in_sync(self, test_session, sample_goal):
+        """Test reopening, moving and blocking tasks adjust their goals' cached counters"""
+        from agent.models import Goal
+
+        task_mgr = TaskManager()
+        task_mgr.session = test_session
+        other_goal = Goal(title="Other", horizon="monthly", status="active")
+        test_session.add(other_goal)
+        test_session.commit()
+
+        first = task_mgr.create_task(title="First", parent_goal_id=sample_goal.id)
+        second = task_mgr.create_task(title="Second", parent_goal_id=sample_goal.id)
+        task_mgr.complete_task(first.id)
+
+        # Reopened and completed again counts once, not twice
+        task_mgr.update_task(first.id, status='pending')
+        task_mgr.complete_task(first.id)
+        test_session.refresh(sample_goal)
+        assert (sample_goal.total_tasks, sample_goal.completed_tasks) == (2, 1)
+        assert sample_goal.progress_percentage == 50
+
+        task_mgr.update_task(first.id, parent_goal_id=other_goal.id)
+        task_mgr.block_task(second.id)
+        task_mgr.complete_task(second.id)
+        task_mgr.block_task(second.id, reason="Waiting")
+        test_session.refresh(sample_goal)
+        test_session.refresh(other_goal)
+        assert (sample_goal.total_tasks, sample_goal.completed_tasks) == (1, 0)
+        assert (other_goal.total_tasks, other_goal.completed_tasks) == (1, 1)
+
+    def test_goal_counters_seeded_from_all_projects(self, test_session, sample_goal):
+        """Test the first counter sync counts every project's tasks, so later deltas agree"""
+        task_mgr = TaskManager(project_filter=False)
+        task_mgr.session = test_session
+        tasks = task_mgr.create_tasks_bulk(
+            [{'title': f"A{i}", 'parent_goal_id': sample_goal.id, 'project_name': "repo-a"} for i in range(2)]
+            + [{'title': f"B{i}", 'parent_goal_id': sample_goal.id, 'project_name': "repo-b"} for i in range(3)]
+        )
+        sample_goal.total_tasks = sample_goal.completed_tasks = None
+        test_session.commit()
+
+        for project_name, task_ids in (("repo-a", [tasks[0].id]), ("repo-b", [t.id for t in tasks[2:]])):
+            scoped = TaskManager()
+            scoped.session = test_session
+            scoped.context = {'project_name': project_name, 'repository_path': None}
+            for task_id in task_ids:
+                scoped.complete_task(task_id)
+
+        test_session.refresh(sample_goal)
+        assert (sample_goal.total_tasks, sample_goal.completed_tasks) == (5, 4)
+        assert sample_goal.progress_percentage == 80.0
+        assert sample_goal.status != 'completed'
+
+    def test_goal_progress_capped_at_100(self, test_session, sample_goal):
+        """Test that counters that overshoot never report more than 100% progress"""
+        from agent.tasks import sync_goal_task_counters
+
+        sample_goal.total_tasks, sample_goal.completed_tasks = 2, 2
+        test_session.commit()
+        sync_goal_task_counters(test_session, sample_goal.id, completed_delta=1)
+        test_session.commit()
+
+        test_session.refresh(sample_goal)
+        assert sample_goal.progress_percentage == 100.0
+
     def test_get_tasks_by_status(self, test_session, multiple_tasks):
         """Test filtering tasks by status"""
         task_mgr = TaskManager()
@@ -84,6 +205,21 @@ class TestTaskManager:
         for task in goal_tasks:
             assert task.parent_goal_id == sample_goal.id
 
+    def test_get_tasks_by_goal_and_status(self, test_session, sample_goal):
+        """Test fetching a goal's task titles by status with a row limit"""
+        task_mgr = TaskManager()
+        task_mgr.session = test_session
+
+        for i in range(3):
+            task_mgr.create_task(title=f"Open {i}", parent_goal_id=sample_goal.id)
+        done = task_mgr.create_task(title="Done", parent_goal_id=sample_goal.id)
+        task_mgr.complete_task(done.id)
+        task_mgr.create_task(title="Other goal")
+
+        open_rows = task_mgr.get_tasks_by_goal_and_status(sample_goal.id, ['pending', 'in_progress'], limit=2)
+        assert [(r.title, r.status) for r in open_rows] == [("Open 0", "pending"), ("Open 1", "pending")]
+        assert [r.title for r in task_mgr.get_tasks_by_goal_and_status(sample_goal.id, ['completed'])] == ["Done"]
+
     def test_get_tasks_for_today(self, test_session):
         """Test getting today's tasks"""
         task_mgr = TaskManager()
@@ -192,6 +328,33 @@ class TestTaskManager:
         assert 'completed_tasks' in stats
         assert len(stats['completed_tasks']) == 3
 
+    def test_get_weekly_task_stats_aggregated_in_sql(self, test_session):
+        """Test weekly stats without task rows match the full computation"""
+        task_mgr = TaskManager()
+        task_mgr.session = test_session
+
+        for i, (category, priority) in enumerate([("dev", 1), ("dev", 1), ("ops", 2), (None, 3)]):
+            task = task_mgr.create_task(
+                title=f"Aggregated Task {i+1}",
+                category=category,
+                priority=priority,
+                estimated_hours=1.5
+            )
+            task_mgr.complete_task(task.id, actual_hours=2)
+        task_mgr.create_task(title="Pending Task")
+
+        full = task_mgr.get_weekly_task_stats()
+        aggregated = task_mgr.get_weekly_task_stats(include_tasks=False)
+
+        assert aggregated['completed_tasks'] == []
+        assert aggregated['categories'] == {'dev': 2, 'ops': 1, 'uncategorized': 1}
+        assert aggregated['priorities'] == {1: 2, 2: 1, 3: 1}
+        assert aggregated['total_estimated_hours'] == 6
+        assert aggregated['total_actual_hours'] == 8
+        for key in ('tasks_completed_this_week', 'tasks_created_this_week', 'completion_rate',
+                    'total_estimated_hours', 'total_actual_hours', 'categories', 'priorities'):
+            assert aggregated[key] == full[key]
+
     def test_get_weekly_task_stats_no_tasks(self, test_session):
         """Test weekly stats with no tasks"""
         task_mgr = TaskManager()
@@ -266,6 +429,13 @@ class TestTaskManager:
         assert summary['tasks_completed'] == 3
         assert summary['completion_rate'] == 0.6  # 3/5
 
+        # Count-only summary matches without loading any rows
+        task_mgr.create_task(title="Unscheduled")
+        task_mgr.complete_task(task_mgr.create_task(title="Done early").id)
+        counts = task_mgr.get_daily_summary(include_tasks=False)
+        assert (counts['tasks_due'], counts['tasks_completed'], counts['completion_rate']) == (5, 4, 0.6)
+        assert counts['completed_tasks'] == counts['pending_tasks'] == []
+
     def test_timestamps_use_local_time(self, test_session):
         """Test that both created_at and completed_at use LOCAL time consistently"""
         from agent.models import Task
@@ -343,3 +513,24 @@ class TestTaskManager:
         # Should include the 11:30 PM task
         assert summary['tasks_completed'] >= 1, \
             "Late night task (11:30 PM) should be included in today's summary"
+
+    def test_dashboard_snapshot_matches_individual_queries(self, test_session, sample_goal):
+        """Test the dashboard snapshot agrees with the per-widget lookups it replaces"""
+        task_mgr = TaskManager(project_filter=False)
+        task_mgr.session = test_session
+
+        task_mgr.create_task(title="Due today", priority=1, due_date=datetime.now(), parent_goal_id=sample_goal.id)
+        done = task_mgr.create_task(title="Done today", parent_goal_id=sample_goal.id)
+        task_mgr.complete_task(done.id)
+        task_mgr.create_task(title="Due next week", due_date=datetime.now() + timedelta(days=7))
+
+        snapshot = task_mgr.get_dashboard_snapshot()
+        weekly_stats = task_mgr.get_weekly_task_stats()
+
+        assert snapshot['tasks_completed_today'] == task_mgr.get_daily_summary()['tasks_completed']
+        assert snapshot['tasks_completed_this_week'] == weekly_stats['tasks_completed_this_week']
+        assert snapshot['completion_rate'] == weekly_stats['completion_rate']
+        assert snapshot['velocity'] == task_mgr.get_task_velocity(days=7)
+        # Only today's task is listed while one is due; future tasks are a fallback
+        assert [t.title for t in snapshot['tasks']] == ["Due today"]
+        assert [g.id for g in snapshot['goals']] == [sample_goal.id]